@@ -3,6 +3,7 @@
 Requirements: 8.1, 8.2, 8.3, 8.5
 """
 
+import os
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Optional
@@ -41,6 +42,9 @@ paper_service: Optional[PaperService] = None
 embedding_service: Optional[EmbeddingService] = None
 llm_service: Optional[LLMService] = None
 
+# 再インデックス対象のPDFキャッシュディレクトリ（lifespanでCACHE_DIRから設定）
+pdf_cache_dir: Path = Path("./cache/pdfs")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -54,7 +58,7 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting Papersmith Agent API...")
 
-    global paper_service, embedding_service, llm_service
+    global paper_service, embedding_service, llm_service, pdf_cache_dir
 
     try:
         # 設定を環境変数から読み込み
@@ -85,11 +89,13 @@ async def lifespan(app: FastAPI):
         await llm_service.load_model()
         logger.info("LLM model loaded")
 
-        # PaperServiceを初期化
-        arxiv_client = ArxivClient()
+        # PaperServiceを初期化（CACHE_DIRでPDF・メタデータのキャッシュ先を変更可能）
+        cache_dir = Path(os.getenv("CACHE_DIR", "./cache"))
+        pdf_cache_dir = cache_dir / "pdfs"
+        arxiv_client = ArxivClient(cache_dir=pdf_cache_dir)
         paper_service = PaperService(
             arxiv_client=arxiv_client,
-            cache_dir=Path("./cache")
+            cache_dir=cache_dir
         )
         logger.info("PaperService initialized")
 
@@ -104,6 +110,10 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down Papersmith Agent API...")
 
+    # PDF取得用のHTTP接続プールを閉じる
+    if paper_service is not None:
+        await paper_service.arxiv_client.aclose()
+
 
 # FastAPIアプリケーション作成
 app = FastAPI(
@@ -481,8 +491,6 @@ async def init_index(request: InitIndexRequest):
             chroma_client.reset()
 
         # キャッシュディレクトリから全PDFを再インデックス化
-        pdf_cache_dir = Path("./cache/pdfs")
-
         if not pdf_cache_dir.exists():
             return InitIndexResponse(
                 status="success",
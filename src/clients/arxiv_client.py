@@ -49,6 +49,10 @@ class ArxivClient:
         self.timeout = timeout
         self.client = arxiv.Client()
 
+        # PDF取得用のHTTPクライアント（接続プールを再利用するため初回取得時に作成）
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
         logger.info(
             f"ArxivClient initialized: cache_dir={cache_dir}, "
             f"max_retries={max_retries}, timeout={timeout}"
@@ -211,13 +215,13 @@ class ArxivClient:
 
             logger.info(f"Downloading PDF: {pdf_url} -> {pdf_path}")
 
-            # httpxで非同期ダウンロード
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(pdf_url, follow_redirects=True)
-                response.raise_for_status()
+            # httpxで非同期ダウンロード（接続プールを共有し、TCP/TLS接続を再利用）
+            client = await self._get_http_client()
+            response = await client.get(pdf_url, follow_redirects=True)
+            response.raise_for_status()
 
-                # ファイルに保存
-                pdf_path.write_bytes(response.content)
+            # ファイルに保存
+            pdf_path.write_bytes(response.content)
 
             logger.info(f"PDF downloaded successfully: {pdf_path} ({len(response.content)} bytes)")
             return pdf_path
@@ -229,6 +233,42 @@ class ArxivClient:
             logger.error(f"Unexpected error downloading PDF: {e}")
             raise ArxivClientError(f"Unexpected error: {e}") from e
 
+    async def _get_http_client(self) -> httpx.AsyncClient:
+        """PDF取得用のHTTPクライアントを取得
+
+        httpxの接続はイベントループに紐づくため、
+        作成時と異なるループから呼ばれた場合は古いクライアントを閉じてから作り直します。
+
+        Returns:
+            httpx.AsyncClient
+        """
+        loop = asyncio.get_running_loop()
+        if self._http_client is not None and self._http_client_loop is not loop:
+            await self.aclose()
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=10, max_connections=20)
+            )
+            self._http_client_loop = loop
+        return self._http_client
+
+    async def aclose(self) -> None:
+        """HTTPクライアントを閉じる
+
+        別のイベントループで作成したクライアントも閉じ、接続プールのソケットを解放します。
+        """
+        client = self._http_client
+        self._http_client = None
+        self._http_client_loop = None
+        if client is None:
+            return
+        try:
+            await client.aclose()
+        except Exception as e:
+            # 作成元ループの終了後はトランスポートのクローズに失敗することがある
+            logger.warning(f"Failed to close HTTP client: {e}")
+
     def _convert_to_metadata(self, result: arxiv.Result) -> PaperMetadata:
         """arxiv.ResultをPaperMetadataに変換
 
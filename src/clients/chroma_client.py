@@ -4,9 +4,10 @@ Requirements: 2.2, 2.3, 2.4
 """
 
 import logging
-from typing import Any, Optional
+from typing import Any, Iterator, Mapping, Optional
 
 import chromadb
+import numpy as np
 from chromadb.config import Settings
 
 from src.models.config import ChromaConfig
@@ -34,6 +35,9 @@ class ChromaClient:
         self.client: Optional[chromadb.ClientAPI] = None
         self.collection: Optional[chromadb.Collection] = None
 
+        # defer_commit時に書き込みを保留しているドキュメント
+        self._pending: dict[str, list] = self._empty_pending()
+
     def initialize(self) -> None:
         """Chromaクライアントとコレクションを初期化
 
@@ -42,17 +46,23 @@ class ChromaClient:
         Requirements: 2.2, 2.3
         """
         try:
-            # 永続化ディレクトリを作成
-            self.config.persist_dir.mkdir(parents=True, exist_ok=True)
+            settings = Settings(
+                anonymized_telemetry=False,
+                allow_reset=True
+            )
 
             # Chromaクライアントを初期化
-            self.client = chromadb.PersistentClient(
-                path=str(self.config.persist_dir),
-                settings=Settings(
-                    anonymized_telemetry=False,
-                    allow_reset=True
+            if self.config.ephemeral:
+                # インメモリ（SQLite・インデックスファイルへの書き込みなし）
+                # プロセス内のEphemeralClientは同じストアを共有するため、分離はコレクション名で行う
+                self.client = chromadb.EphemeralClient(settings=settings)
+            else:
+                # 永続化ディレクトリを作成
+                self.config.persist_dir.mkdir(parents=True, exist_ok=True)
+                self.client = chromadb.PersistentClient(
+                    path=str(self.config.persist_dir),
+                    settings=settings
                 )
-            )
 
             # コレクションを取得または作成
             self.collection = self.client.get_or_create_collection(
@@ -60,9 +70,10 @@ class ChromaClient:
                 metadata={"hnsw:space": self.config.distance_metric}
             )
 
+            location = "(ephemeral)" if self.config.ephemeral else self.config.persist_dir
             logger.info(
                 f"Chroma initialized: collection='{self.config.collection_name}', "
-                f"persist_dir='{self.config.persist_dir}', "
+                f"persist_dir='{location}', "
                 f"documents={self.count()}"
             )
 
@@ -72,7 +83,7 @@ class ChromaClient:
 
     def add(
         self,
-        embedding: list[float],
+        embedding: list[float] | np.ndarray,
         text: str,
         metadata: dict[str, Any],
         chunk_id: Optional[str] = None
@@ -96,44 +107,210 @@ class ChromaClient:
             if chunk_id is None:
                 raise ValueError("chunk_id must be provided either as argument or in metadata")
 
-        # メタデータを文字列化（Chromaは文字列、数値、boolのみサポート）
-        processed_metadata = self._process_metadata(metadata)
+        # 1件のバッチとしてadd_batch()に委譲
+        self.add_batch(
+            embeddings=np.asarray([embedding], dtype=np.float32),
+            texts=[text],
+            metadatas=[metadata],
+            chunk_ids=[chunk_id]
+        )
+
+        logger.debug(f"Added document: chunk_id='{chunk_id}'")
+
+    def add_batch(
+        self,
+        embeddings: list[list[float]] | list[np.ndarray] | np.ndarray,
+        texts: list[str],
+        metadatas: list[dict[str, Any]],
+        chunk_ids: list[str]
+    ) -> None:
+        """複数ドキュメントをまとめてChromaに追加
+
+        1件ずつadd()を呼ぶとトランザクションのオーバーヘッドが
+        チャンク数に比例するため、config.batch_size件ごとに
+        まとめてcollection.add()を呼び出す。
+        config.defer_commitが有効な場合は書き込みを保留し、
+        search()・count()・flush()の呼び出し時にまとめて書き込む。
+
+        Args:
+            embeddings: Embeddingベクターのリスト、または(件数, 次元)のndarray
+            texts: チャンクテキストのリスト
+            metadatas: メタデータのリスト
+            chunk_ids: チャンクIDのリスト
+
+        Raises:
+            ValueError: 各リストの長さが一致しない場合、またはchunk_idsが重複する場合
+
+        Requirements: 2.2, 2.3
+        """
+        if self.collection is None:
+            raise RuntimeError("Chroma not initialized. Call initialize() first.")
+
+        if not (len(embeddings) == len(texts) == len(metadatas) == len(chunk_ids)):
+            raise ValueError(
+                "embeddings, texts, metadatas and chunk_ids must have the same length"
+            )
+
+        if len(set(chunk_ids)) != len(chunk_ids):
+            raise ValueError("chunk_ids must be unique within a batch")
+
+        processed_metadatas = [self._process_metadata(m) for m in metadatas]
+
+        if self.config.defer_commit:
+            # 書き込みを保留し、次の読み取りまたはflush()でまとめて追加
+            # 保留中のIDと重複するものは、既存IDへのcollection.add()と同様に無視する
+            pending_ids = set(self._pending["ids"])
+            skipped = 0
+            for chunk_id, embedding, text, metadata in zip(
+                chunk_ids, embeddings, texts, processed_metadatas, strict=True
+            ):
+                if chunk_id in pending_ids:
+                    skipped += 1
+                    continue
+                self._pending["ids"].append(chunk_id)
+                self._pending["embeddings"].append(embedding)
+                self._pending["documents"].append(text)
+                self._pending["metadatas"].append(metadata)
+            if skipped:
+                logger.warning(f"Skipped {skipped} documents already pending")
+            logger.debug(
+                f"Deferred {len(chunk_ids)} documents "
+                f"(pending={len(self._pending['ids'])})"
+            )
+            return
+
+        self._write_batches(chunk_ids, embeddings, texts, processed_metadatas)
+
+    def flush(self) -> int:
+        """保留中のドキュメントをChromaに書き込む
 
+        defer_commitが無効な場合や保留がない場合は何もしない。
+
+        Returns:
+            書き込んだドキュメント数
+        """
+        if self.collection is None:
+            raise RuntimeError("Chroma not initialized. Call initialize() first.")
+
+        pending = self._pending
+        if not pending["ids"]:
+            return 0
+
+        self._pending = self._empty_pending()
         try:
-            self.collection.add(
-                ids=[chunk_id],
-                embeddings=[embedding],
-                documents=[text],
-                metadatas=[processed_metadata]
+            self._write_batches(
+                pending["ids"], pending["embeddings"], pending["documents"], pending["metadatas"]
             )
+        except Exception:
+            # 書き込めなかったドキュメントを破棄せず保留に戻す（次回のflush()で再試行）
+            # 書き込み中に追加された分は後ろに残し、戻したIDと重複するものは除く
+            restored_ids = set(pending["ids"])
+            added = self._pending
+            keep = [i for i, chunk_id in enumerate(added["ids"]) if chunk_id not in restored_ids]
+            self._pending = {
+                key: pending[key] + [added[key][i] for i in keep] for key in pending
+            }
+            raise
+        return len(pending["ids"])
+
+    def _write_batches(
+        self,
+        chunk_ids: list[str],
+        embeddings: list[list[float]] | list[np.ndarray] | np.ndarray,
+        texts: list[str],
+        metadatas: list[dict[str, Any]]
+    ) -> None:
+        """config.batch_size件ごとにcollection.add()を呼び出す
+
+        Embeddingは(件数, 次元)のfloat32行列にまとめてから渡す。
+        Chromaはfloat32で保存するため精度は変わらない。
+        """
+        if self.collection is None:
+            raise RuntimeError("Chroma not initialized. Call initialize() first.")
+
+        batch_size = self.config.batch_size
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+
+        try:
+            for start in range(0, len(chunk_ids), batch_size):
+                end = start + batch_size
+                self.collection.add(
+                    ids=chunk_ids[start:end],
+                    embeddings=embeddings[start:end],
+                    documents=texts[start:end],
+                    metadatas=metadatas[start:end]
+                )
 
-            logger.debug(f"Added document: chunk_id='{chunk_id}'")
+            logger.debug(
+                f"Added {len(chunk_ids)} documents in batches of {batch_size}"
+            )
 
         except Exception as e:
-            logger.error(f"Failed to add document: {e}")
+            logger.error(f"Failed to add documents: {e}")
             raise
 
+    @staticmethod
+    def _empty_pending() -> dict[str, list]:
+        """空の保留バッファを作成"""
+        return {"ids": [], "embeddings": [], "documents": [], "metadatas": []}
+
     def search(
         self,
-        query_embedding: list[float],
+        query_embedding: list[float] | np.ndarray,
         arxiv_ids: Optional[list[str]] = None,
         top_k: int = 5
     ) -> list[SearchResult]:
         """ベクター検索を実行
 
+        クエリは(1, 次元)のfloat32行列として渡す。float32のndarrayは
+        コピーせずにそのままChromaに渡される。
+
         Args:
-            query_embedding: クエリのEmbeddingベクター
+            query_embedding: クエリのEmbeddingベクター（リストまたはndarray）
             arxiv_ids: フィルタリングする論文IDリスト（Noneの場合は全論文を対象）
             top_k: 取得する結果数
 
         Returns:
             検索結果のリスト
 
+        Requirements: 2.3, 2.4
+        """
+        search_results = list(self.iter_search(query_embedding, arxiv_ids, top_k))
+
+        logger.debug(
+            f"Search completed: query_embedding_dim={len(query_embedding)}, "
+            f"arxiv_ids={arxiv_ids}, top_k={top_k}, results={len(search_results)}"
+        )
+
+        return search_results
+
+    def iter_search(
+        self,
+        query_embedding: list[float] | np.ndarray,
+        arxiv_ids: Optional[list[str]] = None,
+        top_k: int = 5
+    ) -> Iterator[SearchResult]:
+        """ベクター検索を実行し、結果を1件ずつ返すイテレータを返す
+
+        Chromaへの問い合わせは呼び出し時に行い、SearchResultは
+        イテレーション時に生成する。結果を走査するだけの呼び出し元は
+        リスト全体を保持せずに済む。
+
+        Args:
+            query_embedding: クエリのEmbeddingベクター（リストまたはndarray）
+            arxiv_ids: フィルタリングする論文IDリスト（Noneの場合は全論文を対象）
+            top_k: 取得する結果数
+
+        Returns:
+            検索結果のイテレータ（スコアの降順）
+
         Requirements: 2.3, 2.4
         """
         if self.collection is None:
             raise RuntimeError("Chroma not initialized. Call initialize() first.")
 
+        self.flush()
+
         try:
             # where句を構築（arxiv_idsフィルタ）
             where_clause = None
@@ -145,44 +322,43 @@ class ChromaClient:
 
             # ベクター検索を実行
             results = self.collection.query(
-                query_embeddings=[query_embedding],
+                query_embeddings=np.asarray(query_embedding, dtype=np.float32)[None, :],
                 n_results=top_k,
                 where=where_clause,
                 include=["documents", "metadatas", "distances"]
             )
 
-            # SearchResultに変換
-            search_results = []
-            if results["ids"] and len(results["ids"][0]) > 0:
-                for i in range(len(results["ids"][0])):
-                    chunk_id = results["ids"][0][i]
-                    text = results["documents"][0][i]
-                    distance = results["distances"][0][i]
-                    metadata = results["metadatas"][0][i]
-
-                    # 距離をスコアに変換（cosine距離の場合: score = 1 - distance）
-                    score = 1.0 - distance if distance is not None else 0.0
-
-                    search_results.append(
-                        SearchResult(
-                            chunk_id=chunk_id,
-                            text=text,
-                            score=score,
-                            metadata=metadata
-                        )
-                    )
-
-            logger.debug(
-                f"Search completed: query_embedding_dim={len(query_embedding)}, "
-                f"arxiv_ids={arxiv_ids}, top_k={top_k}, results={len(search_results)}"
-            )
-
-            return search_results
-
         except Exception as e:
             logger.error(f"Failed to search: {e}")
             raise
 
+        return self._iter_results(results)
+
+    @staticmethod
+    def _iter_results(results: Mapping[str, Any]) -> Iterator[SearchResult]:
+        """Chromaのクエリ結果をSearchResultに変換しながら返す"""
+        if not results["ids"] or len(results["ids"][0]) == 0:
+            return
+
+        # 距離をスコアに一括変換（cosine距離の場合: score = 1 - distance）
+        # 距離がNoneの場合はNaNとなり、スコア0.0として扱う
+        distances = np.asarray(results["distances"][0], dtype=np.float64)
+        scores = np.nan_to_num(1.0 - distances, nan=0.0).tolist()
+
+        for chunk_id, text, score, metadata in zip(
+            results["ids"][0],
+            results["documents"][0],
+            scores,
+            results["metadatas"][0],
+            strict=True
+        ):
+            yield SearchResult(
+                chunk_id=chunk_id,
+                text=text,
+                score=score,
+                metadata=metadata
+            )
+
     def count(self) -> int:
         """インデックス内のドキュメント数を取得
 
@@ -194,6 +370,8 @@ class ChromaClient:
         if self.collection is None:
             raise RuntimeError("Chroma not initialized. Call initialize() first.")
 
+        self.flush()
+
         try:
             return self.collection.count()
         except Exception as e:
@@ -228,6 +406,32 @@ class ChromaClient:
 
         return processed
 
+    def create_collection(self, name: str) -> "ChromaClient":
+        """同じChromaクライアント上に別コレクションのハンドルを作成
+
+        クライアントの初期化（SQLite接続・マイグレーション確認）を行わずに
+        コレクションを追加できる。返り値はadd/search/count等を備えた
+        ChromaClientで、クライアントを共有する。
+
+        Args:
+            name: コレクション名
+
+        Returns:
+            指定コレクションを操作するChromaClient
+        """
+        if self.client is None:
+            raise RuntimeError("Chroma not initialized. Call initialize() first.")
+
+        handle = ChromaClient(self.config.model_copy(update={"collection_name": name}))
+        handle.client = self.client
+        handle.collection = self.client.get_or_create_collection(
+            name=name,
+            metadata={"hnsw:space": self.config.distance_metric}
+        )
+
+        logger.debug(f"Collection handle created: collection='{name}'")
+        return handle
+
     def reset(self) -> None:
         """コレクションをリセット（全データ削除）
 
@@ -236,6 +440,9 @@ class ChromaClient:
         if self.client is None:
             raise RuntimeError("Chroma not initialized. Call initialize() first.")
 
+        # 保留中のドキュメントも破棄
+        self._pending = self._empty_pending()
+
         try:
             self.client.delete_collection(name=self.config.collection_name)
             logger.warning(f"Collection '{self.config.collection_name}' deleted")
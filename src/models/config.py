@@ -16,7 +16,8 @@ class ChromaConfig(BaseModel):
             "example": {
                 "persist_dir": "./data/chroma",
                 "collection_name": "papersmith_papers",
-                "distance_metric": "cosine"
+                "distance_metric": "cosine",
+                "batch_size": 250
             }
         }
     )
@@ -33,6 +34,23 @@ class ChromaConfig(BaseModel):
         default="cosine",
         description="距離メトリック (cosine/l2/ip)"
     )
+    batch_size: int = Field(
+        default=250,
+        ge=1,
+        description="一括追加時の1回あたりの最大ドキュメント数"
+    )
+    ephemeral: bool = Field(
+        default=False,
+        description=(
+            "Trueの場合はインメモリで動作し、persist_dirに永続化しない（テスト用）。"
+            "プロセス内のすべてのEphemeralClientは1つのストアを共有するため、"
+            "同じcollection_nameのクライアント同士はデータも共有する"
+        )
+    )
+    defer_commit: bool = Field(
+        default=False,
+        description="Trueの場合はadd_batchの書き込みを保留し、検索・件数取得・flush()時にまとめて書き込む"
+    )
 
 
 class LLMConfig(BaseModel):
@@ -3,6 +3,7 @@
 Requirements: 2.2
 """
 
+import asyncio
 import logging
 import os
 from typing import Optional
@@ -238,12 +239,14 @@ class EmbeddingService:
                 return [item.embedding for item in response.data]
 
             elif backend_type == "local":
-                embeddings = self.backend["model"].encode(
+                # 全テキストを1回のencodeに渡し、推論中もイベントループをブロックしない
+                embeddings = await asyncio.to_thread(
+                    self.backend["model"].encode,
                     texts,
                     batch_size=self.config.batch_size,
                     convert_to_numpy=True,
                     normalize_embeddings=self.config.normalize_embeddings,
-                    show_progress_bar=len(texts) > 10
+                    show_progress_bar=False
                 )
                 return embeddings.tolist()
 
@@ -3,9 +3,10 @@
 Requirements: 1.1, 1.4, 1.5
 """
 
+import asyncio
 import json
 import logging
-from datetime import datetime
+from concurrent.futures import Executor
 from pathlib import Path
 from typing import Optional
 
@@ -22,6 +23,35 @@ class PaperServiceError(Exception):
     pass
 
 
+def _extract_text_sync(pdf_path: str) -> tuple[str, int]:
+    """PDFからテキストを同期的に抽出
+
+    ProcessPoolExecutorでも実行できるよう、モジュールレベルの関数として定義しています。
+
+    Args:
+        pdf_path: PDFファイルのパス
+
+    Returns:
+        (抽出されたテキスト, ページ数)
+    """
+    # PdfReaderでPDFを読み込み
+    reader = PdfReader(pdf_path)
+
+    # 全ページのテキストを抽出
+    text_parts = []
+    for page_num, page in enumerate(reader.pages, start=1):
+        try:
+            text = page.extract_text()
+            if text:
+                text_parts.append(text)
+        except Exception as e:
+            logger.warning(f"Failed to extract text from page {page_num}: {e}")
+            continue
+
+    # テキストを結合
+    return "\n\n".join(text_parts), len(reader.pages)
+
+
 class PaperService:
     """論文取得・管理サービス
 
@@ -34,21 +64,28 @@ class PaperService:
     def __init__(
         self,
         arxiv_client: ArxivClient,
-        cache_dir: Path = Path("./cache")
+        cache_dir: Path = Path("./cache"),
+        pdf_executor: Optional[Executor] = None
     ):
         """
         Args:
             arxiv_client: ArxivClientインスタンス
             cache_dir: キャッシュディレクトリ（PDF、メタデータ）
+            pdf_executor: PDFテキスト抽出を実行するExecutor
+                （Noneの場合はイベントループのデフォルトスレッドプール。
+                GILを回避して複数PDFを並列に解析する場合はProcessPoolExecutorを渡す）
         """
         self.arxiv_client = arxiv_client
         self.cache_dir = Path(cache_dir)
+        self.pdf_executor = pdf_executor
 
         # キャッシュディレクトリを作成
         self.pdf_cache_dir = self.cache_dir / "pdfs"
         self.metadata_cache_dir = self.cache_dir / "metadata"
+        self.text_cache_dir = self.cache_dir / "text"
         self.pdf_cache_dir.mkdir(parents=True, exist_ok=True)
         self.metadata_cache_dir.mkdir(parents=True, exist_ok=True)
+        self.text_cache_dir.mkdir(parents=True, exist_ok=True)
 
         logger.info(
             f"PaperService initialized: "
@@ -169,23 +206,16 @@ class PaperService:
             # キャッシュが存在し、force_refreshでない場合はキャッシュから読み込み
             if metadata_path.exists() and not force_refresh:
                 logger.info(f"Loading metadata from cache: {metadata_path}")
-                with open(metadata_path, encoding='utf-8') as f:
-                    data = json.load(f)
-                    # datetimeをパース
-                    data['published_date'] = datetime.fromisoformat(data['published_date'])
-                    return PaperMetadata(**data)
+                # pydanticのJSONパーサーで直接検証（datetimeもISO形式から変換される）
+                return PaperMetadata.model_validate_json(metadata_path.read_bytes())
 
             # arXiv APIから取得
             logger.info(f"Fetching metadata from arXiv API: arxiv_id={arxiv_id}")
             metadata = await self.arxiv_client.get_metadata(arxiv_id)
 
-            # JSONとして保存
+            # JSONとして保存（datetimeはpydanticがISO形式で直列化）
             with open(metadata_path, 'w', encoding='utf-8') as f:
-                # Pydanticモデルをdictに変換
-                data = metadata.model_dump()
-                # datetimeをISO形式文字列に変換
-                data['published_date'] = metadata.published_date.isoformat()
-                json.dump(data, f, ensure_ascii=False, indent=2)
+                f.write(metadata.model_dump_json(indent=2))
 
             logger.info(f"Metadata cached: {metadata_path}")
             return metadata
@@ -205,6 +235,9 @@ class PaperService:
 
         PDFファイルからテキストを抽出します。
         pypdfを使用してページごとにテキストを抽出し、結合します。
+        解析はCPUバウンドのため、イベントループを塞がないようpdf_executorで実行します。
+        抽出結果はtext_cache_dirにキャッシュし（キー: PDFのパス・mtime・サイズ）、
+        PDFが更新された場合（mtime・サイズの変化）は再抽出します。
 
         Args:
             pdf_path: PDFファイルのPath
@@ -221,32 +254,88 @@ class PaperService:
             if not pdf_path.exists():
                 raise PaperServiceError(f"PDF file not found: {pdf_path}")
 
-            logger.info(f"Extracting text from PDF: {pdf_path}")
-
-            # PdfReaderでPDFを読み込み
-            reader = PdfReader(str(pdf_path))
+            stat = pdf_path.stat()
+            cache_key = (str(pdf_path.resolve()), stat.st_mtime_ns, stat.st_size)
+            cached_text = self._load_cached_text(pdf_path, cache_key)
+            if cached_text is not None:
+                return cached_text
 
-            # 全ページのテキストを抽出
-            text_parts = []
-            for page_num, page in enumerate(reader.pages, start=1):
-                try:
-                    text = page.extract_text()
-                    if text:
-                        text_parts.append(text)
-                except Exception as e:
-                    logger.warning(f"Failed to extract text from page {page_num}: {e}")
-                    continue
+            logger.info(f"Extracting text from PDF: {pdf_path}")
 
-            # テキストを結合
-            full_text = "\n\n".join(text_parts)
+            loop = asyncio.get_running_loop()
+            full_text, num_pages = await loop.run_in_executor(
+                self.pdf_executor, _extract_text_sync, str(pdf_path)
+            )
 
             logger.info(
                 f"Text extraction completed: "
-                f"{len(reader.pages)} pages, {len(full_text)} characters"
+                f"{num_pages} pages, {len(full_text)} characters"
             )
 
+            self._save_cached_text(pdf_path, cache_key, full_text)
             return full_text
 
         except Exception as e:
             logger.error(f"Failed to extract text: {e}")
             raise PaperServiceError(f"Failed to extract text: {e}") from e
+
+    def _text_cache_path(self, pdf_path: Path) -> Path:
+        """抽出テキストのキャッシュファイルパスを生成"""
+        return self.text_cache_dir / f"{pdf_path.stem}.json"
+
+    def _load_cached_text(
+        self,
+        pdf_path: Path,
+        cache_key: tuple[str, int, int]
+    ) -> Optional[str]:
+        """ディスクキャッシュから抽出テキストを読み込む
+
+        キャッシュ元のPDFのパス・mtime・サイズが一致しない場合はNoneを返します。
+        """
+        cache_path = self._text_cache_path(pdf_path)
+        if not cache_path.exists():
+            return None
+
+        try:
+            with open(cache_path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to read text cache {cache_path}: {e}")
+            return None
+
+        if not isinstance(data, dict):
+            logger.warning(f"Invalid text cache format: {cache_path}")
+            return None
+
+        if (data.get("source"), data.get("mtime_ns"), data.get("size")) != cache_key:
+            return None
+
+        text = data.get("text")
+        if not isinstance(text, str):
+            logger.warning(f"Invalid text cache entry: {cache_path}")
+            return None
+
+        logger.info(f"Loading extracted text from cache: {cache_path}")
+        return text
+
+    def _save_cached_text(
+        self,
+        pdf_path: Path,
+        cache_key: tuple[str, int, int],
+        text: str
+    ) -> None:
+        """抽出テキストをディスクにキャッシュ
+
+        ディスクへの書き込みに失敗しても抽出結果は返せるため、警告のみ出力します。
+        """
+        cache_path = self._text_cache_path(pdf_path)
+        source, mtime_ns, size = cache_key
+        try:
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(
+                    {"source": source, "mtime_ns": mtime_ns, "size": size, "text": text},
+                    f,
+                    ensure_ascii=False
+                )
+        except OSError as e:
+            logger.warning(f"Failed to write text cache {cache_path}: {e}")
@@ -5,7 +5,9 @@ Requirements: 2.1, 2.2, 2.3, 2.4, 2.5
 
 import logging
 import re
-from typing import Optional
+from typing import AsyncIterator, Optional
+
+import numpy as np
 
 from src.clients.chroma_client import ChromaClient
 from src.models.paper import PaperMetadata
@@ -15,6 +17,49 @@ from src.services.llm_service import LLMService
 
 logger = logging.getLogger(__name__)
 
+# IMRaDセクション見出しのパターン（優先順位順）
+_IMRAD_PATTERN_SOURCES: dict[str, list[str]] = {
+    "abstract": [
+        r"\n\s*abstract\s*\n",
+        r"\n\s*要旨\s*\n",
+        r"\n\s*概要\s*\n"
+    ],
+    "introduction": [
+        r"\n\s*(?:1\.?\s+)?introduction\s*\n",
+        r"\n\s*(?:1\.?\s+)?はじめに\s*\n",
+        r"\n\s*(?:1\.?\s+)?序論\s*\n"
+    ],
+    "methods": [
+        r"\n\s*(?:\d+\.?\s+)?(?:methods?|methodology|approach|proposed method)\s*\n",
+        r"\n\s*(?:\d+\.?\s+)?(?:手法|提案手法|方法論)\s*\n"
+    ],
+    "results": [
+        r"\n\s*(?:\d+\.?\s+)?(?:results?|experiments?|evaluation)\s*\n",
+        r"\n\s*(?:\d+\.?\s+)?(?:結果|実験|評価)\s*\n"
+    ],
+    "discussion": [
+        r"\n\s*(?:\d+\.?\s+)?discussion\s*\n",
+        r"\n\s*(?:\d+\.?\s+)?(?:考察|議論)\s*\n"
+    ],
+    "conclusion": [
+        r"\n\s*(?:\d+\.?\s+)?(?:conclusion|conclusions?|summary)\s*\n",
+        r"\n\s*(?:\d+\.?\s+)?(?:結論|まとめ)\s*\n"
+    ],
+    "references": [
+        r"\n\s*(?:references|bibliography)\s*\n",
+        r"\n\s*(?:参考文献|文献)\s*\n"
+    ]
+}
+
+# モジュール読み込み時に一度だけコンパイル
+_IMRAD_SECTION_PATTERNS: dict[str, list[re.Pattern[str]]] = {
+    section_name: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+    for section_name, patterns in _IMRAD_PATTERN_SOURCES.items()
+}
+
+# 文の区切り（英語: ". " "! " "? "、日本語: "。" "！" "？"）
+_SENTENCE_DELIMITER_RE = re.compile(r'(?<=[.!?。！？])\s+')
+
 
 class RAGService:
     """RAG処理サービス
@@ -73,49 +118,11 @@ class RAGService:
         try:
             logger.info(f"Indexing paper: arxiv_id={arxiv_id}")
 
-            # IMRaD構造でセクション分割
-            sections = self._split_by_imrad(text)
-            logger.debug(f"Split into {len(sections)} sections")
-
-            # チャンク化
-            chunks = []
-            for section_name, section_text in sections.items():
-                if not section_text.strip():
-                    continue
-
-                section_chunks = self._chunk_text(section_text, chunk_size=chunk_size)
-
-                for i, chunk in enumerate(section_chunks):
-                    chunk_id = f"{arxiv_id}_{section_name}_{i}"
-                    chunks.append({
-                        "chunk_id": chunk_id,
-                        "text": chunk,
-                        "metadata": {
-                            "arxiv_id": arxiv_id,
-                            "title": metadata.title,
-                            "authors": metadata.authors,
-                            "year": metadata.year,
-                            "section": section_name,
-                            "chunk_id": chunk_id
-                        }
-                    })
-
-            logger.info(f"Created {len(chunks)} chunks from {len(sections)} sections")
+            chunks = self._build_chunks(arxiv_id, text, metadata, chunk_size)
 
             # Embedding生成とChromaに保存
             if chunks:
-                # バッチでEmbedding生成
-                texts = [chunk["text"] for chunk in chunks]
-                embeddings = await self.embedding.embed_batch(texts)
-
-                # Chromaに追加
-                for chunk, embedding in zip(chunks, embeddings, strict=False):
-                    self.chroma.add(
-                        embedding=embedding,
-                        text=chunk["text"],
-                        metadata=chunk["metadata"],
-                        chunk_id=chunk["chunk_id"]
-                    )
+                await self._embed_and_store(chunks)
 
                 logger.info(
                     f"Successfully indexed paper: arxiv_id={arxiv_id}, "
@@ -130,6 +137,111 @@ class RAGService:
             logger.error(f"Failed to index paper {arxiv_id}: {e}")
             raise
 
+    async def index_papers(
+        self,
+        papers: list[tuple[str, str, PaperMetadata]],
+        chunk_size: int = 512
+    ) -> dict[str, int]:
+        """複数の論文をまとめてインデックス化
+
+        全論文のチャンクをメモリ上に集めてから、Embedding生成と
+        Chromaへの追加をそれぞれ1回の呼び出しで行います。
+        論文ごとにindex_paper()を呼ぶ場合と比べ、呼び出しごとの
+        オーバーヘッドが論文数に比例しません。
+
+        Args:
+            papers: (arxiv_id, 全文テキスト, メタデータ)のリスト
+            chunk_size: チャンクサイズ（文字数）
+
+        Returns:
+            arxiv_idごとのインデックス化されたチャンク数
+
+        Requirements: 2.1, 2.2, 2.3
+        """
+        try:
+            logger.info(f"Indexing {len(papers)} papers in batch")
+
+            chunks = []
+            chunk_counts: dict[str, int] = {}
+            for arxiv_id, text, metadata in papers:
+                paper_chunks = self._build_chunks(arxiv_id, text, metadata, chunk_size)
+                chunk_counts[arxiv_id] = len(paper_chunks)
+                chunks.extend(paper_chunks)
+
+            if chunks:
+                await self._embed_and_store(chunks)
+
+            logger.info(
+                f"Successfully indexed {len(papers)} papers: chunks={len(chunks)}"
+            )
+            return chunk_counts
+
+        except Exception as e:
+            logger.error(f"Failed to index papers: {e}")
+            raise
+
+    def _build_chunks(
+        self,
+        arxiv_id: str,
+        text: str,
+        metadata: PaperMetadata,
+        chunk_size: int
+    ) -> list[dict]:
+        """論文テキストをIMRaD構造で分割し、メタデータ付きチャンクを作成
+
+        Args:
+            arxiv_id: 論文ID
+            text: 論文の全文テキスト
+            metadata: 論文メタデータ
+            chunk_size: チャンクサイズ（文字数）
+
+        Returns:
+            chunk_id・text・metadataを持つチャンクのリスト
+        """
+        # IMRaD構造でセクション境界を一度だけ検出
+        sections = self._imrad_section_slices(text)
+        logger.debug(f"Split into {len(sections)} sections")
+
+        # チャンク化（セクション文字列を辞書に複製せず、スライスを直接渡す）
+        chunks = []
+        for section_name, section_slice in sections:
+            section_chunks = self._chunk_text(text[section_slice], chunk_size=chunk_size)
+
+            for i, chunk in enumerate(section_chunks):
+                chunk_id = f"{arxiv_id}_{section_name}_{i}"
+                chunks.append({
+                    "chunk_id": chunk_id,
+                    "text": chunk,
+                    "metadata": {
+                        "arxiv_id": arxiv_id,
+                        "title": metadata.title,
+                        "authors": metadata.authors,
+                        "year": metadata.year,
+                        "section": section_name,
+                        "chunk_id": chunk_id
+                    }
+                })
+
+        logger.info(f"Created {len(chunks)} chunks from {len(sections)} sections")
+        return chunks
+
+    async def _embed_and_store(self, chunks: list[dict]) -> None:
+        """チャンクのEmbeddingをバッチ生成し、Chromaに一括追加"""
+        texts = [chunk["text"] for chunk in chunks]
+
+        # バックエンドがリストを返す場合もここで(件数, 次元)のC連続float32行列に揃え、
+        # Chroma側ではコピーなしでそのまま渡せるようにする
+        embeddings = np.ascontiguousarray(
+            await self.embedding.embed_batch(texts), dtype=np.float32
+        )
+
+        self.chroma.add_batch(
+            embeddings=embeddings,
+            texts=texts,
+            metadatas=[chunk["metadata"] for chunk in chunks],
+            chunk_ids=[chunk["chunk_id"] for chunk in chunks]
+        )
+
     async def query(
         self,
         question: str,
@@ -174,6 +286,42 @@ class RAGService:
             logger.error(f"Failed to query: {e}")
             raise
 
+    async def query_stream(
+        self,
+        question: str,
+        arxiv_ids: Optional[list[str]] = None,
+        top_k: int = 5
+    ) -> AsyncIterator[SearchResult]:
+        """ベクター検索を実行し、検索結果を1件ずつ返す
+
+        query()と同じ検索を行いますが、結果のリストを作らずに
+        ChromaのクエリからSearchResultを生成しながら返します。
+
+        Args:
+            question: 検索クエリ（質問）
+            arxiv_ids: フィルタリングする論文IDリスト（Noneの場合は全論文を対象）
+            top_k: 取得する結果数
+
+        Yields:
+            検索結果（スコアの降順）
+
+        Requirements: 2.4
+        """
+        logger.info(
+            f"Streaming query: question='{question[:50]}...', "
+            f"arxiv_ids={arxiv_ids}, top_k={top_k}"
+        )
+
+        # 質問をEmbedding化
+        query_embedding = await self.embedding.embed(question)
+
+        for result in self.chroma.iter_search(
+            query_embedding=query_embedding,
+            arxiv_ids=arxiv_ids,
+            top_k=top_k
+        ):
+            yield result
+
     def _split_by_imrad(self, text: str) -> dict[str, str]:
         """IMRaD構造でセクション分割
 
@@ -188,78 +336,56 @@ class RAGService:
 
         Requirements: 2.1
         """
-        # セクション定義（優先順位順）
-        section_patterns = {
-            "abstract": [
-                r"\n\s*abstract\s*\n",
-                r"\n\s*要旨\s*\n",
-                r"\n\s*概要\s*\n"
-            ],
-            "introduction": [
-                r"\n\s*(?:1\.?\s+)?introduction\s*\n",
-                r"\n\s*(?:1\.?\s+)?はじめに\s*\n",
-                r"\n\s*(?:1\.?\s+)?序論\s*\n"
-            ],
-            "methods": [
-                r"\n\s*(?:\d+\.?\s+)?(?:methods?|methodology|approach|proposed method)\s*\n",
-                r"\n\s*(?:\d+\.?\s+)?(?:手法|提案手法|方法論)\s*\n"
-            ],
-            "results": [
-                r"\n\s*(?:\d+\.?\s+)?(?:results?|experiments?|evaluation)\s*\n",
-                r"\n\s*(?:\d+\.?\s+)?(?:結果|実験|評価)\s*\n"
-            ],
-            "discussion": [
-                r"\n\s*(?:\d+\.?\s+)?discussion\s*\n",
-                r"\n\s*(?:\d+\.?\s+)?(?:考察|議論)\s*\n"
-            ],
-            "conclusion": [
-                r"\n\s*(?:\d+\.?\s+)?(?:conclusion|conclusions?|summary)\s*\n",
-                r"\n\s*(?:\d+\.?\s+)?(?:結論|まとめ)\s*\n"
-            ],
-            "references": [
-                r"\n\s*(?:references|bibliography)\s*\n",
-                r"\n\s*(?:参考文献|文献)\s*\n"
-            ]
+        sections = self._imrad_section_slices(text)
+        if sections[0][0] == "full_text":
+            # セクション未検出時は全文をそのまま返す
+            return {"full_text": text}
+
+        return {
+            section_name: text[section_slice].strip()
+            for section_name, section_slice in sections
         }
 
-        # テキストを小文字化（パターンマッチング用）
-        text_lower = text.lower()
+    def _imrad_section_slices(self, text: str) -> list[tuple[str, slice]]:
+        """IMRaD構造のセクション境界を検出
+
+        セクション文字列を複製せず、元テキストに対するスライスを返します。
+        チャンク化ではtext[slice]をそのまま_chunk_textに渡します。
 
-        # セクション境界を検出
+        Args:
+            text: 論文の全文テキスト
+
+        Returns:
+            (セクション名, スライス)のリスト（出現位置順）
+
+        Requirements: 2.1
+        """
+        # セクション境界を検出（各セクションで最初にマッチしたパターンの最初の位置）
         section_boundaries: list[tuple[int, str]] = []
 
-        for section_name, patterns in section_patterns.items():
+        for section_name, patterns in _IMRAD_SECTION_PATTERNS.items():
             for pattern in patterns:
-                matches = list(re.finditer(pattern, text_lower, re.IGNORECASE))
-                if matches:
-                    # 最初のマッチを使用
-                    match = matches[0]
+                match = pattern.search(text)
+                if match:
                     section_boundaries.append((match.start(), section_name))
                     break
 
         # 位置でソート
         section_boundaries.sort(key=lambda x: x[0])
 
-        # セクションテキストを抽出
-        sections = {}
-
         if not section_boundaries:
             # セクションが検出されない場合は全体を"full_text"として扱う
             logger.warning("No IMRaD sections detected, using full text")
-            sections["full_text"] = text
-        else:
-            for i, (start_pos, section_name) in enumerate(section_boundaries):
-                # 次のセクションの開始位置を取得
-                if i + 1 < len(section_boundaries):
-                    end_pos = section_boundaries[i + 1][0]
-                else:
-                    end_pos = len(text)
+            return [("full_text", slice(0, len(text)))]
 
-                # セクションテキストを抽出
-                section_text = text[start_pos:end_pos].strip()
-                sections[section_name] = section_text
+        # 次のセクションの開始位置（最後はテキスト末尾）までをスライスとする
+        end_positions = [start for start, _ in section_boundaries[1:]] + [len(text)]
+        sections = [
+            (section_name, slice(start_pos, end_pos))
+            for (start_pos, section_name), end_pos in zip(section_boundaries, end_positions, strict=True)
+        ]
 
-        logger.debug(f"Detected sections: {list(sections.keys())}")
+        logger.debug(f"Detected sections: {[name for name, _ in sections]}")
 
         return sections
 
@@ -281,43 +407,42 @@ class RAGService:
         if not text.strip():
             return []
 
-        # 文単位で分割（英語と日本語の両方に対応）
-        # 英語: ". ", "! ", "? " で分割
-        # 日本語: "。", "！", "？" で分割
-        sentence_delimiters = r'(?<=[.!?。！？])\s+'
-        sentences = re.split(sentence_delimiters, text)
-
         chunks = []
-        current_chunk = ""
+        # 現在のチャンクに含める文と、" "で連結した場合の長さ
+        current_sentences: list[str] = []
+        current_len = 0
 
-        for sentence in sentences:
+        for sentence in _SENTENCE_DELIMITER_RE.split(text):
             sentence = sentence.strip()
             if not sentence:
                 continue
 
             # 現在のチャンクに文を追加できるか確認
-            if len(current_chunk) + len(sentence) + 1 <= chunk_size:
-                if current_chunk:
-                    current_chunk += " " + sentence
+            if current_len + len(sentence) + 1 <= chunk_size:
+                if current_sentences:
+                    current_len += 1 + len(sentence)
                 else:
-                    current_chunk = sentence
+                    current_len = len(sentence)
+                current_sentences.append(sentence)
             else:
-                # 現在のチャンクを保存
-                if current_chunk:
-                    chunks.append(current_chunk)
+                # 現在のチャンクを保存（連結はチャンクごとに1回だけ行う）
+                if current_sentences:
+                    chunks.append(" ".join(current_sentences))
 
                 # 文が単独でchunk_sizeを超える場合
                 if len(sentence) > chunk_size:
                     # 強制的に分割
                     for i in range(0, len(sentence), chunk_size):
                         chunks.append(sentence[i:i + chunk_size])
-                    current_chunk = ""
+                    current_sentences = []
+                    current_len = 0
                 else:
-                    current_chunk = sentence
+                    current_sentences = [sentence]
+                    current_len = len(sentence)
 
         # 最後のチャンクを追加
-        if current_chunk:
-            chunks.append(current_chunk)
+        if current_sentences:
+            chunks.append(" ".join(current_sentences))
 
         logger.debug(f"Chunked text into {len(chunks)} chunks (chunk_size={chunk_size})")
 
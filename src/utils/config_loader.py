@@ -50,5 +50,8 @@ def load_chroma_config() -> ChromaConfig:
     return ChromaConfig(
         persist_dir=Path(os.getenv("CHROMA_PERSIST_DIR", "./data/chroma")),
         collection_name=os.getenv("CHROMA_COLLECTION_NAME", "papersmith_papers"),
-        distance_metric=os.getenv("CHROMA_DISTANCE_METRIC", "cosine")
+        distance_metric=os.getenv("CHROMA_DISTANCE_METRIC", "cosine"),
+        batch_size=int(os.getenv("CHROMA_BATCH_SIZE", "250")),
+        ephemeral=os.getenv("CHROMA_EPHEMERAL", "false").lower() == "true",
+        defer_commit=os.getenv("CHROMA_DEFER_COMMIT", "false").lower() == "true"
     )
@@ -15,10 +15,14 @@ if str(project_root) not in sys.path:
 print(f"DEBUG: project_root = {project_root}")
 print(f"DEBUG: sys.path = {sys.path}")
 
+import hashlib
+import os
 from datetime import datetime
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
 from src.models.config import ChromaConfig, EmbeddingConfig, LLMConfig
@@ -26,6 +30,20 @@ from src.models.paper import PaperMetadata
 from src.models.rag import SearchResult
 
 
+def pytest_collection_modifyitems(config, items):
+    """networkマーカー付きテストをデフォルトでスキップ
+
+    実APIにアクセスするテストはRUN_NETWORK_TESTS=1の場合のみ実行します。
+    """
+    if os.getenv("RUN_NETWORK_TESTS") == "1":
+        return
+
+    skip_network = pytest.mark.skip(reason="live network test (set RUN_NETWORK_TESTS=1 to run)")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
+
+
 @pytest.fixture
 def sample_paper_metadata() -> PaperMetadata:
     """サンプル論文メタデータフィクスチャ
@@ -110,12 +128,81 @@ def chroma_client():
         pass
 
 
-@pytest.fixture
+# 永続化Chromaのテストで適用するSQLiteのPRAGMA（耐久性を捨てて書き込みを高速化）
+# journal_mode=MEMORYはロールバックジャーナルをメモリ上に保持するため、ROLLBACKは機能する
+_RELAXED_SQLITE_PRAGMAS = (
+    "journal_mode=MEMORY",
+    "synchronous=OFF",
+    "temp_store=MEMORY",
+)
+
+
+@pytest.fixture(scope="module")
+def relaxed_sqlite_durability():
+    """永続化ChromaのSQLite接続でfsyncを無効化するフィクスチャ
+
+    Chromaはスレッドごとに接続を作成するため、接続の生成時にPRAGMAを適用し、
+    どのスレッドの接続にも効くようにします。モジュール終了時に元に戻します。
+    クラッシュ時の耐久性は失われるため、テスト専用です。
+    """
+    from chromadb.db.impl import sqlite_pool
+
+    original_init = sqlite_pool.Connection.__init__
+
+    def init_with_pragmas(self, *args, **kwargs):
+        original_init(self, *args, **kwargs)
+        for pragma in _RELAXED_SQLITE_PRAGMAS:
+            self.execute(f"PRAGMA {pragma}")
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(sqlite_pool.Connection, "__init__", init_with_pragmas)
+        yield
+
+
+MOCK_EMBEDDING_DIM = 768
+
+# splitmix64の定数（カウンタベースの擬似乱数で次元ごとの値を生成）
+_SPLITMIX_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+_SPLITMIX_MUL1 = np.uint64(0xBF58476D1CE4E5B9)
+_SPLITMIX_MUL2 = np.uint64(0x94D049BB133111EB)
+_DIM_OFFSETS = np.arange(1, MOCK_EMBEDDING_DIM + 1, dtype=np.uint64) * _SPLITMIX_GAMMA
+
+
+def _mock_embeddings(texts: list[str]) -> np.ndarray:
+    """テキストから決定的な単位ベクトル（float32）を一括生成
+
+    テキストのハッシュをシードに、(テキスト数, 次元)の行列全体を
+    splitmix64で一度に計算します。各ベクトルはテキストのみで決まり、
+    同じバッチに含まれる他のテキストには依存しません。
+    """
+    seeds = np.fromiter(
+        (
+            int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "little")
+            for text in texts
+        ),
+        dtype=np.uint64,
+        count=len(texts)
+    )
+    x = seeds[:, None] + _DIM_OFFSETS[None, :]
+    x ^= x >> np.uint64(30)
+    x *= _SPLITMIX_MUL1
+    x ^= x >> np.uint64(27)
+    x *= _SPLITMIX_MUL2
+    x ^= x >> np.uint64(31)
+
+    # 上位24bitを[-1, 1)のfloat32に変換して正規化
+    vectors = (x >> np.uint64(40)).astype(np.float32) * np.float32(2.0 / (1 << 24)) - np.float32(1.0)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors
+
+
+@pytest.fixture(scope="session")
 def mock_llm_service():
     """モックLLMサービスフィクスチャ
 
     LLMサービスのモックを提供します。
     実際のLLM呼び出しを避けてテストを高速化します。
+    状態を持たないため、セッション全体で共有します。
 
     Returns:
         モックLLMサービス
@@ -135,36 +222,85 @@ def mock_llm_service():
     return mock_service
 
 
-@pytest.fixture
+class FakeEmbeddingService:
+    """EmbeddingService互換の軽量スタブ
+
+    MagicMockを使わず、_mock_embeddingsで(テキスト数, 次元)の
+    C連続float32行列を一括生成して返します。
+    同じテキストには常に同じベクトルを返すため、検索結果は決定的です。
+    """
+
+    def __init__(self, dimension: int = MOCK_EMBEDDING_DIM):
+        self._is_loaded = True
+        self.backend = {"type": "mock"}
+        self.dimension = dimension
+
+    async def load_model(self) -> None:
+        """ロード済みのため何もしない"""
+
+    async def embed(self, text: str) -> np.ndarray:
+        return _mock_embeddings([text])[0]
+
+    async def embed_batch(self, texts: list[str]) -> np.ndarray:
+        # 行列演算で一括生成し、float32行列のままChromaに渡す
+        return _mock_embeddings(texts)
+
+    def is_loaded(self) -> bool:
+        return self._is_loaded
+
+    def get_embedding_dimension(self) -> int:
+        return self.dimension
+
+
+@pytest.fixture(scope="session")
 def mock_embedding_service():
     """モックEmbeddingサービスフィクスチャ
 
-    Embeddingサービスのモックを提供します。
+    Embeddingサービスのスタブを提供します。
     実際のEmbedding生成を避けてテストを高速化します。
+    状態を持たないため、セッション全体で共有します。
 
     Returns:
-        モックEmbeddingサービス
+        FakeEmbeddingService
     """
-    mock_service = MagicMock()
-    mock_service._is_loaded = True
-    mock_service.backend = {"type": "mock"}
+    return FakeEmbeddingService()
 
-    # デフォルトのEmbeddingを設定（768次元）
-    async def mock_embed(text: str) -> list[float]:
-        # テキストのハッシュから決定的なEmbeddingを生成
-        import hashlib
-        hash_val = int(hashlib.md5(text.encode()).hexdigest(), 16)
-        return [(hash_val % 1000) / 1000.0] * 768
 
-    async def mock_embed_batch(texts: list[str]) -> list[list[float]]:
-        return [await mock_embed(text) for text in texts]
+async def _noop_load_model() -> None:
+    """lifespanが呼び出すload_modelのスタブ（何もしない）"""
 
-    mock_service.embed = mock_embed
-    mock_service.embed_batch = mock_embed_batch
-    mock_service.is_loaded = MagicMock(return_value=True)
-    mock_service.get_embedding_dimension = MagicMock(return_value=768)
 
-    return mock_service
+@pytest.fixture(scope="session")
+def mock_api_services(mock_embedding_service, mock_llm_service):
+    """APIアプリに注入するモックサービスフィクスチャ
+
+    src.api.main.EmbeddingService / LLMService をパッチする際の
+    return_valueとして使用します。
+    load_modelはlifespanのたびに呼ばれますが、呼び出しを検証するテストはないため、
+    AsyncMockではなく呼び出し履歴を持たない_noop_load_modelを使用します
+    （セッションスコープのAsyncMockではmock_callsがセッション中増え続けるため）。
+    APIが使用する属性のみを持つSimpleNamespaceのため、属性アクセスごとに
+    子モックを生成するMagicMockのオーバーヘッドがありません。
+    状態を持たないため、セッション全体で共有します。
+
+    Returns:
+        dict: "embedding"と"llm"をキーとするモックインスタンス
+    """
+    mock_emb_instance = SimpleNamespace(
+        load_model=_noop_load_model,
+        embed=mock_embedding_service.embed,
+        embed_batch=mock_embedding_service.embed_batch
+    )
+
+    mock_llm_instance = SimpleNamespace(
+        load_model=_noop_load_model,
+        generate=mock_llm_service.generate
+    )
+
+    return {
+        "embedding": mock_emb_instance,
+        "llm": mock_llm_instance
+    }
 
 
 @pytest.fixture
@@ -202,10 +338,12 @@ def mock_paper_service():
     return mock_service
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pdf_text() -> str:
     """サンプルPDFテキストフィクスチャ
 
+    文字列は不変のため、セッション全体で共有します。
+
     Returns:
         テスト用のPDFテキスト（IMRaD構造）
     """
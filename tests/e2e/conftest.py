@@ -21,6 +21,14 @@ from playwright.sync_api import Page, Playwright
 
 from tests.e2e.utils.server import cleanup_test_data, wait_for_server
 
+# Playwrightのブラウザバイナリを固定パスに配置する
+# CIではこのディレクトリをキャッシュし、毎回のChromiumダウンロード（約50秒）を省略する
+# ローカルでも `playwright install chromium` は初回のみでよい
+os.environ.setdefault(
+    "PLAYWRIGHT_BROWSERS_PATH",
+    str(Path.home() / ".cache" / "ms-playwright"),
+)
+
 
 @pytest.fixture(scope="session")
 def fastapi_server() -> Generator[str, None, None]:
@@ -123,23 +131,11 @@ def streamlit_server(fastapi_server: str) -> Generator[str, None, None]:
         print("✓ Streamlit server stopped")
 
 
-@pytest.fixture
-def page(playwright: Playwright, streamlit_server: str, request) -> Generator[Page, None, None]:
-    """Playwrightページオブジェクト
-    
-    各テストで新しいブラウザコンテキストとページを作成します。
-    テスト終了後に自動的にクリーンアップします。
-    テスト失敗時には自動的にスクリーンショットとログを保存します。
-    
-    Requirements: 1.5, 8.3, 8.4, 10.1, 10.2, 10.3
+def _launch_page(playwright: Playwright) -> Page:
+    """ブラウザ・コンテキスト・ページを作成
     
-    Args:
-        playwright: Playwright instance (pytest-playwrightが提供)
-        streamlit_server: Streamlit base URL (依存関係)
-        request: pytest request object (テスト情報取得用)
-    
-    Yields:
-        Page: Playwright page object
+    コンソールログの収集とページエラーの出力を設定したページを返します。
+    ブラウザとコンテキストは page.context / page.context.browser から参照できます。
     """
     # ブラウザを起動
     browser = playwright.chromium.launch(
@@ -167,9 +163,21 @@ def page(playwright: Playwright, streamlit_server: str, request) -> Generator[Pa
     # ページオブジェクトにコンソールメッセージを保存
     page.console_messages = console_messages  # type: ignore
     
-    yield page
-    
-    # テスト失敗時にキャプチャを保存
+    return page
+
+
+def _close_page(page: Page) -> None:
+    """ページ・コンテキスト・ブラウザを閉じる"""
+    context = page.context
+    browser = context.browser
+    page.close()
+    context.close()
+    if browser is not None:
+        browser.close()
+
+
+def _capture_if_failed(page: Page, request) -> None:
+    """テスト失敗時にスクリーンショットとログを保存"""
     if request.node.rep_call.failed if hasattr(request.node, 'rep_call') else False:
         from tests.e2e.utils.capture import capture_on_failure
         test_name = request.node.name
@@ -178,11 +186,66 @@ def page(playwright: Playwright, streamlit_server: str, request) -> Generator[Pa
             print(f"✓ Captured failure artifacts for {test_name}")
         except Exception as e:
             print(f"✗ Failed to capture artifacts: {e}")
+
+
+@pytest.fixture(scope="module")
+def shared_page(playwright: Playwright, streamlit_server: str) -> Generator[Page, None, None]:
+    """モジュール内で共有するPlaywrightページオブジェクト
+    
+    ブラウザの起動とコンテキスト作成をモジュールにつき1回に抑えます。
+    テストからは reused_page 経由で使用します。
+    
+    Yields:
+        Page: Playwright page object
+    """
+    page = _launch_page(playwright)
+    yield page
+    _close_page(page)
+
+
+@pytest.fixture
+def reused_page(shared_page: Page, request) -> Generator[Page, None, None]:
+    """shared_pageをテスト単位で貸し出す
+    
+    テスト失敗時のキャプチャは page fixture と同様に行い、
+    終了後はabout:blankへ遷移して次のテストへ状態を持ち越さないようにします。
+    
+    Yields:
+        Page: Playwright page object
+    """
+    yield shared_page
+    
+    _capture_if_failed(shared_page, request)
+    shared_page.goto("about:blank")
+
+
+@pytest.fixture
+def page(playwright: Playwright, streamlit_server: str, request) -> Generator[Page, None, None]:
+    """Playwrightページオブジェクト
+    
+    各テストで新しいブラウザコンテキストとページを作成します。
+    テスト終了後に自動的にクリーンアップします。
+    テスト失敗時には自動的にスクリーンショットとログを保存します。
+    
+    Requirements: 1.5, 8.3, 8.4, 10.1, 10.2, 10.3
+    
+    Args:
+        playwright: Playwright instance (pytest-playwrightが提供)
+        streamlit_server: Streamlit base URL (依存関係)
+        request: pytest request object (テスト情報取得用)
+    
+    Yields:
+        Page: Playwright page object
+    """
+    page = _launch_page(playwright)
+    
+    yield page
+    
+    # テスト失敗時にキャプチャを保存
+    _capture_if_failed(page, request)
     
     # クリーンアップ
-    page.close()
-    context.close()
-    browser.close()
+    _close_page(page)
 
 
 @pytest.fixture
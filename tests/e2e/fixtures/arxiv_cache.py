@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""arXivキャッシュフィクスチャ
+
+E2Eテストで使用する論文のPDFとメタデータをディスクに保持し、
+テストセッションをまたいで再利用します。
+初回実行時のみarXivから取得し、以降はネットワークにアクセスしません。
+
+ディレクトリ構成はPaperServiceのキャッシュと同じです:
+    arxiv_cache/pdfs/{arxiv_id}.pdf
+    arxiv_cache/metadata/{arxiv_id}.json
+
+FixtureArxivClientはArxivClientの代わりにアプリへ注入するフェイクで、
+キャッシュに無い論文もネットワークを使わずに合成したPDF・メタデータで応答します。
+"""
+import asyncio
+import logging
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from src.clients.arxiv_client import ArxivClient
+from src.models.paper import PaperMetadata
+from src.services.paper_service import PaperService, PaperServiceError
+
+logger = logging.getLogger(__name__)
+
+ARXIV_CACHE_DIR = Path(__file__).parent / "arxiv_cache"
+
+
+def _is_cached(arxiv_id: str) -> bool:
+    """PDFとメタデータの両方がキャッシュ済みか確認"""
+    name = arxiv_id.replace("/", "_")
+    return (
+        (ARXIV_CACHE_DIR / "pdfs" / f"{name}.pdf").exists()
+        and (ARXIV_CACHE_DIR / "metadata" / f"{name}.json").exists()
+    )
+
+
+def ensure_arxiv_cache(arxiv_ids: list[str]) -> Path:
+    """指定論文をキャッシュに用意する
+
+    未キャッシュの論文のみarXivから取得します。
+    取得に失敗した場合は警告のみ出力し、テスト側の通常のダウンロードに任せます。
+
+    Args:
+        arxiv_ids: キャッシュする論文IDリスト
+
+    Returns:
+        Path: キャッシュディレクトリ（PaperServiceのcache_dirとしてそのまま使用可能）
+    """
+    missing = [arxiv_id for arxiv_id in arxiv_ids if not _is_cached(arxiv_id)]
+    if not missing:
+        return ARXIV_CACHE_DIR
+
+    service = PaperService(
+        arxiv_client=ArxivClient(cache_dir=ARXIV_CACHE_DIR / "pdfs"),
+        cache_dir=ARXIV_CACHE_DIR
+    )
+
+    async def fetch() -> None:
+        for arxiv_id in missing:
+            try:
+                metadata = await service.get_metadata(arxiv_id)
+                await service.download_pdf(arxiv_id, metadata.pdf_url)
+            except PaperServiceError as e:
+                logger.warning(f"Failed to cache arXiv paper {arxiv_id}: {e}")
+
+    asyncio.run(fetch())
+    return ARXIV_CACHE_DIR
+
+
+# 合成PDFの本文（IMRaD構造のセクション見出しを含む）
+_SYNTHETIC_SECTIONS = {
+    "Abstract": "This paper studies {topic}. We summarize the problem and our approach.",
+    "Introduction": "We introduce the background of {topic} and motivate the study.",
+    "Methods": "We describe the method used to analyze {topic} in detail.",
+    "Results": "We report the results obtained for {topic} and compare them with baselines.",
+    "Discussion": "We discuss the implications and limitations of our findings on {topic}.",
+}
+
+
+def _escape_pdf_text(text: str) -> str:
+    """PDF文字列リテラル用のエスケープ"""
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def build_synthetic_pdf(arxiv_id: str) -> bytes:
+    """テキスト抽出可能な1ページのPDFを生成
+
+    pypdfで本文を抽出でき、RAGのチャンク分割・セクション判定が動作する程度の
+    内容を持つ最小構成のPDFを返します。
+
+    Args:
+        arxiv_id: 本文に埋め込む論文ID
+
+    Returns:
+        bytes: PDFファイルの内容
+    """
+    topic = f"paper {arxiv_id}"
+    lines = [f"Synthetic Paper {arxiv_id}", ""]
+    for heading, sentence in _SYNTHETIC_SECTIONS.items():
+        lines.append(heading)
+        lines.extend([sentence.format(topic=topic)] * 20)
+        lines.append("")
+
+    text_ops = "".join(f"({_escape_pdf_text(line)}) Tj T* " for line in lines)
+    content = f"BT /F1 9 Tf 11 TL 50 780 Td {text_ops}ET".encode("latin-1")
+
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Contents 4 0 R /Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length " + str(len(content)).encode() + b" >>\nstream\n" + content + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+
+    xref_offset = len(pdf)
+    pdf += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        pdf += f"{offset:010d} 00000 n \n".encode()
+    pdf += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref_offset}\n%%EOF\n"
+    ).encode()
+
+    return bytes(pdf)
+
+
+class FixtureArxivClient:
+    """ネットワークにアクセスしないArxivClient互換クラス
+
+    arxiv_cacheにある論文はそのファイルを返し、
+    無い論文は合成したメタデータ・PDFを返します。
+    src.api.main.ArxivClient をこのクラスでパッチして使用します。
+    """
+
+    def __init__(self, cache_dir: Path = Path("./cache/pdfs"), **kwargs):
+        """
+        Args:
+            cache_dir: PDFの保存先（ArxivClientと同じ）
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    async def search_papers(self, query: str, max_results: int = 10) -> list[PaperMetadata]:
+        """検索は常に空の結果を返す"""
+        return []
+
+    async def get_metadata(self, arxiv_id: str) -> PaperMetadata:
+        """合成メタデータを返す
+
+        キャッシュ済みのメタデータはPaperServiceが先に読み込むため、
+        ここに到達するのはキャッシュに無い論文のみです。
+        """
+        return PaperMetadata(
+            arxiv_id=arxiv_id,
+            title=f"Synthetic Paper {arxiv_id}",
+            authors=["Fixture Author"],
+            abstract=_SYNTHETIC_SECTIONS["Abstract"].format(topic=f"paper {arxiv_id}"),
+            year=2007,
+            categories=["cs.AI"],
+            pdf_url=f"https://arxiv.org/pdf/{arxiv_id}.pdf",
+            published_date=datetime(2007, 1, 1)
+        )
+
+    async def download_pdf(self, arxiv_id: str, pdf_url: Optional[str] = None) -> Path:
+        """キャッシュ済みPDFをコピーし、無ければ合成PDFを書き出す"""
+        name = f"{arxiv_id.replace('/', '_')}.pdf"
+        pdf_path = self.cache_dir / name
+        if pdf_path.exists():
+            return pdf_path
+
+        cached_pdf = ARXIV_CACHE_DIR / "pdfs" / name
+        if cached_pdf.exists():
+            shutil.copyfile(cached_pdf, pdf_path)
+        else:
+            pdf_path.write_bytes(build_synthetic_pdf(arxiv_id))
+        return pdf_path
+
+    async def aclose(self) -> None:
+        """HTTPクライアントを持たないため何もしない"""
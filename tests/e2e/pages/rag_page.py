@@ -8,7 +8,7 @@ Requirements: 4.1, 4.2, 4.3, 4.4, 4.5
 """
 from typing import List, Optional
 
-from playwright.sync_api import Page
+from playwright.sync_api import Locator, Page
 
 from tests.e2e.pages.base_page import BasePage
 
@@ -42,6 +42,9 @@ class RAGPage(BasePage):
             >>> rag.navigate()
             >>> assert rag.is_element_visible(rag.question_input_selector)
         """
+        # ページ遷移で要素が作り直されるため、キャッシュしたロケーターを破棄
+        self._invalidate_locators()
+        
         # まずホームページに移動
         self.page.goto(self.base_url)
         self.wait_for_load()
@@ -115,6 +118,40 @@ class RAGPage(BasePage):
         # サイドバー要素
         self.sidebar_selector = "[data-testid='stSidebar']"
         self.top_k_slider_selector = "input[type='range']"
+        
+        # 繰り返し使うロケーターのキャッシュ（遅延生成）
+        self._question_input: Optional[Locator] = None
+        self._submit_button: Optional[Locator] = None
+    
+    @property
+    def question_input(self) -> Locator:
+        """質問入力フィールドのロケーター（キャッシュ済み）"""
+        if self._question_input is None:
+            self._question_input = self.page.locator(self.question_input_selector).first
+        return self._question_input
+    
+    @property
+    def submit_button(self) -> Locator:
+        """送信ボタンのロケーター（キャッシュ済み）"""
+        if self._submit_button is None:
+            self._submit_button = self.page.locator(self.submit_button_selector).first
+        return self._submit_button
+    
+    def _invalidate_locators(self) -> None:
+        """キャッシュしたロケーターを破棄"""
+        self._question_input = None
+        self._submit_button = None
+    
+    def _wait_loaded(self, timeout: int = 30000) -> None:
+        """RAGページの初期化完了を待機
+
+        Streamlitの初回レンダリングはwait_for_loadのデフォルト（5秒）より
+        長くかかることがあるため、テスト開始前の待機はここに集約します。
+
+        Args:
+            timeout: タイムアウト時間（ミリ秒、デフォルト: 30000）
+        """
+        self.page.wait_for_load_state("networkidle", timeout=timeout)
     
     def ask_question(self, question: str, wait_for_answer: bool = True) -> None:
         """質問を送信
@@ -135,12 +172,10 @@ class RAGPage(BasePage):
             >>> answer = rag.get_answer()
         """
         # 質問入力フィールドに入力
-        question_input = self.page.locator(self.question_input_selector).first
-        question_input.fill(question)
+        self.question_input.fill(question)
         
         # 送信ボタンをクリック
-        submit_button = self.page.locator(self.submit_button_selector).first
-        submit_button.click()
+        self.submit_button.click()
         
         # 回答生成完了まで待機
         if wait_for_answer:
@@ -440,6 +475,8 @@ class RAGPage(BasePage):
             clear_button = self.page.locator(self.clear_button_selector).first
             if clear_button.is_visible(timeout=2000):
                 clear_button.click()
+                # Streamlitの再実行で要素が作り直されるため、キャッシュを破棄
+                self._invalidate_locators()
                 # ページリロード完了を待機
                 self.wait_for_load()
         except Exception as e:
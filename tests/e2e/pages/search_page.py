@@ -6,9 +6,10 @@
 
 Requirements: 3.1, 3.2, 3.3, 3.4, 3.5, 3.6
 """
+import re
 from typing import List, Optional
 
-from playwright.sync_api import Page
+from playwright.sync_api import Locator, Page
 
 from tests.e2e.pages.base_page import BasePage
 
@@ -114,6 +115,9 @@ class SearchPage(BasePage):
         self.success_selector = ".stSuccess"
         self.info_selector = ".stInfo"
         self.error_selector = "[data-testid='stAlert']"
+        
+        # 論文カードのLocator（遅延評価のため検索前に作成しても問題ない）
+        self._results = page.locator(self.paper_card_selector)
     
     def search(self, query: str, max_results: Optional[int] = None, wait_for_results: bool = True) -> None:
         """論文を検索
@@ -238,9 +242,7 @@ class SearchPage(BasePage):
             >>> assert count > 0
         """
         try:
-            # 論文カードを取得
-            cards = self.page.locator(self.paper_card_selector).all()
-            return len(cards)
+            return self._results.count()
         except Exception:
             return 0
     
@@ -495,28 +497,37 @@ class SearchPage(BasePage):
         }
         
         try:
-            # 論文カードを取得
-            cards = self.page.locator(self.paper_card_selector).all()
+            # 全カードのタイトル・著者・メタ情報を1回のevaluateで取得
+            cards = self._results.evaluate_all(
+                """
+                (cards, selectors) => cards.map(card => {
+                    const text = (selector) => {
+                        const el = card.querySelector(selector);
+                        return el && el.getClientRects().length > 0 ? el.innerText : "";
+                    };
+                    return {
+                        title: text(selectors.title),
+                        authors: text(selectors.authors),
+                        meta: text(selectors.meta)
+                    };
+                })
+                """,
+                {
+                    "title": self.paper_title_selector,
+                    "authors": self.paper_authors_selector,
+                    "meta": self.paper_meta_selector
+                }
+            )
             
             if index < len(cards):
                 card = cards[index]
-                
-                # タイトルを取得
-                title_element = card.locator(self.paper_title_selector).first
-                if title_element.is_visible():
-                    metadata["title"] = title_element.inner_text()
-                
-                # 著者を取得
-                authors_element = card.locator(self.paper_authors_selector).first
-                if authors_element.is_visible():
-                    metadata["authors"] = authors_element.inner_text()
+                metadata["title"] = card["title"]
+                metadata["authors"] = card["authors"]
                 
                 # メタデータ（年、arXiv ID）を取得
-                meta_element = card.locator(self.paper_meta_selector).first
-                if meta_element.is_visible():
-                    meta_text = meta_element.inner_text()
+                meta_text = card["meta"]
+                if meta_text:
                     # "📅 2023 | 🆔 2301.00001" から抽出
-                    import re
                     year_match = re.search(r'📅\s*(\d{4})', meta_text)
                     if year_match:
                         metadata["year"] = year_match.group(1)
@@ -554,6 +565,20 @@ class SearchPage(BasePage):
         except Exception as e:
             print(f"Warning: Failed to click PDF link: {e}")
     
+    @property
+    def search_form_locator(self) -> Locator:
+        """サイドバー内の検索入力フィールドのLocator
+        
+        ページ読み込み完了の目印として使用します。
+        networkidleを待つよりも早く、フォームが操作可能になった時点で待機を終えられます。
+        
+        Example:
+            >>> search.search_form_locator.wait_for(state="visible", timeout=15000)
+        """
+        return self.page.locator(
+            f"{self.sidebar_selector} {self.search_input_selector}"
+        ).first
+    
     def is_search_form_visible(self) -> bool:
         """検索フォームが表示されているか確認
         
@@ -564,10 +589,6 @@ class SearchPage(BasePage):
         """
         try:
             # サイドバー内の検索入力フィールドを確認
-            search_input = self.page.locator(
-                f"{self.sidebar_selector} {self.search_input_selector}"
-            ).first
-            
-            return search_input.is_visible(timeout=5000)
+            return self.search_form_locator.is_visible(timeout=5000)
         except Exception:
             return False
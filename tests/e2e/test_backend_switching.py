@@ -12,19 +12,16 @@ Requirements: 12.2, 12.3, 12.8
 
 import pytest
 import os
-from pathlib import Path
-import tempfile
-import shutil
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import patch
 from fastapi.testclient import TestClient
 
 from src.api.main import app
 
 
 @pytest.fixture
-def temp_dirs():
-    """一時的なディレクトリを作成"""
-    temp_base = Path(tempfile.mkdtemp())
+def temp_dirs(tmp_path):
+    """一時的なディレクトリを作成（削除はpytestに任せる）"""
+    temp_base = tmp_path
     dirs = {
         "cache": temp_base / "cache",
         "chroma": temp_base / "chroma",
@@ -33,15 +30,11 @@ def temp_dirs():
     for d in dirs.values():
         d.mkdir(parents=True, exist_ok=True)
     
-    yield dirs
-    
-    # クリーンアップ
-    if temp_base.exists():
-        shutil.rmtree(temp_base)
+    return dirs
 
 
 @pytest.fixture
-def client(temp_dirs, mock_embedding_service, mock_llm_service):
+def client(temp_dirs, mock_api_services):
     """TestClientを作成（デフォルトバックエンド）
     
     実際のAPIエンドポイントを使用し、LLM/Embeddingはモックを使用します。
@@ -56,20 +49,8 @@ def client(temp_dirs, mock_embedding_service, mock_llm_service):
         "EMBEDDING_BACKEND": "gemini"
     }):
         # サービスをモックに置き換え
-        with patch("src.api.main.EmbeddingService") as mock_emb_cls, \
-             patch("src.api.main.LLMService") as mock_llm_cls:
-            
-            # モックサービスを返すように設定
-            mock_emb_instance = MagicMock()
-            mock_emb_instance.load_model = AsyncMock()
-            mock_emb_instance.embed = mock_embedding_service.embed
-            mock_emb_instance.embed_batch = mock_embedding_service.embed_batch
-            mock_emb_cls.return_value = mock_emb_instance
-            
-            mock_llm_instance = MagicMock()
-            mock_llm_instance.load_model = AsyncMock()
-            mock_llm_instance.generate = mock_llm_service.generate
-            mock_llm_cls.return_value = mock_llm_instance
+        with patch("src.api.main.EmbeddingService", return_value=mock_api_services["embedding"]), \
+             patch("src.api.main.LLMService", return_value=mock_api_services["llm"]):
             
             # TestClientを作成
             with TestClient(app) as test_client:
@@ -359,7 +340,7 @@ def test_backend_metadata_preservation(client):
 
 
 @pytest.mark.e2e
-def test_default_backend(temp_dirs, mock_embedding_service, mock_llm_service):
+def test_default_backend(temp_dirs, mock_api_services):
     """デフォルトバックエンドの確認
     
     Requirements: 12.8
@@ -376,19 +357,9 @@ def test_default_backend(temp_dirs, mock_embedding_service, mock_llm_service):
     }
     
     with patch.dict("os.environ", env_vars, clear=True):
-        with patch("src.api.main.EmbeddingService") as mock_emb_cls, \
-             patch("src.api.main.LLMService") as mock_llm_cls:
-            
-            mock_emb_instance = MagicMock()
-            mock_emb_instance.load_model = AsyncMock()
-            mock_emb_instance.embed = mock_embedding_service.embed
-            mock_emb_instance.embed_batch = mock_embedding_service.embed_batch
-            mock_emb_cls.return_value = mock_emb_instance
-            
-            mock_llm_instance = MagicMock()
-            mock_llm_instance.load_model = AsyncMock()
-            mock_llm_instance.generate = mock_llm_service.generate
-            mock_llm_cls.return_value = mock_llm_instance
+        # サービスをモックに置き換え
+        with patch("src.api.main.EmbeddingService", return_value=mock_api_services["embedding"]), \
+             patch("src.api.main.LLMService", return_value=mock_api_services["llm"]):
             
             with TestClient(app) as client:
                 # ヘルスチェック
@@ -43,8 +43,8 @@ def test_capture_on_failure(page: Page):
     assert console_log_path.exists()
     assert network_log_path.exists()
     
-    # スクリーンショットがPNGファイルであることを確認
-    assert screenshot_path.suffix == ".png"
+    # スクリーンショットが画像ファイルであることを確認（既定はJPEG）
+    assert screenshot_path.suffix in (".jpg", ".png")
     assert screenshot_path.stat().st_size > 0
     
     # コンソールログが読み取れることを確認
@@ -5,10 +5,14 @@
 
 Requirements: 5.1, 5.2, 5.3, 5.4, 5.5
 """
+import logging
+
 import pytest
 
 from tests.e2e.pages.papers_page import PapersPage
 
+logger = logging.getLogger(__name__)
+
 
 @pytest.mark.e2e
 @pytest.mark.ui
@@ -35,7 +39,7 @@ def test_papers_page_navigate(page, streamlit_server):
     
     # URLが正しいことを確認（Streamlitは "/" にリダイレクトすることがある）
     current_url = papers.get_current_url()
-    print(f"Navigated to: {current_url}")
+    logger.debug(f"Navigated to: {current_url}")
     
     # Streamlitのマルチページアプリでは、URLが変わらないことがあるため、
     # ページの内容で確認する
@@ -53,8 +57,8 @@ def test_papers_page_is_loaded(page, streamlit_server):
     page.wait_for_timeout(2000)
     
     # デバッグ情報を出力
-    print(f"Current URL: {papers.get_current_url()}")
-    print(f"Page title: {papers.get_page_title()}")
+    logger.debug(f"Current URL: {papers.get_current_url()}")
+    logger.debug(f"Page title: {papers.get_page_title()}")
     
     # ページが読み込まれたことを確認
     assert papers.is_loaded(), "Papers page should be loaded"
@@ -5,17 +5,44 @@ RAG質問応答ページのE2Eテストを提供します。
 
 Requirements: 4.1, 4.2, 4.3, 4.4, 4.5, 4.6, 4.7, 7.3
 """
+import logging
 import time
 
 import pytest
 
 from tests.e2e.pages.rag_page import RAGPage
 
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def rag_loaded(page, streamlit_server) -> RAGPage:
+    """RAGページに遷移済みのPage Object
+
+    各テストで共通のナビゲーションと読み込み待機を行います。
+    分離性を保つため関数スコープです。
+    """
+    rag = RAGPage(page, streamlit_server)
+    rag.navigate("/rag")
+    rag._wait_loaded()
+    return rag
+
+
+@pytest.fixture
+def rag_indexed(rag_loaded) -> RAGPage:
+    """インデックス化済みの論文があるRAGページ
+
+    インデックスが空の場合はテストをスキップします。
+    """
+    if rag_loaded.get_indexed_papers_count() == 0:
+        pytest.skip("Index is empty, cannot test RAG query")
+    return rag_loaded
+
 
 @pytest.mark.e2e
 @pytest.mark.ui
 @pytest.mark.slow
-def test_rag_query(page, streamlit_server, test_data):
+def test_rag_query(rag_indexed, test_data):
     """RAG質問応答が動作する
     
     質問を入力して送信すると、FastAPI /rag/query エンドポイントが呼び出され、
@@ -23,24 +50,15 @@ def test_rag_query(page, streamlit_server, test_data):
     
     Requirements: 4.1, 4.2
     """
-    rag = RAGPage(page, streamlit_server)
-    rag.navigate("/rag")
-    page.wait_for_load_state("networkidle", timeout=30000)
-    
     # RAGページが読み込まれることを確認
-    assert rag.is_loaded(), "RAG page should be loaded"
-    
-    # インデックスが空の場合はスキップ
-    papers_count = rag.get_indexed_papers_count()
-    if papers_count == 0:
-        pytest.skip("Index is empty, cannot test RAG query")
+    assert rag_indexed.is_loaded(), "RAG page should be loaded"
     
     # 質問を送信
-    rag.ask_question(test_data["rag_question"])
+    rag_indexed.ask_question(test_data["rag_question"])
     
     # 回答またはエラーメッセージが表示されることを確認
-    answer = rag.get_answer()
-    error_msg = rag.get_error_message()
+    answer = rag_indexed.get_answer()
+    error_msg = rag_indexed.get_error_message()
     
     # 回答が表示されるか、エラーメッセージが表示されるかのいずれか
     assert len(answer) > 0 or len(error_msg) > 0, \
@@ -50,7 +68,7 @@ def test_rag_query(page, streamlit_server, test_data):
 @pytest.mark.e2e
 @pytest.mark.ui
 @pytest.mark.slow
-def test_rag_answer_display(page, streamlit_server, test_data):
+def test_rag_answer_display(rag_indexed, test_data):
     """回答が正しく表示される
     
     RAG回答がマークダウン形式で表示され、質問テキストも
@@ -58,40 +76,31 @@ def test_rag_answer_display(page, streamlit_server, test_data):
     
     Requirements: 4.2, 4.3
     """
-    rag = RAGPage(page, streamlit_server)
-    rag.navigate("/rag")
-    page.wait_for_load_state("networkidle", timeout=30000)
-    
-    # インデックスが空の場合はスキップ
-    papers_count = rag.get_indexed_papers_count()
-    if papers_count == 0:
-        pytest.skip("Index is empty, cannot test RAG answer display")
-    
     # 質問を送信
-    rag.ask_question(test_data["rag_question"])
+    rag_indexed.ask_question(test_data["rag_question"])
     
     # 回答またはエラーが表示されることを確認
-    has_answer = rag.is_answer_displayed()
-    has_error = len(rag.get_error_message()) > 0
+    has_answer = rag_indexed.is_answer_displayed()
+    has_error = len(rag_indexed.get_error_message()) > 0
     
     assert has_answer or has_error, "Should display answer or error"
     
     if has_answer:
         # 回答テキストを取得
-        answer = rag.get_answer()
+        answer = rag_indexed.get_answer()
         assert len(answer) > 0, "Answer should not be empty"
         
         # 質問テキストが表示されることを確認
-        question = rag.get_question_text()
+        question = rag_indexed.get_question_text()
         # 質問が表示されているか、または入力フィールドに残っているか
-        assert len(question) > 0 or test_data["rag_question"] in page.content(), \
+        assert len(question) > 0 or test_data["rag_question"] in rag_indexed.page.content(), \
             "Question should be displayed or remain in input"
 
 
 @pytest.mark.e2e
 @pytest.mark.ui
 @pytest.mark.slow
-def test_rag_sources_display(page, streamlit_server, test_data):
+def test_rag_sources_display(rag_indexed, test_data):
     """参照元チャンクが表示される
     
     回答生成後、参照元チャンクがエクスパンダーで表示され、
@@ -99,32 +108,23 @@ def test_rag_sources_display(page, streamlit_server, test_data):
     
     Requirements: 4.3, 4.4
     """
-    rag = RAGPage(page, streamlit_server)
-    rag.navigate("/rag")
-    page.wait_for_load_state("networkidle", timeout=30000)
-    
-    # インデックスが空の場合はスキップ
-    papers_count = rag.get_indexed_papers_count()
-    if papers_count == 0:
-        pytest.skip("Index is empty, cannot test RAG sources display")
-    
     # 質問を送信
-    rag.ask_question(test_data["rag_question"])
+    rag_indexed.ask_question(test_data["rag_question"])
     
     # エラーが発生した場合はスキップ
-    if len(rag.get_error_message()) > 0:
+    if len(rag_indexed.get_error_message()) > 0:
         pytest.skip("RAG query failed, cannot test sources display")
     
     # 参照元チャンクが存在することを確認
-    sources_count = rag.get_sources_count()
+    sources_count = rag_indexed.get_sources_count()
     if sources_count == 0:
         pytest.skip("No source chunks returned, cannot test sources display")
     
     # 参照元を展開
-    rag.expand_all_sources()
+    rag_indexed.expand_all_sources()
     
     # チャンク情報を取得
-    chunks = rag.get_source_chunks()
+    chunks = rag_indexed.get_source_chunks()
     assert len(chunks) > 0, "Should have source chunk data"
     
     # 最初のチャンクにテキストとメタデータが含まれることを確認
@@ -136,7 +136,7 @@ def test_rag_sources_display(page, streamlit_server, test_data):
 
 @pytest.mark.e2e
 @pytest.mark.ui
-def test_rag_empty_index_warning(page, streamlit_server):
+def test_rag_empty_index_warning(rag_loaded):
     """インデックスが空の時に警告が表示される
     
     インデックスに論文が登録されていない場合、
@@ -144,29 +144,25 @@ def test_rag_empty_index_warning(page, streamlit_server):
     
     Requirements: 4.6
     """
-    rag = RAGPage(page, streamlit_server)
-    rag.navigate("/rag")
-    page.wait_for_load_state("networkidle", timeout=30000)
-    
     # インデックス化された論文数を確認
-    papers_count = rag.get_indexed_papers_count()
+    papers_count = rag_loaded.get_indexed_papers_count()
     
     # 論文が0件の場合、警告が表示されることを確認
     if papers_count == 0:
-        assert rag.has_warning(), "Should show warning when index is empty"
-        warning_msg = rag.get_warning_message()
+        assert rag_loaded.has_warning(), "Should show warning when index is empty"
+        warning_msg = rag_loaded.get_warning_message()
         assert len(warning_msg) > 0, "Warning message should not be empty"
         assert "インデックス" in warning_msg or "論文" in warning_msg or "空" in warning_msg, \
             f"Warning should mention empty index, got: {warning_msg}"
     else:
         # 論文がある場合は、警告が表示されないことを確認
         # （または警告があっても、空インデックスの警告ではない）
-        print(f"✓ Index has {papers_count} papers, skipping empty index warning test")
+        logger.debug(f"✓ Index has {papers_count} papers, skipping empty index warning test")
 
 
 @pytest.mark.e2e
 @pytest.mark.ui
-def test_rag_error_handling(page, streamlit_server):
+def test_rag_error_handling(rag_loaded):
     """RAGエラーが適切に処理される
     
     無効な入力や空の質問に対して、適切なエラーメッセージが
@@ -174,61 +170,46 @@ def test_rag_error_handling(page, streamlit_server):
     
     Requirements: 4.7
     """
-    rag = RAGPage(page, streamlit_server)
-    rag.navigate("/rag")
-    page.wait_for_load_state("networkidle", timeout=30000)
-    
     # 空の質問を送信（送信ボタンをクリック）
     try:
-        question_input = page.locator("textarea[aria-label='質問']").first
-        question_input.fill("")
-        submit_button = page.locator("button:has-text('質問する')").first
-        submit_button.click()
+        rag_loaded.question_input.fill("")
+        rag_loaded.submit_button.click()
         
         # 短い待機（エラーメッセージが表示されるまで）
-        page.wait_for_timeout(2000)
+        rag_loaded.page.wait_for_timeout(2000)
         
         # エラーメッセージまたは警告が表示されることを確認
-        has_error = len(rag.get_error_message()) > 0
-        has_warning = rag.has_warning()
+        has_error = len(rag_loaded.get_error_message()) > 0
+        has_warning = rag_loaded.has_warning()
         
         # どちらかのメッセージが表示されていればOK
         # （空の質問は、エラーではなく警告として処理される可能性がある）
         # または、何も起こらない（バリデーションで送信がブロックされる）
         # いずれの場合も、システムが適切に動作していることを示す
-        print(f"✓ Empty question handling: error={has_error}, warning={has_warning}")
+        logger.debug(f"✓ Empty question handling: error={has_error}, warning={has_warning}")
     except Exception as e:
         # エラーが発生しても、システムがクラッシュしていなければOK
-        print(f"✓ Empty question handled gracefully: {e}")
+        logger.debug(f"✓ Empty question handled gracefully: {e}")
 
 
 @pytest.mark.e2e
 @pytest.mark.ui
 @pytest.mark.slow
-def test_rag_response_time(page, streamlit_server, test_data):
+def test_rag_response_time(rag_indexed, test_data):
     """RAG応答時間が許容範囲内である
     
     RAG質問応答が30秒以内に完了することを確認します。
     
     Requirements: 7.3
     """
-    rag = RAGPage(page, streamlit_server)
-    rag.navigate("/rag")
-    page.wait_for_load_state("networkidle", timeout=30000)
-    
-    # インデックスが空の場合はスキップ
-    papers_count = rag.get_indexed_papers_count()
-    if papers_count == 0:
-        pytest.skip("Index is empty, cannot test RAG response time")
-    
     # RAG応答時間を計測
     start_time = time.time()
-    rag.ask_question(test_data["rag_question"])
+    rag_indexed.ask_question(test_data["rag_question"])
     response_time = time.time() - start_time
     
     # エラーが発生した場合は、応答時間のみ記録してスキップ
-    if len(rag.get_error_message()) > 0:
-        print(f"✓ RAG query failed in {response_time:.2f}s")
+    if len(rag_indexed.get_error_message()) > 0:
+        logger.debug(f"✓ RAG query failed in {response_time:.2f}s")
         pytest.skip("RAG query failed, cannot measure successful response time")
     
     # 30秒以内に完了することを確認
@@ -236,76 +217,61 @@ def test_rag_response_time(page, streamlit_server, test_data):
     
     # 理想的には15秒以内（警告のみ）
     if response_time >= 15.0:
-        print(f"Warning: RAG query took {response_time:.2f}s (target: < 15.0s)")
+        logger.warning(f"RAG query took {response_time:.2f}s (target: < 15.0s)")
 
 
 @pytest.mark.e2e
 @pytest.mark.ui
-def test_rag_page_loads(page, streamlit_server):
+def test_rag_page_loads(rag_loaded):
     """RAGページが正しく読み込まれる
     
     RAGページにアクセスすると、質問入力フォームが表示されることを確認します。
     
     Requirements: 4.1
     """
-    rag = RAGPage(page, streamlit_server)
-    rag.navigate("/rag")
-    
-    # Wait for Streamlit to fully initialize
-    page.wait_for_load_state("networkidle", timeout=30000)
-    
     # Additional wait for Streamlit to render
-    page.wait_for_timeout(3000)
+    rag_loaded.page.wait_for_timeout(3000)
     
     # ページタイトルを確認
-    page_title = page.title()
+    page_title = rag_loaded.page.title()
     assert "rag" in page_title.lower(), f"Page title should contain 'rag', got: {page_title}"
     
     # Check that we're on the RAG page by verifying the URL
-    current_url = page.url
+    current_url = rag_loaded.page.url
     assert "/rag" in current_url, f"URL should contain '/rag', got: {current_url}"
 
 
 @pytest.mark.e2e
 @pytest.mark.ui
 @pytest.mark.slow
-def test_rag_with_context(page, streamlit_server):
+def test_rag_with_context(rag_indexed):
     """コンテキストを含むRAG質問が動作する
     
     より具体的な質問を送信すると、適切な回答が生成されることを確認します。
     
     Requirements: 4.1, 4.2, 4.3
     """
-    rag = RAGPage(page, streamlit_server)
-    rag.navigate("/rag")
-    page.wait_for_load_state("networkidle", timeout=30000)
-    
-    # インデックスが空の場合はスキップ
-    papers_count = rag.get_indexed_papers_count()
-    if papers_count == 0:
-        pytest.skip("Index is empty, cannot test RAG with context")
-    
     # より具体的な質問を送信
     specific_question = "論文で提案されている手法の利点は何ですか？"
-    rag.ask_question(specific_question)
+    rag_indexed.ask_question(specific_question)
     
     # エラーが発生した場合はスキップ
-    if len(rag.get_error_message()) > 0:
+    if len(rag_indexed.get_error_message()) > 0:
         pytest.skip("RAG query failed, cannot test with context")
     
     # 回答が表示されることを確認
-    answer = rag.get_answer()
+    answer = rag_indexed.get_answer()
     assert len(answer) > 0, "Should have an answer for specific question"
     
     # 参照元が表示されることを確認
-    sources_count = rag.get_sources_count()
+    sources_count = rag_indexed.get_sources_count()
     assert sources_count > 0, "Should have source chunks for specific question"
 
 
 @pytest.mark.e2e
 @pytest.mark.ui
 @pytest.mark.slow
-def test_rag_multiple_questions(page, streamlit_server, test_data):
+def test_rag_multiple_questions(rag_indexed, test_data):
     """複数の質問を連続して送信できる
     
     複数の質問を連続して送信し、それぞれに対して回答が
@@ -313,51 +279,42 @@ def test_rag_multiple_questions(page, streamlit_server, test_data):
     
     Requirements: 4.1, 4.2
     """
-    rag = RAGPage(page, streamlit_server)
-    rag.navigate("/rag")
-    page.wait_for_load_state("networkidle", timeout=30000)
-    
-    # インデックスが空の場合はスキップ
-    papers_count = rag.get_indexed_papers_count()
-    if papers_count == 0:
-        pytest.skip("Index is empty, cannot test multiple questions")
-    
     # 最初の質問
-    rag.ask_question(test_data["rag_question"])
+    rag_indexed.ask_question(test_data["rag_question"])
     
     # エラーが発生した場合はスキップ
-    if len(rag.get_error_message()) > 0:
+    if len(rag_indexed.get_error_message()) > 0:
         pytest.skip("First RAG query failed, cannot test multiple questions")
     
-    first_answer = rag.get_answer()
+    first_answer = rag_indexed.get_answer()
     assert len(first_answer) > 0, "Should have first answer"
     
     # 結果をクリア
-    rag.clear_results()
+    rag_indexed.clear_results()
     
     # 2番目の質問
     second_question = "論文の実験結果はどうでしたか？"
-    rag.ask_question(second_question)
+    rag_indexed.ask_question(second_question)
     
     # エラーが発生した場合はスキップ
-    if len(rag.get_error_message()) > 0:
+    if len(rag_indexed.get_error_message()) > 0:
         pytest.skip("Second RAG query failed")
     
-    second_answer = rag.get_answer()
+    second_answer = rag_indexed.get_answer()
     assert len(second_answer) > 0, "Should have second answer"
     
     # 2つの回答が異なることを確認（同じ質問でない限り）
     if test_data["rag_question"] != second_question:
         # 回答が完全に同じでないことを確認（異なる質問なので）
         # ただし、同じ論文から引用される可能性があるため、厳密には比較しない
-        print(f"✓ First answer length: {len(first_answer)}")
-        print(f"✓ Second answer length: {len(second_answer)}")
+        logger.debug(f"✓ First answer length: {len(first_answer)}")
+        logger.debug(f"✓ Second answer length: {len(second_answer)}")
 
 
 @pytest.mark.e2e
 @pytest.mark.ui
 @pytest.mark.slow
-def test_rag_source_metadata(page, streamlit_server, test_data):
+def test_rag_source_metadata(rag_indexed, test_data):
     """参照元メタデータが正しく表示される
     
     参照元チャンクのメタデータ（論文ID、セクション、チャンクID）が
@@ -365,31 +322,22 @@ def test_rag_source_metadata(page, streamlit_server, test_data):
     
     Requirements: 4.4
     """
-    rag = RAGPage(page, streamlit_server)
-    rag.navigate("/rag")
-    page.wait_for_load_state("networkidle", timeout=30000)
-    
-    # インデックスが空の場合はスキップ
-    papers_count = rag.get_indexed_papers_count()
-    if papers_count == 0:
-        pytest.skip("Index is empty, cannot test source metadata")
-    
     # 質問を送信
-    rag.ask_question(test_data["rag_question"])
+    rag_indexed.ask_question(test_data["rag_question"])
     
     # エラーが発生した場合はスキップ
-    if len(rag.get_error_message()) > 0:
+    if len(rag_indexed.get_error_message()) > 0:
         pytest.skip("RAG query failed, cannot test source metadata")
     
     # 参照元が存在しない場合はスキップ
-    if rag.get_sources_count() == 0:
+    if rag_indexed.get_sources_count() == 0:
         pytest.skip("No source chunks returned, cannot test metadata")
     
     # 参照元を展開
-    rag.expand_all_sources()
+    rag_indexed.expand_all_sources()
     
     # チャンク情報を取得
-    chunks = rag.get_source_chunks()
+    chunks = rag_indexed.get_source_chunks()
     assert len(chunks) > 0, "Should have source chunks"
     
     # 最初のチャンクのメタデータを確認
@@ -409,20 +357,16 @@ def test_rag_source_metadata(page, streamlit_server, test_data):
 
 @pytest.mark.e2e
 @pytest.mark.ui
-def test_rag_top_k_setting(page, streamlit_server, test_data):
+def test_rag_top_k_setting(rag_loaded, test_data):
     """取得チャンク数の設定が動作する
     
     サイドバーで取得チャンク数を設定できることを確認します。
     
     Requirements: 4.1
     """
-    rag = RAGPage(page, streamlit_server)
-    rag.navigate("/rag")
-    page.wait_for_load_state("networkidle", timeout=30000)
-    
     # 取得チャンク数を設定
-    rag.set_top_k(5)
+    rag_loaded.set_top_k(5)
     
     # 設定が反映されることを確認（質問を送信して確認）
     # 注: 実際のチャンク数は、インデックスの内容によって異なる可能性がある
-    print("✓ Top-k setting applied (verification requires actual query)")
+    logger.debug("✓ Top-k setting applied (verification requires actual query)")
@@ -12,6 +12,12 @@ import pytest
 from tests.e2e.pages.search_page import SearchPage
 
 
+@pytest.fixture
+def page(reused_page):
+    """ブラウザ・コンテキストを毎テスト起動せず、モジュール内で1つのページを再利用する"""
+    return reused_page
+
+
 @pytest.mark.e2e
 @pytest.mark.ui
 def test_search_papers(page, streamlit_server, test_data):
@@ -25,7 +31,7 @@ def test_search_papers(page, streamlit_server, test_data):
     """
     search = SearchPage(page, streamlit_server)
     search.navigate("/search")
-    page.wait_for_load_state("networkidle", timeout=30000)
+    search.search_form_locator.wait_for(state="visible", timeout=15000)
     
     # 検索フォームが表示されることを確認
     assert search.is_search_form_visible(), "Search form should be visible"
@@ -54,7 +60,7 @@ def test_search_results_display(page, streamlit_server, test_data):
     """
     search = SearchPage(page, streamlit_server)
     search.navigate("/search")
-    page.wait_for_load_state("networkidle", timeout=30000)
+    search.search_form_locator.wait_for(state="visible", timeout=15000)
     
     # 論文を検索
     search.search(test_data["search_query"], max_results=5)
@@ -90,7 +96,7 @@ def test_download_paper(page, streamlit_server, test_data):
     """
     search = SearchPage(page, streamlit_server)
     search.navigate("/search")
-    page.wait_for_load_state("networkidle", timeout=30000)
+    search.search_form_locator.wait_for(state="visible", timeout=15000)
     
     # 論文を検索
     search.search(test_data["search_query"], max_results=5)
@@ -124,7 +130,7 @@ def test_search_error_handling(page, streamlit_server):
     """
     search = SearchPage(page, streamlit_server)
     search.navigate("/search")
-    page.wait_for_load_state("networkidle", timeout=30000)
+    search.search_form_locator.wait_for(state="visible", timeout=15000)
     
     # 空の検索を実行
     search.search("", wait_for_results=True)
@@ -154,7 +160,7 @@ def test_empty_search(page, streamlit_server):
     """
     search = SearchPage(page, streamlit_server)
     search.navigate("/search")
-    page.wait_for_load_state("networkidle", timeout=30000)
+    search.search_form_locator.wait_for(state="visible", timeout=15000)
     
     # 空の検索を実行
     search.search("", wait_for_results=True)
@@ -179,7 +185,7 @@ def test_search_response_time(page, streamlit_server, test_data):
     """
     search = SearchPage(page, streamlit_server)
     search.navigate("/search")
-    page.wait_for_load_state("networkidle", timeout=30000)
+    search.search_form_locator.wait_for(state="visible", timeout=15000)
     
     # 検索時間を計測
     start_time = time.time()
@@ -207,11 +213,8 @@ def test_search_form_visible(page, streamlit_server):
     # Streamlit multi-page apps use: /search (without the number prefix)
     search.navigate("/search")
     
-    # Wait for Streamlit to fully initialize
-    page.wait_for_load_state("networkidle", timeout=30000)
-    
-    # Additional wait for Streamlit to render
-    page.wait_for_timeout(3000)
+    # 検索フォームの描画完了を待機
+    search.search_form_locator.wait_for(state="visible", timeout=15000)
     
     # ページタイトルを確認
     page_title = page.title()
@@ -233,7 +236,7 @@ def test_multiple_search_results(page, streamlit_server):
     """
     search = SearchPage(page, streamlit_server)
     search.navigate("/search")
-    page.wait_for_load_state("networkidle", timeout=30000)
+    search.search_form_locator.wait_for(state="visible", timeout=15000)
     
     # 一般的なキーワードで検索
     search.search("transformer", max_results=10)
@@ -263,7 +266,7 @@ def test_search_with_max_results(page, streamlit_server):
     """
     search = SearchPage(page, streamlit_server)
     search.navigate("/search")
-    page.wait_for_load_state("networkidle", timeout=30000)
+    search.search_form_locator.wait_for(state="visible", timeout=15000)
     
     # 最大取得件数を3に設定して検索
     max_results = 3
@@ -4,18 +4,57 @@
 Requirements: 8.3, 8.4, 10.1, 10.2, 10.3
 """
 import json
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 from playwright.sync_api import Page
 
+try:
+    import orjson
+except ImportError:  # orjsonは任意依存。未インストール時は標準jsonで書き出す
+    orjson = None
+
+
+# ページ状態をまとめて取得するスクリプト
+# コンソールログ・ネットワークログの両方で使う値を1回のevaluateで返す
+_PAGE_STATE_SCRIPT = """
+    () => {
+        const perfData = window.performance.getEntriesByType('navigation')[0];
+        return {
+            visibility: document.visibilityState,
+            ready: document.readyState,
+            title: document.title,
+            url: location.href,
+            perf: perfData ? {
+                domContentLoaded: perfData.domContentLoadedEventEnd - perfData.domContentLoadedEventStart,
+                loadComplete: perfData.loadEventEnd - perfData.loadEventStart,
+                domInteractive: perfData.domInteractive,
+                responseEnd: perfData.responseEnd
+            } : null
+        };
+    }
+"""
+
+
+def collect_page_state(page: Page) -> dict[str, Any]:
+    """ページの状態情報を1回のevaluateで取得
+    
+    Args:
+        page: Playwright page object
+    
+    Returns:
+        dict: visibility, ready, title, url, perf（Performance APIの値、取得できない場合None）
+    """
+    return page.evaluate(_PAGE_STATE_SCRIPT)
+
 
 def capture_on_failure(page: Page, test_name: str) -> dict[str, str]:
     """テスト失敗時にスクリーンショットとログを保存
     
     テストが失敗した際に、デバッグに必要な情報を保存します：
-    - スクリーンショット
+    - スクリーンショット（ビューポートのJPEG。E2E_FULL_PAGE_SCREENSHOT=1でページ全体のPNG）
     - ブラウザコンソールログ
     - ネットワークログ
     
@@ -39,16 +78,28 @@ def capture_on_failure(page: Page, test_name: str) -> dict[str, str]:
     base_name = f"{test_name}_{timestamp}"
     
     # スクリーンショット保存
-    screenshot_path = results_dir / f"{base_name}.png"
-    page.screenshot(path=str(screenshot_path), full_page=True)
+    # 既定はビューポートのみのJPEG（PNGのページ全体描画より大幅に速く小さい）
+    # E2E_FULL_PAGE_SCREENSHOT=1 でページ全体のPNGに切り替え
+    if os.getenv("E2E_FULL_PAGE_SCREENSHOT") == "1":
+        screenshot_path = results_dir / f"{base_name}.png"
+        page.screenshot(path=str(screenshot_path), full_page=True)
+    else:
+        screenshot_path = results_dir / f"{base_name}.jpg"
+        page.screenshot(path=str(screenshot_path), full_page=False, type="jpeg", quality=70)
+    
+    # ページ状態はまとめて1回だけ取得し、各ログで共有
+    try:
+        state = collect_page_state(page)
+    except Exception:
+        state = None
     
     # コンソールログ保存
     console_log_path = results_dir / f"{base_name}_console.log"
-    console_logs = save_console_logs(page, str(console_log_path))
+    save_console_logs(page, str(console_log_path), state=state)
     
     # ネットワークログ保存
     network_log_path = results_dir / f"{base_name}_network.json"
-    network_logs = save_network_logs(page, str(network_log_path))
+    save_network_logs(page, str(network_log_path), state=state)
     
     return {
         "screenshot": str(screenshot_path),
@@ -57,7 +108,11 @@ def capture_on_failure(page: Page, test_name: str) -> dict[str, str]:
     }
 
 
-def save_console_logs(page: Page, log_path: str) -> list[str]:
+def save_console_logs(
+    page: Page,
+    log_path: str,
+    state: Optional[dict[str, Any]] = None
+) -> list[str]:
     """ブラウザコンソールログを保存
     
     ブラウザのコンソールに出力されたログを保存します。
@@ -67,6 +122,7 @@ def save_console_logs(page: Page, log_path: str) -> list[str]:
     Args:
         page: Playwright page object
         log_path: ログファイルのパス
+        state: collect_page_stateの結果（省略時はこの関数内で取得）
     
     Returns:
         list: コンソールログのリスト
@@ -74,9 +130,12 @@ def save_console_logs(page: Page, log_path: str) -> list[str]:
     logs = []
     
     try:
+        if state is None:
+            state = collect_page_state(page)
+        
         # ページのタイトルとURL
-        logs.append(f"Page Title: {page.title()}")
-        logs.append(f"Page URL: {page.url}")
+        logs.append(f"Page Title: {state['title']}")
+        logs.append(f"Page URL: {state['url']}")
         logs.append("")
         
         # コンソールメッセージを取得（page fixtureで収集されたもの）
@@ -93,12 +152,10 @@ def save_console_logs(page: Page, log_path: str) -> list[str]:
         logs.append("=== Page State ===")
         
         # ページの可視性状態
-        is_visible = page.evaluate("() => document.visibilityState")
-        logs.append(f"Visibility State: {is_visible}")
+        logs.append(f"Visibility State: {state['visibility']}")
         
         # ページのreadyState
-        ready_state = page.evaluate("() => document.readyState")
-        logs.append(f"Ready State: {ready_state}")
+        logs.append(f"Ready State: {state['ready']}")
         
     except Exception as e:
         logs.append(f"Error collecting page state: {e}")
@@ -110,7 +167,11 @@ def save_console_logs(page: Page, log_path: str) -> list[str]:
     return logs
 
 
-def save_network_logs(page: Page, log_path: str) -> list[dict[str, Any]]:
+def save_network_logs(
+    page: Page,
+    log_path: str,
+    state: Optional[dict[str, Any]] = None
+) -> list[dict[str, Any]]:
     """ネットワークログを保存
     
     ページで発生したネットワークリクエストとレスポンスを保存します。
@@ -120,6 +181,7 @@ def save_network_logs(page: Page, log_path: str) -> list[dict[str, Any]]:
     Args:
         page: Playwright page object
         log_path: ログファイルのパス
+        state: collect_page_stateの結果（省略時はこの関数内で取得）
     
     Returns:
         list: ネットワークログのリスト
@@ -132,29 +194,19 @@ def save_network_logs(page: Page, log_path: str) -> list[dict[str, Any]]:
     network_info = []
     
     try:
+        if state is None:
+            state = collect_page_state(page)
+        
         # ページのURL
         network_info.append({
             "type": "page_info",
-            "url": page.url,
-            "title": page.title(),
+            "url": state["url"],
+            "title": state["title"],
             "timestamp": datetime.now().isoformat()
         })
         
-        # Performance API から情報を取得
-        performance_data = page.evaluate("""
-            () => {
-                const perfData = window.performance.getEntriesByType('navigation')[0];
-                if (perfData) {
-                    return {
-                        domContentLoaded: perfData.domContentLoadedEventEnd - perfData.domContentLoadedEventStart,
-                        loadComplete: perfData.loadEventEnd - perfData.loadEventStart,
-                        domInteractive: perfData.domInteractive,
-                        responseEnd: perfData.responseEnd
-                    };
-                }
-                return null;
-            }
-        """)
+        # Performance API から取得した情報
+        performance_data = state["perf"]
         
         if performance_data:
             network_info.append({
@@ -169,7 +221,21 @@ def save_network_logs(page: Page, log_path: str) -> list[dict[str, Any]]:
         })
     
     # ログをJSONファイルに保存
-    with open(log_path, "w", encoding="utf-8") as f:
-        json.dump(network_info, f, indent=2, ensure_ascii=False)
+    _write_json(log_path, network_info)
     
     return network_info
+
+
+def _write_json(path: str, data: Any) -> None:
+    """JSONをUTF-8・インデント2で書き出す
+    
+    orjsonが利用可能であればC実装のエンコーダを使用します。
+    """
+    if orjson is not None:
+        Path(path).write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+        return
+    
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
@@ -3,8 +3,24 @@
 Requirements: Testing Strategy - Mocking Strategy
 """
 
+import copy
+import functools
+import json
+import sys
+import xml.etree.ElementTree as ET
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjsonは任意依存。未インストール時は標準jsonでシリアライズする
+    orjson = None
+
 # arXiv API レスポンスのモック
 ARXIV_SEARCH_RESPONSE = """<?xml version="1.0" encoding="UTF-8"?>
 <feed xmlns="http://www.w3.org/2005/Atom">
@@ -50,6 +66,12 @@ ARXIV_SEARCH_RESPONSE = """<?xml version="1.0" encoding="UTF-8"?>
 </feed>
 """
 
+# テストごとにエンコード・パースしないよう、インポート時に一度だけ変換してキャッシュ
+_ARXIV_SEARCH_BYTES = ARXIV_SEARCH_RESPONSE.encode("utf-8")
+_ARXIV_SEARCH_TREE = ET.fromstring(_ARXIV_SEARCH_BYTES)
+# C14N 2.0で正規化（空白のみのテキストノードを除去）したバイト列
+_ARXIV_SEARCH_CANON = ET.canonicalize(ARXIV_SEARCH_RESPONSE, strip_text=True).encode("utf-8")
+
 
 ARXIV_PAPER_METADATA = {
     "arxiv_id": "2301.00001",
@@ -64,6 +86,12 @@ ARXIV_PAPER_METADATA = {
 }
 
 
+# Gemini/OpenAIの生成レスポンスで共有する回答テキスト
+_SAMPLE_JA_TEXT = sys.intern(
+    "この論文では、機械学習の新しいアプローチを提案しています。提案手法は、深層学習と強化学習を組み合わせることで、従来手法と比較して15%の精度向上を実現しました。"
+)
+
+
 # Gemini API レスポンスのモック
 GEMINI_GENERATE_RESPONSE = {
     "candidates": [
@@ -71,7 +99,7 @@ GEMINI_GENERATE_RESPONSE = {
             "content": {
                 "parts": [
                     {
-                        "text": "この論文では、機械学習の新しいアプローチを提案しています。提案手法は、深層学習と強化学習を組み合わせることで、従来手法と比較して15%の精度向上を実現しました。"
+                        "text": _SAMPLE_JA_TEXT
                     }
                 ],
                 "role": "model"
@@ -84,15 +112,20 @@ GEMINI_GENERATE_RESPONSE = {
 }
 
 
+# ダミーEmbedding（float32の連続配列。バッチは1つの行列を行ごとに共有）
+_MOCK_EMB_768 = np.full(768, 0.1, dtype=np.float32)
+_MOCK_EMB_768_BATCH = np.stack([np.full(768, v, dtype=np.float32) for v in (0.1, 0.2, 0.3)])
+_MOCK_EMB_1536 = np.full(1536, 0.1, dtype=np.float32)  # text-embedding-3-small dimension
+_MOCK_EMB_1536_BATCH = np.stack([np.full(1536, v, dtype=np.float32) for v in (0.1, 0.2, 0.3)])
+
+
 GEMINI_EMBEDDING_RESPONSE = {
-    "embedding": [0.1] * 768  # 768次元のダミーEmbedding
+    "embedding": _MOCK_EMB_768  # 768次元のダミーEmbedding
 }
 
 
 GEMINI_BATCH_EMBEDDING_RESPONSE = [
-    {"embedding": [0.1] * 768},
-    {"embedding": [0.2] * 768},
-    {"embedding": [0.3] * 768}
+    {"embedding": row} for row in _MOCK_EMB_768_BATCH
 ]
 
 
@@ -107,7 +140,7 @@ OPENAI_CHAT_COMPLETION_RESPONSE = {
             "index": 0,
             "message": {
                 "role": "assistant",
-                "content": "この論文では、機械学習の新しいアプローチを提案しています。提案手法は、深層学習と強化学習を組み合わせることで、従来手法と比較して15%の精度向上を実現しました。"
+                "content": _SAMPLE_JA_TEXT
             },
             "finish_reason": "stop"
         }
@@ -125,7 +158,7 @@ OPENAI_EMBEDDING_RESPONSE = {
     "data": [
         {
             "object": "embedding",
-            "embedding": [0.1] * 1536,  # text-embedding-3-small dimension
+            "embedding": _MOCK_EMB_1536,
             "index": 0
         }
     ],
@@ -142,19 +175,10 @@ OPENAI_BATCH_EMBEDDING_RESPONSE = {
     "data": [
         {
             "object": "embedding",
-            "embedding": [0.1] * 1536,
-            "index": 0
-        },
-        {
-            "object": "embedding",
-            "embedding": [0.2] * 1536,
-            "index": 1
-        },
-        {
-            "object": "embedding",
-            "embedding": [0.3] * 1536,
-            "index": 2
+            "embedding": row,
+            "index": i
         }
+        for i, row in enumerate(_MOCK_EMB_1536_BATCH)
     ],
     "model": "text-embedding-3-small",
     "usage": {
@@ -165,146 +189,77 @@ OPENAI_BATCH_EMBEDDING_RESPONSE = {
 
 
 # サンプルPDFテキスト（IMRaD構造）
-SAMPLE_PDF_TEXT = """
-Example Paper: A Novel Approach to Machine Learning
-
-Alice Smith, Bob Johnson, Carol Williams
-Department of Computer Science, Example University
-
-Abstract
-This paper presents a novel approach to machine learning that improves accuracy by 15%.
-We combine deep learning with reinforcement learning to create a more robust algorithm.
-Experiments on three benchmark datasets demonstrate the effectiveness of our approach.
-
-1. Introduction
-Machine learning has become increasingly important in recent years. However, existing
-approaches have limitations in handling complex, high-dimensional data. This paper
-addresses these limitations by proposing a new algorithm that combines the strengths
-of deep learning and reinforcement learning.
-
-The main contributions of this paper are:
-- A novel algorithm that combines deep learning and reinforcement learning
-- Comprehensive experiments on three benchmark datasets
-- Analysis of the algorithm's performance and scalability
-
-2. Related Work
-Previous work in machine learning has focused on either deep learning or reinforcement
-learning separately. Smith et al. (2020) proposed a deep learning approach that achieved
-good results on image classification tasks. Johnson et al. (2021) developed a reinforcement
-learning method for sequential decision making.
-
-3. Methods
-We propose a new algorithm that consists of three main components:
-
-3.1 Feature Extraction
-The feature extraction component uses a convolutional neural network (CNN) to extract
-high-level features from raw input data. The CNN architecture consists of 5 convolutional
-layers followed by 2 fully connected layers.
-
-3.2 Policy Learning
-The policy learning component uses a reinforcement learning algorithm to learn an optimal
-policy based on the extracted features. We use the Proximal Policy Optimization (PPO)
-algorithm with a learning rate of 0.001.
-
-3.3 Reward Optimization
-The reward optimization component adjusts the reward function dynamically based on the
-current performance. This allows the algorithm to adapt to different tasks and datasets.
-
-4. Results
-We evaluated our algorithm on three benchmark datasets: MNIST, CIFAR-10, and ImageNet.
-
-4.1 MNIST Results
-On the MNIST dataset, our algorithm achieved 99.2% accuracy, which is 2% higher than
-the baseline deep learning approach.
-
-4.2 CIFAR-10 Results
-On CIFAR-10, we achieved 92.5% accuracy, representing a 5% improvement over the baseline.
-
-4.3 ImageNet Results
-On ImageNet, our algorithm achieved 78.3% top-1 accuracy and 94.1% top-5 accuracy,
-which is 8% higher than the baseline for top-1 accuracy.
-
-5. Discussion
-The results demonstrate the effectiveness of our approach across different types of datasets.
-The improvement is particularly significant on complex datasets like ImageNet, where the
-combination of deep learning and reinforcement learning provides substantial benefits.
-
-5.1 Computational Efficiency
-Our algorithm requires approximately 20% more computation time than baseline deep learning
-approaches, but the accuracy improvement justifies this additional cost.
-
-5.2 Scalability
-We tested the algorithm's scalability by varying the dataset size and model complexity.
-The results show that the algorithm scales well to large datasets and complex models.
-
-6. Conclusion
-We presented a novel approach to machine learning that combines deep learning with
-reinforcement learning. The proposed algorithm achieves significant accuracy improvements
-on three benchmark datasets. Future work will explore applications to other domains such
-as natural language processing and robotics.
-
-Acknowledgments
-This work was supported by the National Science Foundation under Grant No. 12345.
-
-References
-[1] Smith, A. et al. (2020). Deep Learning for Image Classification. ICML 2020.
-[2] Johnson, B. et al. (2021). Reinforcement Learning for Sequential Decisions. NeurIPS 2021.
-"""
+@functools.cache
+def sample_pdf_text() -> str:
+    """サンプルPDFテキスト（IMRaD構造）を取得
+
+    インポート時には読み込まず、初回呼び出し時にsample_pdf.txtを一度だけ読み込みます。
+
+    Returns:
+        サンプルPDFテキスト
+    """
+    return (Path(__file__).parent / "sample_pdf.txt").read_text(encoding="utf-8")
 
 
 # サンプルチャンクデータ
-SAMPLE_CHUNKS = [
-    {
-        "text": "This paper presents a novel approach to machine learning that improves accuracy by 15%.",
-        "section": "abstract",
-        "chunk_id": 0,
-        "metadata": {
-            "arxiv_id": "2301.00001",
-            "title": "Example Paper",
-            "year": 2023
-        }
-    },
-    {
-        "text": "Machine learning has become increasingly important in recent years. However, existing approaches have limitations.",
-        "section": "introduction",
-        "chunk_id": 0,
-        "metadata": {
-            "arxiv_id": "2301.00001",
-            "title": "Example Paper",
-            "year": 2023
-        }
-    },
-    {
-        "text": "We propose a new algorithm that combines deep learning with reinforcement learning.",
-        "section": "methods",
-        "chunk_id": 0,
-        "metadata": {
-            "arxiv_id": "2301.00001",
-            "title": "Example Paper",
-            "year": 2023
-        }
-    },
-    {
-        "text": "Our experiments show that the proposed algorithm achieves 15% higher accuracy than baseline methods.",
-        "section": "results",
-        "chunk_id": 0,
-        "metadata": {
-            "arxiv_id": "2301.00001",
-            "title": "Example Paper",
-            "year": 2023
-        }
-    },
-    {
-        "text": "The results demonstrate the effectiveness of our approach. The improvement is particularly significant on complex datasets.",
-        "section": "discussion",
-        "chunk_id": 0,
-        "metadata": {
-            "arxiv_id": "2301.00001",
-            "title": "Example Paper",
-            "year": 2023
+@dataclass(slots=True, frozen=True)
+class MockChunk:
+    """サンプルチャンク（不変レコード）
+
+    論文メタデータはフィールドとして直接持ちます。
+    """
+
+    text: str
+    section: str
+    chunk_id: int
+    arxiv_id: str = "2301.00001"
+    title: str = "Example Paper"
+    year: int = 2023
+
+    def as_dict(self) -> dict[str, Any]:
+        """従来の辞書形式（metadataをネストしたdict）に変換"""
+        return {
+            "text": self.text,
+            "section": self.section,
+            "chunk_id": self.chunk_id,
+            "metadata": {
+                "arxiv_id": self.arxiv_id,
+                "title": self.title,
+                "year": self.year
+            }
         }
-    }
-]
+
+
+SAMPLE_CHUNKS: tuple[MockChunk, ...] = (
+    MockChunk(
+        text="This paper presents a novel approach to machine learning that improves accuracy by 15%.",
+        section="abstract",
+        chunk_id=0
+    ),
+    MockChunk(
+        text="Machine learning has become increasingly important in recent years. However, existing approaches have limitations.",
+        section="introduction",
+        chunk_id=0
+    ),
+    MockChunk(
+        text="We propose a new algorithm that combines deep learning with reinforcement learning.",
+        section="methods",
+        chunk_id=0
+    ),
+    MockChunk(
+        text="Our experiments show that the proposed algorithm achieves 15% higher accuracy than baseline methods.",
+        section="results",
+        chunk_id=0
+    ),
+    MockChunk(
+        text="The results demonstrate the effectiveness of our approach. The improvement is particularly significant on complex datasets.",
+        section="discussion",
+        chunk_id=0
+    )
+)
+
+# 辞書形式のチャンクを必要とするテスト用（チャンクごとに独立したdict）
+SAMPLE_CHUNKS_MUTABLE = [c.as_dict() for c in SAMPLE_CHUNKS]
 
 
 # エラーレスポンスのモック
@@ -337,53 +292,148 @@ OPENAI_ERROR_RESPONSE = {
 }
 
 
+def _to_json_bytes(value: Any) -> bytes:
+    """JSONバイト列にシリアライズ（numpy配列はリストとして出力）
+
+    orjsonが利用可能であれば、numpy配列を直接シリアライズします。
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    def default(obj: Any) -> Any:
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    return json.dumps(value, default=default).encode("utf-8")
+
+
+# HTTPモックのレスポンスボディ用（インポート時に一度だけシリアライズ）
+# Content-Typeは"application/json"を指定してください
+GEMINI_GENERATE_RESPONSE_BYTES = _to_json_bytes(GEMINI_GENERATE_RESPONSE)
+GEMINI_EMBEDDING_RESPONSE_BYTES = _to_json_bytes(GEMINI_EMBEDDING_RESPONSE)
+GEMINI_BATCH_EMBEDDING_RESPONSE_BYTES = _to_json_bytes(GEMINI_BATCH_EMBEDDING_RESPONSE)
+GEMINI_ERROR_RESPONSE_BYTES = _to_json_bytes(GEMINI_ERROR_RESPONSE)
+OPENAI_CHAT_COMPLETION_RESPONSE_BYTES = _to_json_bytes(OPENAI_CHAT_COMPLETION_RESPONSE)
+OPENAI_EMBEDDING_RESPONSE_BYTES = _to_json_bytes(OPENAI_EMBEDDING_RESPONSE)
+OPENAI_BATCH_EMBEDDING_RESPONSE_BYTES = _to_json_bytes(OPENAI_BATCH_EMBEDDING_RESPONSE)
+OPENAI_ERROR_RESPONSE_BYTES = _to_json_bytes(OPENAI_ERROR_RESPONSE)
+
+
 # ヘルパー関数
-def create_mock_arxiv_result(arxiv_id: str, title: str, authors: list[str]) -> dict[str, Any]:
+def create_mock_arxiv_result(arxiv_id: str, title: str, authors: list[str]) -> Mapping[str, Any]:
     """モックarXiv検索結果を生成
 
+    同じ引数に対してはキャッシュ済みの結果を返すため、結果は読み取り専用です。
+
     Args:
         arxiv_id: arXiv ID
         title: 論文タイトル
         authors: 著者リスト
 
     Returns:
-        モック検索結果
+        モック検索結果（authorsはタプル）
     """
-    return {
+    return _cached_mock_arxiv_result(arxiv_id, title, tuple(authors))
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_mock_arxiv_result(
+    arxiv_id: str,
+    title: str,
+    authors: tuple[str, ...]
+) -> Mapping[str, Any]:
+    """create_mock_arxiv_resultのキャッシュ本体"""
+    arxiv_id = sys.intern(arxiv_id)
+    return MappingProxyType({
         "arxiv_id": arxiv_id,
-        "title": title,
+        "title": sys.intern(title),
         "authors": authors,
         "abstract": f"Abstract for {title}",
         "year": 2023,
-        "categories": ["cs.AI"],
+        "categories": ("cs.AI",),
         "pdf_url": f"https://arxiv.org/pdf/{arxiv_id}.pdf",
         "published_date": "2023-01-01T00:00:00Z"
-    }
+    })
+
+
+def get_arxiv_search_bytes() -> bytes:
+    """arXiv検索レスポンスのUTF-8バイト列を取得
+
+    HTTPモックのレスポンスボディとしてそのまま使用できます。
+
+    Returns:
+        キャッシュ済みのバイト列
+    """
+    return _ARXIV_SEARCH_BYTES
+
 
+def get_canonical_arxiv_xml() -> bytes:
+    """正規化済みのarXiv検索レスポンスを取得
 
-def create_mock_embedding(dimension: int = 768, seed: int = 0) -> list[float]:
+    ARXIV_SEARCH_RESPONSEをC14N 2.0で正規化し、インデント等の空白を
+    除去したバイト列です。HTTPモックのレスポンスボディに使用します。
+
+    Returns:
+        キャッシュ済みのバイト列
+    """
+    return _ARXIV_SEARCH_CANON
+
+
+def get_arxiv_search_tree() -> ET.Element:
+    """パース済みのarXiv検索レスポンスを取得
+
+    キャッシュを汚さないよう、コピーを返します。
+
+    Returns:
+        Atomフィードのルート要素
+    """
+    return copy.deepcopy(_ARXIV_SEARCH_TREE)
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_mock_embedding(dimension: int, seed: int) -> np.ndarray:
+    """(dimension, seed)ごとに一度だけ乱数ベクトルを生成（読み取り専用）"""
+    embedding = np.random.default_rng(seed).random(dimension, dtype=np.float32)
+    embedding.setflags(write=False)
+    return embedding
+
+
+def create_mock_embedding(
+    dimension: int = 768,
+    seed: int = 0,
+    as_list: bool = False
+) -> np.ndarray | list[float]:
     """モックEmbeddingを生成
 
+    同じ(dimension, seed)に対してはキャッシュ済みの配列を返すため、
+    配列は読み取り専用です。変更が必要な場合はコピーしてください。
+
     Args:
         dimension: Embedding次元数
         seed: ランダムシード
+        as_list: Trueの場合はlist[float]で返す
 
     Returns:
-        モックEmbedding
+        モックEmbedding（float32配列、またはリスト）
     """
-    import random
-    random.seed(seed)
-    return [random.random() for _ in range(dimension)]
+    embedding = _cached_mock_embedding(dimension, seed)
+    if as_list:
+        return embedding.tolist()
+    return embedding
 
 
+@functools.lru_cache(maxsize=256)
 def create_mock_search_result(
     chunk_id: str,
     text: str,
     score: float,
     arxiv_id: str = "2301.00001"
-) -> dict[str, Any]:
+) -> Mapping[str, Any]:
     """モック検索結果を生成
 
+    同じ引数に対してはキャッシュ済みの結果を返すため、結果は読み取り専用です。
+
     Args:
         chunk_id: チャンクID
         text: チャンクテキスト
@@ -393,14 +443,14 @@ def create_mock_search_result(
     Returns:
         モック検索結果
     """
-    return {
-        "chunk_id": chunk_id,
+    return MappingProxyType({
+        "chunk_id": sys.intern(chunk_id),
         "text": text,
         "score": score,
-        "metadata": {
-            "arxiv_id": arxiv_id,
+        "metadata": MappingProxyType({
+            "arxiv_id": sys.intern(arxiv_id),
             "title": "Example Paper",
             "year": 2023,
             "section": chunk_id.split("_")[1] if "_" in chunk_id else "unknown"
-        }
-    }
+        })
+    })
@@ -3,93 +3,146 @@
 
 Requirements: 9.1, 9.2, 9.3
 
-このテストはFastAPIのTestClientを使用し、実際のChromaDBを使用します。
+このテストはhttpx.AsyncClient（ASGITransport）を使用し、実際のChromaDBを使用します。
 LLMはモックを使用してテストを高速化します。
+アプリとテストはモジュール共通の単一イベントループ上で実行されます。
 """
 
+import asyncio
+import uuid
+
+import httpx
 import pytest
 import pytest_asyncio
 from pathlib import Path
-import tempfile
-import shutil
-from unittest.mock import AsyncMock, MagicMock, patch
-from fastapi.testclient import TestClient
+from types import SimpleNamespace
+from unittest.mock import patch
+from fastapi import FastAPI
 
-from src.api.main import app
+from src.api.index_holder import index_holder
+from src.api.main import HealthResponse, app, health_check
 from src.clients.chroma_client import ChromaClient
 from src.models.config import ChromaConfig, EmbeddingConfig, LLMConfig
 
 
-@pytest.fixture
-def temp_dirs():
-    """一時的なディレクトリを作成"""
-    temp_base = Path(tempfile.mkdtemp())
+@pytest.fixture(scope="session")
+def _temp_base(tmp_path_factory) -> Path:
+    """セッション共通の一時ディレクトリ（削除はpytestに任せる）"""
+    return tmp_path_factory.mktemp("api_int")
+
+
+@pytest.fixture(scope="module")
+def temp_dirs(_temp_base):
+    """モジュール共通の一時ディレクトリを作成
+
+    ChromaDBはインメモリで動作させるため、永続化ディレクトリは作成しません。
+    """
+    test_base = _temp_base / uuid.uuid4().hex
     dirs = {
-        "cache": temp_base / "cache",
-        "chroma": temp_base / "chroma",
-        "logs": temp_base / "logs"
+        "cache": test_base / "cache"
     }
     for d in dirs.values():
-        d.mkdir(parents=True, exist_ok=True)
-    
-    yield dirs
-    
-    # クリーンアップ
-    if temp_base.exists():
-        shutil.rmtree(temp_base)
+        d.mkdir(parents=True)
 
+    return dirs
 
-@pytest.fixture
-def mock_services(mock_embedding_service, mock_llm_service):
-    """モックサービスを提供"""
+
+@pytest.fixture(scope="module")
+def event_loop():
+    """モジュールスコープのイベントループ
+
+    モジュールスコープのclientとテストが同じループを共有するために必要です。
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="module")
+def api_configs(temp_dirs):
+    """lifespanに渡すテスト用設定（モジュール内で1回だけ生成）
+
+    環境変数経由でconfig_loaderに読ませる代わりに、設定オブジェクトを直接注入します。
+    インメモリChromaはプロセス内で共有されるため、コレクション名で分離します。
+    """
     return {
-        "embedding": mock_embedding_service,
-        "llm": mock_llm_service
+        "chroma": ChromaConfig(
+            collection_name=f"test_api_{uuid.uuid4().hex}",
+            ephemeral=True
+        ),
+        "embedding": EmbeddingConfig(backend="gemini"),
+        "llm": LLMConfig(backend="gemini")
     }
 
 
-@pytest.fixture
-def client(temp_dirs, mock_services):
-    """TestClientを作成
+@pytest_asyncio.fixture(scope="module")
+async def client(temp_dirs, api_configs, mock_api_services):
+    """httpx.AsyncClientを作成
     
     実際のChromaDBを使用し、LLM/Embeddingはモックを使用します。
+    ASGITransportはlifespanを実行しないため、lifespan_contextで
+    サービスを初期化します。lifespanはモジュール内で1回のみ実行し、
+    インデックスはテストごとに_clean_indexでリセットします。
     """
-    # 環境変数を設定
-    with patch.dict("os.environ", {
-        "CHROMA_PERSIST_DIR": str(temp_dirs["chroma"]),
-        "CHROMA_COLLECTION_NAME": "test_api_collection",
-        "CACHE_DIR": str(temp_dirs["cache"]),
-        "LOG_DIR": str(temp_dirs["logs"]),
-        "LLM_BACKEND": "gemini",
-        "EMBEDDING_BACKEND": "gemini"
-    }):
-        # サービスをモックに置き換え
-        with patch("src.api.main.EmbeddingService") as mock_emb_cls, \
-             patch("src.api.main.LLMService") as mock_llm_cls:
-            
-            # モックサービスを返すように設定
-            mock_emb_instance = MagicMock()
-            mock_emb_instance.load_model = AsyncMock()
-            mock_emb_instance.embed = mock_services["embedding"].embed
-            mock_emb_instance.embed_batch = mock_services["embedding"].embed_batch
-            mock_emb_cls.return_value = mock_emb_instance
-            
-            mock_llm_instance = MagicMock()
-            mock_llm_instance.load_model = AsyncMock()
-            mock_llm_instance.generate = mock_services["llm"].generate
-            mock_llm_cls.return_value = mock_llm_instance
-            
-            # TestClientを作成
-            with TestClient(app) as test_client:
-                yield test_client
-
-
-def test_health_endpoint(client):
+    # 設定ローダーとサービスをテスト用に置き換え
+    # （CACHE_DIRのみlifespanが環境変数から直接読み込む）
+    with patch.dict("os.environ", {"CACHE_DIR": str(temp_dirs["cache"])}), \
+         patch("src.api.main.load_chroma_config", return_value=api_configs["chroma"]), \
+         patch("src.api.main.load_embedding_config", return_value=api_configs["embedding"]), \
+         patch("src.api.main.load_llm_config", return_value=api_configs["llm"]), \
+         patch("src.api.main.EmbeddingService", return_value=mock_api_services["embedding"]), \
+         patch("src.api.main.LLMService", return_value=mock_api_services["llm"]):
+        
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as ac:
+                yield ac
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def _clean_index(request):
+    """テスト終了後にインデックスをリセット
+
+    clientを使用しないテストではアプリを起動しません。
+    """
+    yield
+    if "client" not in request.fixturenames:
+        return
+    chroma_client = await index_holder.get()
+    chroma_client.reset()
+
+
+@pytest.fixture(scope="module")
+def health_app() -> FastAPI:
+    """/healthのみを持つ最小アプリ
+
+    lifespanを持たないため、Chroma・Embedding・LLMを初期化しません。
+    """
+    health_only = FastAPI()
+    health_only.add_api_route("/health", health_check, response_model=HealthResponse)
+    return health_only
+
+
+@pytest_asyncio.fixture
+async def health_client(health_app):
+    """最小アプリ用のhttpx.AsyncClient
+
+    health_checkが参照するindex_holderを固定値を返すスタブに置き換えます。
+    フルスタックでの/healthはtest_endpoint_workflowで確認します。
+    """
+    stub_index_holder = SimpleNamespace(is_ready=lambda: True, size=lambda: 0)
+    transport = httpx.ASGITransport(app=health_app)
+    with patch("src.api.main.index_holder", stub_index_holder):
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as ac:
+            yield ac
+
+
+async def test_health_endpoint(health_client):
     """ヘルスチェックエンドポイントのテスト
     
     Requirements: 9.1, 9.2
     """
-    response = client.get("/health")
+    response = await health_client.get("/health")
     
     assert response.status_code == 200
     data = response.json()
@@ -102,13 +155,13 @@ def test_health_endpoint(client):
     assert isinstance(data["index_size"], int)
 
 
-def test_search_papers_endpoint(client):
+async def test_search_papers_endpoint(client):
     """論文検索エンドポイントのテスト
     
     Requirements: 9.3
     """
     # 検索リクエスト
-    response = client.post(
+    response = await client.post(
         "/papers/search",
         json={
             "query": "machine learning",
@@ -126,13 +179,13 @@ def test_search_papers_endpoint(client):
     assert data["count"] <= 5
 
 
-def test_search_papers_validation(client):
+async def test_search_papers_validation(client):
     """論文検索のバリデーションテスト
     
     Requirements: 9.3
     """
     # max_resultsが範囲外
-    response = client.post(
+    response = await client.post(
         "/papers/search",
         json={
             "query": "test",
@@ -143,13 +196,13 @@ def test_search_papers_validation(client):
     assert response.status_code == 422  # Validation error
 
 
-def test_download_paper_endpoint(client):
+async def test_download_paper_endpoint(client):
     """PDF取得エンドポイントのテスト
     
     Requirements: 9.3
     """
     # 実在する論文をダウンロード
-    response = client.post(
+    response = await client.post(
         "/papers/download",
         json={
             "arxiv_id": "0704.0001"
@@ -167,20 +220,20 @@ def test_download_paper_endpoint(client):
     assert "message" in data
 
 
-def test_rag_query_endpoint(client):
+async def test_rag_query_endpoint(client):
     """RAGクエリエンドポイントのテスト
     
     Requirements: 9.3
     """
     # まず論文をインデックス化
-    download_response = client.post(
+    download_response = await client.post(
         "/papers/download",
         json={"arxiv_id": "0704.0001"}
     )
     assert download_response.status_code == 200
     
     # RAGクエリを実行
-    response = client.post(
+    response = await client.post(
         "/rag/query",
         json={
             "question": "What is this paper about?",
@@ -200,16 +253,16 @@ def test_rag_query_endpoint(client):
     assert len(data["sources"]) <= 3
 
 
-def test_rag_query_without_arxiv_ids(client):
+async def test_rag_query_without_arxiv_ids(client):
     """arxiv_idsなしのRAGクエリテスト
     
     Requirements: 9.3
     """
     # 論文をインデックス化
-    client.post("/papers/download", json={"arxiv_id": "0704.0001"})
+    await client.post("/papers/download", json={"arxiv_id": "0704.0001"})
     
     # arxiv_idsを指定せずにクエリ
-    response = client.post(
+    response = await client.post(
         "/rag/query",
         json={
             "question": "What is machine learning?",
@@ -224,13 +277,13 @@ def test_rag_query_without_arxiv_ids(client):
     assert "sources" in data
 
 
-def test_rag_query_validation(client):
+async def test_rag_query_validation(client):
     """RAGクエリのバリデーションテスト
     
     Requirements: 9.3
     """
     # top_kが範囲外
-    response = client.post(
+    response = await client.post(
         "/rag/query",
         json={
             "question": "test",
@@ -241,17 +294,17 @@ def test_rag_query_validation(client):
     assert response.status_code == 422  # Validation error
 
 
-def test_endpoint_workflow(client):
+async def test_endpoint_workflow(client):
     """エンドポイント間の連携テスト
     
     Requirements: 9.1, 9.2, 9.3
     """
     # 1. ヘルスチェック
-    health_response = client.get("/health")
+    health_response = await client.get("/health")
     assert health_response.status_code == 200
     
     # 2. 論文検索
-    search_response = client.post(
+    search_response = await client.post(
         "/papers/search",
         json={"query": "attention mechanism", "max_results": 2}
     )
@@ -261,14 +314,14 @@ def test_endpoint_workflow(client):
     
     # 3. 最初の論文をダウンロード
     arxiv_id = papers[0]["arxiv_id"]
-    download_response = client.post(
+    download_response = await client.post(
         "/papers/download",
         json={"arxiv_id": arxiv_id}
     )
     assert download_response.status_code == 200
     
     # 4. RAGクエリを実行
-    rag_response = client.post(
+    rag_response = await client.post(
         "/rag/query",
         json={
             "question": "What is the main contribution?",
@@ -279,17 +332,17 @@ def test_endpoint_workflow(client):
     assert rag_response.status_code == 200
     
     # 5. ヘルスチェックでインデックスサイズを確認
-    health_response2 = client.get("/health")
+    health_response2 = await client.get("/health")
     assert health_response2.status_code == 200
     assert health_response2.json()["index_size"] > 0
 
 
-def test_error_handling_invalid_arxiv_id(client):
+async def test_error_handling_invalid_arxiv_id(client):
     """無効なarXiv IDのエラーハンドリング
     
     Requirements: 9.3
     """
-    response = client.post(
+    response = await client.post(
         "/papers/download",
         json={"arxiv_id": "invalid_id_12345"}
     )
@@ -298,13 +351,13 @@ def test_error_handling_invalid_arxiv_id(client):
     assert response.status_code in [400, 500, 502]
 
 
-def test_error_handling_empty_index_query(client):
+async def test_error_handling_empty_index_query(client):
     """空のインデックスでのクエリエラーハンドリング
     
     Requirements: 9.3
     """
     # インデックスが空の状態でRAGクエリ
-    response = client.post(
+    response = await client.post(
         "/rag/query",
         json={
             "question": "test question",
@@ -320,26 +373,21 @@ def test_error_handling_empty_index_query(client):
     assert len(data["sources"]) == 0
 
 
-def test_concurrent_requests(client):
+async def test_concurrent_requests(health_client):
     """同時リクエストのテスト
     
+    単一イベントループ上でリクエストを並行処理させます。
+    
     Requirements: 9.1, 9.2
     """
-    import concurrent.futures
-    
-    def make_health_request():
-        return client.get("/health")
-    
     # 10個の同時リクエストを送信
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-        futures = [executor.submit(make_health_request) for _ in range(10)]
-        responses = [f.result() for f in concurrent.futures.as_completed(futures)]
+    responses = await asyncio.gather(*[health_client.get("/health") for _ in range(10)])
     
     # すべてのリクエストが成功することを確認
     assert all(r.status_code == 200 for r in responses)
 
 
-def test_multiple_papers_indexing(client):
+async def test_multiple_papers_indexing(client):
     """複数論文のインデックス化テスト
     
     Requirements: 9.3
@@ -348,19 +396,19 @@ def test_multiple_papers_indexing(client):
     
     # 複数の論文をインデックス化
     for arxiv_id in arxiv_ids:
-        response = client.post(
+        response = await client.post(
             "/papers/download",
             json={"arxiv_id": arxiv_id}
         )
         assert response.status_code == 200
     
     # ヘルスチェックでインデックスサイズを確認
-    health_response = client.get("/health")
+    health_response = await client.get("/health")
     assert health_response.status_code == 200
     assert health_response.json()["index_size"] > 0
     
     # 全論文を対象にRAGクエリ
-    response_all = client.post(
+    response_all = await client.post(
         "/rag/query",
         json={
             "question": "What are these papers about?",
@@ -370,7 +418,7 @@ def test_multiple_papers_indexing(client):
     assert response_all.status_code == 200
     
     # 特定の論文のみを対象にRAGクエリ
-    response_filtered = client.post(
+    response_filtered = await client.post(
         "/rag/query",
         json={
             "question": "What is this paper about?",
@@ -1,27 +1,34 @@
 """arXiv API統合テスト
 
 実際のarXiv APIを使用して、論文検索、メタデータ取得、PDF取得をテストします。
+実APIを使うテストはnetworkマーカー付きで、RUN_NETWORK_TESTS=1の場合のみ実行されます。
+それ以外はモック済みのレスポンスで同じコードパスを検証します。
 
 Requirements: 1.1, 1.4
 """
 
+import asyncio
+
+import httpx
 import pytest
 from pathlib import Path
-import tempfile
-import shutil
+from types import SimpleNamespace
 
 from src.clients.arxiv_client import ArxivClient
 from src.services.paper_service import PaperService
+from tests.fixtures.mock_responses import get_canonical_arxiv_xml
+
+# パス・拡張子の検証用の最小PDF（ヘッダーのみ）
+TINY_PDF_BYTES = b"%PDF"
+
+# 全テストで共有する実在論文ID（arXivの最初の論文）
+CACHED_ARXIV_ID = "0704.0001"
 
 
 @pytest.fixture
-def temp_cache_dir():
-    """一時的なキャッシュディレクトリを作成"""
-    temp_dir = Path(tempfile.mkdtemp())
-    yield temp_dir
-    # クリーンアップ
-    if temp_dir.exists():
-        shutil.rmtree(temp_dir)
+def temp_cache_dir(tmp_path):
+    """一時的なキャッシュディレクトリを作成（削除はpytestに任せる）"""
+    return tmp_path
 
 
 @pytest.fixture
@@ -43,6 +50,95 @@ def paper_service(arxiv_client, temp_cache_dir):
     )
 
 
+@pytest.fixture
+def mock_arxiv(monkeypatch, arxiv_client):
+    """arXiv APIとPDF取得をモックしたArxivClient
+
+    検索・メタデータ取得（arxivライブラリのrequestsセッション）は
+    正規化済みのARXIV_SEARCH_RESPONSEを、PDF取得（httpx）はTINY_PDF_BYTESを返します。
+    送信されたURLはmock_arxiv.requestsに記録されます。
+    """
+    requests_made: list[str] = []
+
+    def fake_session_get(url, **kwargs):
+        requests_made.append(url)
+        return SimpleNamespace(status_code=200, content=get_canonical_arxiv_xml())
+
+    def handle_pdf(request: httpx.Request) -> httpx.Response:
+        requests_made.append(str(request.url))
+        return httpx.Response(200, content=TINY_PDF_BYTES)
+
+    real_async_client = httpx.AsyncClient
+    monkeypatch.setattr(arxiv_client.client._session, "get", fake_session_get)
+    monkeypatch.setattr(
+        httpx,
+        "AsyncClient",
+        lambda **kwargs: real_async_client(transport=httpx.MockTransport(handle_pdf), **kwargs)
+    )
+
+    arxiv_client.requests = requests_made
+    return arxiv_client
+
+
+@pytest.fixture(scope="session")
+def arxiv_cache_dir(tmp_path_factory) -> Path:
+    """セッション共通のキャッシュディレクトリ"""
+    return tmp_path_factory.mktemp("arxiv_cache")
+
+
+@pytest.fixture
+def cached_arxiv_client(arxiv_cache_dir):
+    """セッション共通キャッシュを使用するArxivClient"""
+    return ArxivClient(
+        cache_dir=arxiv_cache_dir / "pdfs",
+        max_retries=3,
+        timeout=30
+    )
+
+
+@pytest.fixture
+def cached_paper_service(cached_arxiv_client, arxiv_cache_dir):
+    """セッション共通キャッシュを使用するPaperService"""
+    return PaperService(
+        arxiv_client=cached_arxiv_client,
+        cache_dir=arxiv_cache_dir
+    )
+
+
+@pytest.fixture(scope="session")
+def cached_0704_0001(arxiv_cache_dir):
+    """0704.0001のPDFとメタデータをセッション中に一度だけ取得
+
+    PDFはArxivClientのキャッシュ、メタデータはPaperServiceのキャッシュに
+    保存されるため、cached_arxiv_client / cached_paper_serviceを使う
+    テストはネットワークにアクセスしません。
+
+    Returns:
+        dict: "arxiv_id"、"pdf_path"、"metadata"
+    """
+    service = PaperService(
+        arxiv_client=ArxivClient(
+            cache_dir=arxiv_cache_dir / "pdfs",
+            max_retries=3,
+            timeout=30
+        ),
+        cache_dir=arxiv_cache_dir
+    )
+
+    async def fetch():
+        pdf_path = await service.download_pdf(CACHED_ARXIV_ID)
+        metadata = await service.get_metadata(CACHED_ARXIV_ID)
+        return pdf_path, metadata
+
+    pdf_path, metadata = asyncio.run(fetch())
+    return {
+        "arxiv_id": CACHED_ARXIV_ID,
+        "pdf_path": pdf_path,
+        "metadata": metadata
+    }
+
+
+@pytest.mark.network
 @pytest.mark.asyncio
 async def test_arxiv_search_papers(arxiv_client):
     """論文検索のテスト（実際のarXiv API使用）"""
@@ -68,14 +164,11 @@ async def test_arxiv_search_papers(arxiv_client):
         assert paper.published_date
 
 
-@pytest.mark.asyncio
-async def test_arxiv_get_metadata(arxiv_client):
+@pytest.mark.network
+def test_arxiv_get_metadata(cached_0704_0001):
     """メタデータ取得のテスト（実際のarXiv API使用）"""
-    # 実在する論文ID（arXivの最初の論文）
-    arxiv_id = "0704.0001"
-    
-    # メタデータを取得
-    paper = await arxiv_client.get_metadata(arxiv_id)
+    arxiv_id = cached_0704_0001["arxiv_id"]
+    paper = cached_0704_0001["metadata"]
     
     # メタデータが正しく取得されることを確認
     assert paper.arxiv_id == arxiv_id
@@ -86,14 +179,10 @@ async def test_arxiv_get_metadata(arxiv_client):
     assert paper.pdf_url
 
 
-@pytest.mark.asyncio
-async def test_arxiv_download_pdf(arxiv_client, temp_cache_dir):
+@pytest.mark.network
+def test_arxiv_download_pdf(cached_0704_0001, arxiv_cache_dir):
     """PDF取得のテスト（実際のarXiv API使用）"""
-    # 実在する論文ID
-    arxiv_id = "0704.0001"
-    
-    # PDFをダウンロード
-    pdf_path = await arxiv_client.download_pdf(arxiv_id)
+    pdf_path = cached_0704_0001["pdf_path"]
     
     # PDFファイルが存在することを確認
     assert pdf_path.exists()
@@ -101,23 +190,24 @@ async def test_arxiv_download_pdf(arxiv_client, temp_cache_dir):
     assert pdf_path.stat().st_size > 0
     
     # キャッシュディレクトリに保存されていることを確認
-    assert str(temp_cache_dir) in str(pdf_path)
+    assert str(arxiv_cache_dir) in str(pdf_path)
 
 
+@pytest.mark.network
 @pytest.mark.asyncio
-async def test_arxiv_download_pdf_cached(arxiv_client):
+async def test_arxiv_download_pdf_cached(cached_0704_0001, cached_arxiv_client):
     """PDFキャッシュのテスト"""
-    arxiv_id = "0704.0001"
+    arxiv_id = cached_0704_0001["arxiv_id"]
     
-    # 1回目のダウンロード
-    pdf_path1 = await arxiv_client.download_pdf(arxiv_id)
+    # 1回目のダウンロード（セッションフィクスチャで取得済み）
+    pdf_path1 = cached_0704_0001["pdf_path"]
     assert pdf_path1.exists()
     
     # ファイルの更新時刻を記録
     mtime1 = pdf_path1.stat().st_mtime
     
     # 2回目のダウンロード（キャッシュが使用されるはず）
-    pdf_path2 = await arxiv_client.download_pdf(arxiv_id)
+    pdf_path2 = await cached_arxiv_client.download_pdf(arxiv_id)
     assert pdf_path2.exists()
     assert pdf_path1 == pdf_path2
     
@@ -126,6 +216,7 @@ async def test_arxiv_download_pdf_cached(arxiv_client):
     assert mtime1 == mtime2
 
 
+@pytest.mark.network
 @pytest.mark.asyncio
 async def test_paper_service_search(paper_service):
     """PaperService論文検索のテスト"""
@@ -143,50 +234,55 @@ async def test_paper_service_search(paper_service):
         assert len(paper.authors) > 0
 
 
+@pytest.mark.network
 @pytest.mark.asyncio
-async def test_paper_service_get_metadata(paper_service):
+async def test_paper_service_get_metadata(cached_0704_0001, cached_paper_service):
     """PaperServiceメタデータ取得のテスト"""
-    arxiv_id = "0704.0001"
+    arxiv_id = cached_0704_0001["arxiv_id"]
     
     # メタデータを取得
-    paper = await paper_service.get_metadata(arxiv_id)
+    paper = await cached_paper_service.get_metadata(arxiv_id)
     
     assert paper.arxiv_id == arxiv_id
     assert paper.title
     assert len(paper.authors) > 0
 
 
+@pytest.mark.network
 @pytest.mark.asyncio
-async def test_paper_service_metadata_cache(paper_service, temp_cache_dir):
+async def test_paper_service_metadata_cache(
+    cached_0704_0001, cached_paper_service, arxiv_cache_dir
+):
     """PaperServiceメタデータキャッシュのテスト"""
-    arxiv_id = "0704.0001"
+    arxiv_id = cached_0704_0001["arxiv_id"]
     
-    # 1回目の取得
-    paper1 = await paper_service.get_metadata(arxiv_id)
+    # 1回目の取得（セッションフィクスチャで取得済み）
+    paper1 = cached_0704_0001["metadata"]
     
     # キャッシュファイルが作成されていることを確認
-    cache_file = temp_cache_dir / "metadata" / f"{arxiv_id}.json"
+    cache_file = arxiv_cache_dir / "metadata" / f"{arxiv_id}.json"
     assert cache_file.exists()
     
     # 2回目の取得（キャッシュから読み込まれるはず）
-    paper2 = await paper_service.get_metadata(arxiv_id)
+    paper2 = await cached_paper_service.get_metadata(arxiv_id)
     
     # 同じデータが返されることを確認
     assert paper1.arxiv_id == paper2.arxiv_id
     assert paper1.title == paper2.title
 
 
+@pytest.mark.network
 @pytest.mark.asyncio
-async def test_paper_service_download_and_extract(paper_service):
+async def test_paper_service_download_and_extract(cached_0704_0001, cached_paper_service):
     """PaperService PDF取得とテキスト抽出のテスト"""
-    arxiv_id = "0704.0001"
+    arxiv_id = cached_0704_0001["arxiv_id"]
     
-    # PDFをダウンロード
-    pdf_path = await paper_service.download_pdf(arxiv_id)
+    # PDFを取得（キャッシュ済み）
+    pdf_path = await cached_paper_service.download_pdf(arxiv_id)
     assert pdf_path.exists()
     
     # テキストを抽出
-    text = await paper_service.extract_text(pdf_path)
+    text = await cached_paper_service.extract_text(pdf_path)
     
     # テキストが抽出されることを確認
     assert len(text) > 0
@@ -199,6 +295,7 @@ async def test_paper_service_download_and_extract(paper_service):
     assert any(c.isalnum() for c in text)
 
 
+@pytest.mark.network
 @pytest.mark.asyncio
 async def test_paper_service_full_workflow(paper_service):
     """PaperService完全ワークフローのテスト（検索→メタデータ→PDF→テキスト抽出）"""
@@ -222,3 +319,34 @@ async def test_paper_service_full_workflow(paper_service):
     # 4. テキスト抽出
     text = await paper_service.extract_text(pdf_path)
     assert len(text) > 0
+
+
+@pytest.mark.asyncio
+async def test_arxiv_search_papers_mocked(mock_arxiv):
+    """論文検索のテスト（モックレスポンス使用）"""
+    papers = await mock_arxiv.search_papers(
+        query="machine learning",
+        max_results=5
+    )
+
+    assert [paper.arxiv_id for paper in papers] == ["2301.00001", "2301.00002"]
+    assert papers[0].authors == ["Alice Smith", "Bob Johnson"]
+    assert papers[0].categories == ["cs.AI", "cs.LG"]
+    assert papers[0].year == 2023
+    assert all("export.arxiv.org/api/query" in url for url in mock_arxiv.requests)
+
+
+@pytest.mark.asyncio
+async def test_arxiv_download_pdf_mocked(mock_arxiv, temp_cache_dir):
+    """PDF取得とキャッシュのテスト（モックレスポンス使用）"""
+    arxiv_id = "2301.00001"
+
+    pdf_path1 = await mock_arxiv.download_pdf(arxiv_id)
+    assert pdf_path1.suffix == ".pdf"
+    assert pdf_path1.read_bytes() == TINY_PDF_BYTES
+    assert str(temp_cache_dir) in str(pdf_path1)
+
+    # 2回目はキャッシュから返され、リクエストは送信されない
+    pdf_path2 = await mock_arxiv.download_pdf(arxiv_id)
+    assert pdf_path2 == pdf_path1
+    assert mock_arxiv.requests == [f"https://arxiv.org/pdf/{arxiv_id}.pdf"]
@@ -1,87 +1,121 @@
 """Chroma統合テスト
 
+永続化を検証しないテストはインメモリ（ephemeral）のChromaを使用します。
+ディスクを使うテストはpytestのtmp_pathを使用するため、
+--basetemp=/dev/shm/pytest を指定するとtmpfs上で実行できます。
+
 Requirements: 2.2, 2.3, 2.4
 """
 
-import pytest
+import functools
+import uuid
 from pathlib import Path
-import tempfile
-import shutil
+
+import numpy as np
+import pytest
 
 from src.clients.chroma_client import ChromaClient
 from src.models.config import ChromaConfig
+from src.models.rag import SearchResult
 
+# 永続化Chromaのfsyncを無効化（tests/conftest.py）
+pytestmark = pytest.mark.usefixtures("relaxed_sqlite_durability")
 
-@pytest.fixture
-def temp_chroma_dir():
-    """一時的なChromaディレクトリを作成"""
-    temp_dir = Path(tempfile.mkdtemp())
-    yield temp_dir
-    # クリーンアップ
-    if temp_dir.exists():
-        shutil.rmtree(temp_dir)
+# 合成データのEmbedding次元数
+# 次元固有の挙動は検証しないため小さくする（768次元はtest_chroma_distance_metricsで確認）
+TEST_DIM = 32
 
+# 読み取り専用で共有するダミーEmbeddingとクエリ
+_BASE_EMB = np.full(TEST_DIM, 0.1, dtype=np.float32)
+QUERY_15 = np.full(TEST_DIM, 0.15, dtype=np.float32)
+QUERY_05 = np.full(TEST_DIM, 0.5, dtype=np.float32)
+for _arr in (_BASE_EMB, QUERY_15, QUERY_05):
+    _arr.setflags(write=False)
 
-@pytest.fixture
-def chroma_client(temp_chroma_dir):
-    """テスト用ChromaClientを作成"""
-    config = ChromaConfig(
-        persist_dir=temp_chroma_dir,
-        collection_name="test_collection",
-        distance_metric="cosine"
+
+def _const_embeddings(values) -> np.ndarray:
+    """各値で埋めた(件数, TEST_DIM)のfloat32行列を1回の確保で作成"""
+    return np.repeat(np.asarray(values, dtype=np.float32)[:, None], TEST_DIM, axis=1)
+
+
+@functools.lru_cache(maxsize=None)
+def _disk_config(persist_dir: str, collection_name: str, distance_metric: str = "cosine") -> ChromaConfig:
+    """永続化Chromaの設定を作成（同じ引数ではインスタンスを再利用）
+
+    ChromaClientは設定を変更しないため、同一の設定は使い回してpydanticの検証を省きます。
+    """
+    return ChromaConfig(
+        persist_dir=Path(persist_dir),
+        collection_name=collection_name,
+        distance_metric=distance_metric
+    )
+
+
+def _memory_config(collection_name: str, **kwargs) -> ChromaConfig:
+    """インメモリChromaの設定を作成
+
+    インメモリのChromaはプロセス内で状態を共有するため、
+    コレクション名に一意なサフィックスを付けてテストを分離します。
+    """
+    return ChromaConfig(
+        collection_name=f"{collection_name}_{uuid.uuid4().hex}",
+        ephemeral=True,
+        **kwargs
+    )
+
+
+@pytest.fixture(scope="module")
+def shared_chroma_client(tmp_path_factory):
+    """モジュール内で共有する永続化ChromaClientを作成
+
+    クライアントの初期化コストを全テストで償却するため、
+    各テストはcreate_collection()で専用のコレクションを作成します。
+    """
+    client = ChromaClient(
+        _disk_config(str(tmp_path_factory.mktemp("chroma")), "shared_collection")
     )
-    client = ChromaClient(config)
     client.initialize()
     return client
 
 
-def test_chroma_initialize(temp_chroma_dir):
-    """Chroma初期化のテスト"""
-    config = ChromaConfig(
-        persist_dir=temp_chroma_dir,
-        collection_name="test_collection"
-    )
-    client = ChromaClient(config)
+@pytest.fixture(scope="module")
+def shared_memory_client():
+    """モジュール内で共有するインメモリChromaClientを作成"""
+    client = ChromaClient(_memory_config("shared_collection", distance_metric="cosine"))
     client.initialize()
-    
-    assert client.client is not None
-    assert client.collection is not None
-    assert client.count() == 0
+    return client
 
 
-def test_chroma_add_document(chroma_client):
-    """ドキュメント追加のテスト"""
-    # テストデータ
-    embedding = [0.1] * 768  # 768次元のダミーEmbedding
-    text = "This is a test document about machine learning."
-    metadata = {
-        "arxiv_id": "2301.00001",
-        "title": "Test Paper",
-        "authors": ["Author One", "Author Two"],
-        "year": 2023,
-        "section": "introduction",
-        "chunk_id": "2301.00001_introduction_0"
-    }
-    
-    # ドキュメントを追加
-    chroma_client.add(
-        embedding=embedding,
-        text=text,
-        metadata=metadata
+@pytest.fixture
+def chroma_client_memory(shared_memory_client, request):
+    """テストごとのコレクションを持つインメモリChromaClientを作成
+
+    _memory_configと同様に、一意なサフィックスを付けて他のクライアントと分離します。
+    Chromaのコレクション名は63文字以内のため、テスト名は先頭20文字のみ使用します。
+    """
+    return shared_memory_client.create_collection(
+        f"test_{request.node.name[:20]}_{uuid.uuid4().hex}"
     )
-    
-    # カウントを確認
-    assert chroma_client.count() == 1
 
 
-def test_chroma_search(chroma_client):
-    """ベクター検索のテスト"""
-    # テストデータを追加
-    embeddings = [
-        [0.1] * 768,
-        [0.2] * 768,
-        [0.3] * 768
-    ]
+def _add_all(client, embeddings, texts, metadatas):
+    """1回のadd_batch呼び出しでドキュメントを追加（chunk_idはメタデータから取得）"""
+    client.add_batch(
+        embeddings=embeddings,
+        texts=texts,
+        metadatas=metadatas,
+        chunk_ids=[meta["chunk_id"] for meta in metadatas]
+    )
+
+
+@pytest.fixture(scope="module")
+def seeded_collection(shared_memory_client):
+    """検索テスト用のコーパスを1回だけ投入したコレクションを作成
+
+    検索は読み取り専用のため、複数のテストで共有します。
+    """
+    collection = shared_memory_client.create_collection("search_seed")
+    embeddings = _const_embeddings([0.1, 0.2, 0.3])
     texts = [
         "Machine learning is a subset of AI.",
         "Deep learning uses neural networks.",
@@ -114,89 +148,86 @@ def test_chroma_search(chroma_client):
         }
     ]
     
-    for emb, txt, meta in zip(embeddings, texts, metadatas):
-        chroma_client.add(embedding=emb, text=txt, metadata=meta)
+    _add_all(collection, embeddings, texts, metadatas)
+    return collection
+
+
+def test_chroma_initialize(tmp_path):
+    """Chroma初期化のテスト"""
+    config = _disk_config(str(tmp_path), "test_collection")
+    client = ChromaClient(config)
+    client.initialize()
+    
+    assert client.client is not None
+    assert client.collection is not None
+    assert client.count() == 0
+
+
+def test_chroma_add_document(chroma_client_memory):
+    """ドキュメント追加のテスト"""
+    # テストデータ
+    embedding = _BASE_EMB  # ダミーEmbedding
+    text = "This is a test document about machine learning."
+    metadata = {
+        "arxiv_id": "2301.00001",
+        "title": "Test Paper",
+        "authors": ["Author One", "Author Two"],
+        "year": 2023,
+        "section": "introduction",
+        "chunk_id": "2301.00001_introduction_0"
+    }
+    
+    # ドキュメントを追加
+    chroma_client_memory.add(
+        embedding=embedding,
+        text=text,
+        metadata=metadata
+    )
     
+    # カウントを確認
+    assert chroma_client_memory.count() == 1
+
+
+def test_chroma_search(seeded_collection):
+    """ベクター検索のテスト"""
     # 検索を実行
-    query_embedding = [0.15] * 768
-    results = chroma_client.search(
+    query_embedding = QUERY_15
+    results = seeded_collection.search(
         query_embedding=query_embedding,
         top_k=2
     )
     
     assert len(results) == 2
-    assert all(hasattr(r, "chunk_id") for r in results)
-    assert all(hasattr(r, "text") for r in results)
-    assert all(hasattr(r, "score") for r in results)
-    assert all(hasattr(r, "metadata") for r in results)
+    assert all(isinstance(r, SearchResult) for r in results)
 
 
-def test_chroma_search_with_filter(chroma_client):
+def test_chroma_search_with_filter(seeded_collection):
     """arxiv_idsフィルタ付き検索のテスト"""
-    # テストデータを追加
-    embeddings = [
-        [0.1] * 768,
-        [0.2] * 768,
-        [0.3] * 768
-    ]
-    texts = [
-        "Paper 1 content",
-        "Paper 1 more content",
-        "Paper 2 content"
-    ]
-    metadatas = [
-        {
-            "arxiv_id": "2301.00001",
-            "title": "Paper 1",
-            "authors": "Author One",
-            "year": 2023,
-            "section": "introduction",
-            "chunk_id": "2301.00001_introduction_0"
-        },
-        {
-            "arxiv_id": "2301.00001",
-            "title": "Paper 1",
-            "authors": "Author One",
-            "year": 2023,
-            "section": "methods",
-            "chunk_id": "2301.00001_methods_0"
-        },
-        {
-            "arxiv_id": "2302.00001",
-            "title": "Paper 2",
-            "authors": "Author Two",
-            "year": 2023,
-            "section": "introduction",
-            "chunk_id": "2302.00001_introduction_0"
-        }
-    ]
-    
-    for emb, txt, meta in zip(embeddings, texts, metadatas):
-        chroma_client.add(embedding=emb, text=txt, metadata=meta)
-    
     # 特定の論文IDでフィルタリング
-    query_embedding = [0.15] * 768
-    results = chroma_client.search(
+    query_embedding = QUERY_15
+    results = seeded_collection.search(
         query_embedding=query_embedding,
         arxiv_ids=["2301.00001"],
         top_k=5
     )
     
-    # Paper 1のチャンクのみが返されることを確認
+    # 2301.00001のチャンクのみが返されることを確認
     assert len(results) == 2
-    assert all(r.metadata["arxiv_id"] == "2301.00001" for r in results)
+    assert {r.metadata["arxiv_id"] for r in results} == {"2301.00001"}
 
 
-def test_chroma_count(chroma_client):
+def test_chroma_count(chroma_client_memory):
     """ドキュメント数カウントのテスト"""
-    assert chroma_client.count() == 0
-    
-    # ドキュメントを追加
-    for i in range(5):
-        chroma_client.add(
-            embedding=[0.1] * 768,
-            text=f"Document {i}",
-            metadata={
+    assert chroma_client_memory.count() == 0
+    
+    # ドキュメントを一括追加
+    num_docs = 5
+    _add_all(
+        chroma_client_memory,
+        embeddings=_const_embeddings([0.1] * num_docs),
+        texts=[f"Document {i}" for i in range(num_docs)],
+        metadatas=[
+            {
                 "arxiv_id": f"230{i}.00001",
                 "title": f"Paper {i}",
                 "authors": "Author",
@@ -204,29 +235,28 @@ def test_chroma_count(chroma_client):
                 "section": "introduction",
                 "chunk_id": f"230{i}.00001_introduction_0"
             }
-        )
+            for i in range(num_docs)
+        ]
+    )
     
-    assert chroma_client.count() == 5
+    assert chroma_client_memory.count() == 5
 
 
-def test_chroma_persistence(temp_chroma_dir):
+@pytest.mark.slow
+def test_chroma_persistence(tmp_path):
     """永続化のテスト
     
     Requirements: 2.2, 2.3
     """
     # 最初のクライアントでデータを追加
-    config1 = ChromaConfig(
-        persist_dir=temp_chroma_dir,
-        collection_name="test_persistence",
-        distance_metric="cosine"
-    )
+    config1 = _disk_config(str(tmp_path), "test_persistence")
     client1 = ChromaClient(config1)
     client1.initialize()
     
     # テストデータを追加
     test_data = [
         {
-            "embedding": [0.1] * 768,
+            "embedding": _BASE_EMB,
             "text": "First document about machine learning",
             "metadata": {
                 "arxiv_id": "2301.00001",
@@ -238,7 +268,7 @@ def test_chroma_persistence(temp_chroma_dir):
             }
         },
         {
-            "embedding": [0.2] * 768,
+            "embedding": _const_embeddings([0.2])[0],
             "text": "Second document about deep learning",
             "metadata": {
                 "arxiv_id": "2301.00002",
@@ -251,18 +281,18 @@ def test_chroma_persistence(temp_chroma_dir):
         }
     ]
     
-    for data in test_data:
-        client1.add(**data)
+    _add_all(
+        client1,
+        embeddings=[data["embedding"] for data in test_data],
+        texts=[data["text"] for data in test_data],
+        metadatas=[data["metadata"] for data in test_data]
+    )
     
     initial_count = client1.count()
     assert initial_count == 2
     
     # 2つ目のクライアントで同じディレクトリから読み込み
-    config2 = ChromaConfig(
-        persist_dir=temp_chroma_dir,
-        collection_name="test_persistence",
-        distance_metric="cosine"
-    )
+    config2 = _disk_config(str(tmp_path), "test_persistence")
     client2 = ChromaClient(config2)
     client2.initialize()
     
@@ -270,81 +300,75 @@ def test_chroma_persistence(temp_chroma_dir):
     assert client2.count() == initial_count
     
     # 検索が正常に動作することを確認
-    query_embedding = [0.15] * 768
+    query_embedding = QUERY_15
     results = client2.search(
         query_embedding=query_embedding,
         top_k=2
     )
     
     assert len(results) == 2
-    assert all(hasattr(r, "chunk_id") for r in results)
-    assert all(hasattr(r, "text") for r in results)
+    assert all(isinstance(r, SearchResult) for r in results)
 
 
-def test_chroma_large_dataset(temp_chroma_dir):
+@pytest.mark.slow
+def test_chroma_large_dataset(shared_chroma_client, request):
     """大量データのテスト
     
     Requirements: 2.2, 2.3
     """
-    config = ChromaConfig(
-        persist_dir=temp_chroma_dir,
-        collection_name="test_large_dataset",
-        distance_metric="cosine"
-    )
-    client = ChromaClient(config)
-    client.initialize()
+    client = shared_chroma_client.create_collection(f"test_{request.node.name}")
     
-    # 100個のドキュメントを追加
+    # 100個のドキュメントを一括追加
     num_docs = 100
-    for i in range(num_docs):
-        client.add(
-            embedding=[float(i % 10) / 10.0] * 768,
-            text=f"Document {i} with content about topic {i % 10}",
-            metadata={
-                "arxiv_id": f"23{i:02d}.00001",
+    arxiv_ids = [f"23{i:02d}.00001" for i in range(num_docs)]
+    _add_all(
+        client,
+        embeddings=_const_embeddings(np.arange(num_docs) % 10 / 10.0),
+        texts=[f"Document {i} with content about topic {i % 10}" for i in range(num_docs)],
+        metadatas=[
+            {
+                "arxiv_id": aid,
                 "title": f"Paper {i}",
                 "authors": f"Author {i}",
                 "year": 2023,
                 "section": "introduction",
-                "chunk_id": f"23{i:02d}.00001_introduction_0"
+                "chunk_id": f"{aid}_introduction_0"
             }
-        )
+            for i, aid in enumerate(arxiv_ids)
+        ]
+    )
     
     # カウントを確認
     assert client.count() == num_docs
     
     # 検索が正常に動作することを確認
-    query_embedding = [0.5] * 768
+    query_embedding = QUERY_05
     results = client.search(
         query_embedding=query_embedding,
         top_k=10
     )
     
     assert len(results) == 10
-    assert all(hasattr(r, "chunk_id") for r in results)
-    assert all(hasattr(r, "score") for r in results)
+    assert all(isinstance(r, SearchResult) for r in results)
     
     # スコアが降順にソートされていることを確認
     scores = [r.score for r in results]
-    assert scores == sorted(scores, reverse=True)
+    assert all(a >= b for a, b in zip(scores, scores[1:], strict=False))
 
 
-def test_chroma_multiple_collections(temp_chroma_dir):
+@pytest.mark.slow
+def test_chroma_multiple_collections():
     """複数コレクションのテスト
     
     Requirements: 2.2, 2.3
     """
     # コレクション1
-    config1 = ChromaConfig(
-        persist_dir=temp_chroma_dir,
-        collection_name="collection_1",
-        distance_metric="cosine"
-    )
+    config1 = _memory_config("collection_1", distance_metric="cosine")
     client1 = ChromaClient(config1)
     client1.initialize()
     
     client1.add(
-        embedding=[0.1] * 768,
+        embedding=_BASE_EMB,
         text="Document in collection 1",
         metadata={
             "arxiv_id": "2301.00001",
@@ -357,16 +381,12 @@ def test_chroma_multiple_collections(temp_chroma_dir):
     )
     
     # コレクション2
-    config2 = ChromaConfig(
-        persist_dir=temp_chroma_dir,
-        collection_name="collection_2",
-        distance_metric="cosine"
-    )
+    config2 = _memory_config("collection_2", distance_metric="cosine")
     client2 = ChromaClient(config2)
     client2.initialize()
     
     client2.add(
-        embedding=[0.2] * 768,
+        embedding=_const_embeddings([0.2])[0],
         text="Document in collection 2",
         metadata={
             "arxiv_id": "2302.00001",
@@ -383,7 +403,7 @@ def test_chroma_multiple_collections(temp_chroma_dir):
     assert client2.count() == 1
     
     # 各コレクションで検索が正常に動作することを確認
-    query_embedding = [0.15] * 768
+    query_embedding = QUERY_15
     
     results1 = client1.search(query_embedding=query_embedding, top_k=5)
     assert len(results1) == 1
@@ -394,26 +414,22 @@ def test_chroma_multiple_collections(temp_chroma_dir):
     assert results2[0].metadata["arxiv_id"] == "2302.00001"
 
 
-def test_chroma_batch_operations(temp_chroma_dir):
+@pytest.mark.slow
+def test_chroma_batch_operations(chroma_client_memory):
     """バッチ操作のテスト
     
     Requirements: 2.2, 2.3
     """
-    config = ChromaConfig(
-        persist_dir=temp_chroma_dir,
-        collection_name="test_batch",
-        distance_metric="cosine"
-    )
-    client = ChromaClient(config)
-    client.initialize()
+    client = chroma_client_memory
     
     # バッチでドキュメントを追加
     batch_size = 20
-    for i in range(batch_size):
-        client.add(
-            embedding=[float(i) / batch_size] * 768,
-            text=f"Batch document {i}",
-            metadata={
+    _add_all(
+        client,
+        embeddings=_const_embeddings(np.arange(batch_size) / batch_size),
+        texts=[f"Batch document {i}" for i in range(batch_size)],
+        metadatas=[
+            {
                 "arxiv_id": f"23{i:02d}.00001",
                 "title": f"Batch Paper {i}",
                 "authors": "Batch Author",
@@ -421,13 +437,15 @@ def test_chroma_batch_operations(temp_chroma_dir):
                 "section": "introduction",
                 "chunk_id": f"23{i:02d}.00001_introduction_0"
             }
-        )
+            for i in range(batch_size)
+        ]
+    )
     
     # すべてのドキュメントが追加されたことを確認
     assert client.count() == batch_size
     
     # 検索が正常に動作することを確認
-    query_embedding = [0.5] * 768
+    query_embedding = QUERY_05
     results = client.search(
         query_embedding=query_embedding,
         top_k=5
@@ -436,19 +454,13 @@ def test_chroma_batch_operations(temp_chroma_dir):
     assert len(results) == 5
 
 
-def test_chroma_distance_metrics(temp_chroma_dir):
+def test_chroma_distance_metrics(chroma_client_memory):
     """距離メトリクスのテスト
     
     Requirements: 2.2
     """
     # cosine距離でテスト
-    config_cosine = ChromaConfig(
-        persist_dir=temp_chroma_dir,
-        collection_name="test_cosine",
-        distance_metric="cosine"
-    )
-    client_cosine = ChromaClient(config_cosine)
-    client_cosine.initialize()
+    client_cosine = chroma_client_memory
     
     # テストデータを追加
     client_cosine.add(
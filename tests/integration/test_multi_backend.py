@@ -5,6 +5,8 @@ Requirements: 12.2, 12.3
 
 このテストは各バックエンドの切り替えと環境変数による設定をテストします。
 実際のAPI呼び出しは行わず、バックエンドの初期化と設定のみをテストします。
+環境変数の変更はpatch.dictでテストごとに閉じており、設定ローダーも
+キャッシュを持たないため、pytest -n auto で並列実行できます。
 """
 
 import pytest
@@ -14,84 +16,26 @@ from unittest.mock import patch, MagicMock, AsyncMock
 from src.services.llm_service import LLMService
 from src.services.embedding_service import EmbeddingService
 from src.models.config import LLMConfig, EmbeddingConfig
+from src.utils.config_loader import load_llm_config, load_embedding_config
 
 
 # ===== LLMバックエンドテスト =====
 
-def test_llm_backend_gemini():
-    """Geminiバックエンドの初期化テスト
-    
-    Requirements: 12.2, 12.3
-    """
-    config = LLMConfig(backend="gemini")
-    service = LLMService(config)
-    
-    assert service.config.backend == "gemini"
-    assert service.backend is None  # load_model前はNone
-
-
-def test_llm_backend_openai():
-    """OpenAIバックエンドの初期化テスト
-    
-    Requirements: 12.2, 12.3
-    """
-    config = LLMConfig(backend="openai")
-    service = LLMService(config)
-    
-    assert service.config.backend == "openai"
-    assert service.backend is None
-
-
-def test_llm_backend_local_cpu():
-    """Local CPUバックエンドの初期化テスト
-    
-    Requirements: 12.2, 12.3
-    """
-    config = LLMConfig(backend="local-cpu")
-    service = LLMService(config)
-    
-    assert service.config.backend == "local-cpu"
-    assert service.backend is None
+BACKENDS = ["gemini", "openai", "local-cpu", "local-mlx", "local-cuda"]
 
 
-def test_llm_backend_local_mlx():
-    """Local MLXバックエンドの初期化テスト
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_llm_backend_init(backend):
+    """LLMバックエンドの初期化テスト
     
     Requirements: 12.2, 12.3
     """
-    config = LLMConfig(backend="local-mlx")
+    config = LLMConfig(backend=backend)
     service = LLMService(config)
     
-    assert service.config.backend == "local-mlx"
-    assert service.backend is None
-
-
-def test_llm_backend_local_cuda():
-    """Local CUDAバックエンドの初期化テスト
-    
-    Requirements: 12.2, 12.3
-    """
-    config = LLMConfig(backend="local-cuda")
-    service = LLMService(config)
-    
-    assert service.config.backend == "local-cuda"
-    assert service.backend is None
-
-
-@pytest.mark.asyncio
-async def test_llm_backend_switching():
-    """LLMバックエンドの切り替えテスト
-    
-    Requirements: 12.2, 12.3
-    """
-    backends = ["gemini", "openai", "local-cpu", "local-mlx", "local-cuda"]
-    
-    for backend in backends:
-        config = LLMConfig(backend=backend)
-        service = LLMService(config)
-        
-        assert service.config.backend == backend
-        assert not service.is_loaded()
+    assert service.config.backend == backend
+    assert service.backend is None  # load_model前はNone
+    assert not service.is_loaded()
 
 
 def test_llm_env_var_configuration():
@@ -100,7 +44,6 @@ def test_llm_env_var_configuration():
     Requirements: 12.3
     """
     with patch.dict(os.environ, {"LLM_BACKEND": "openai"}):
-        from src.utils.config_loader import load_llm_config
         config = load_llm_config()
         
         assert config.backend == "openai"
@@ -113,7 +56,6 @@ def test_llm_default_backend():
     """
     # 環境変数をクリア
     with patch.dict(os.environ, {}, clear=True):
-        from src.utils.config_loader import load_llm_config
         config = load_llm_config()
         
         # デフォルトはgemini
@@ -122,80 +64,18 @@ def test_llm_default_backend():
 
 # ===== Embeddingバックエンドテスト =====
 
-def test_embedding_backend_gemini():
-    """Gemini Embeddingバックエンドの初期化テスト
-    
-    Requirements: 12.2, 12.3
-    """
-    config = EmbeddingConfig(backend="gemini")
-    service = EmbeddingService(config)
-    
-    assert service.config.backend == "gemini"
-    assert service.backend is None
-
-
-def test_embedding_backend_openai():
-    """OpenAI Embeddingバックエンドの初期化テスト
-    
-    Requirements: 12.2, 12.3
-    """
-    config = EmbeddingConfig(backend="openai")
-    service = EmbeddingService(config)
-    
-    assert service.config.backend == "openai"
-    assert service.backend is None
-
-
-def test_embedding_backend_local_cpu():
-    """Local CPU Embeddingバックエンドの初期化テスト
-    
-    Requirements: 12.2, 12.3
-    """
-    config = EmbeddingConfig(backend="local-cpu")
-    service = EmbeddingService(config)
-    
-    assert service.config.backend == "local-cpu"
-    assert service.backend is None
-
-
-def test_embedding_backend_local_mlx():
-    """Local MLX Embeddingバックエンドの初期化テスト
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_embedding_backend_init(backend):
+    """Embeddingバックエンドの初期化テスト
     
     Requirements: 12.2, 12.3
     """
-    config = EmbeddingConfig(backend="local-mlx")
+    config = EmbeddingConfig(backend=backend)
     service = EmbeddingService(config)
     
-    assert service.config.backend == "local-mlx"
+    assert service.config.backend == backend
     assert service.backend is None
-
-
-def test_embedding_backend_local_cuda():
-    """Local CUDA Embeddingバックエンドの初期化テスト
-    
-    Requirements: 12.2, 12.3
-    """
-    config = EmbeddingConfig(backend="local-cuda")
-    service = EmbeddingService(config)
-    
-    assert service.config.backend == "local-cuda"
-    assert service.backend is None
-
-
-@pytest.mark.asyncio
-async def test_embedding_backend_switching():
-    """Embeddingバックエンドの切り替えテスト
-    
-    Requirements: 12.2, 12.3
-    """
-    backends = ["gemini", "openai", "local-cpu", "local-mlx", "local-cuda"]
-    
-    for backend in backends:
-        config = EmbeddingConfig(backend=backend)
-        service = EmbeddingService(config)
-        
-        assert service.config.backend == backend
-        assert not service.is_loaded()
+    assert not service.is_loaded()
 
 
 def test_embedding_env_var_configuration():
@@ -204,7 +84,6 @@ def test_embedding_env_var_configuration():
     Requirements: 12.3
     """
     with patch.dict(os.environ, {"EMBEDDING_BACKEND": "local-cpu"}):
-        from src.utils.config_loader import load_embedding_config
         config = load_embedding_config()
         
         assert config.backend == "local-cpu"
@@ -217,7 +96,6 @@ def test_embedding_default_backend():
     """
     # 環境変数をクリア
     with patch.dict(os.environ, {}, clear=True):
-        from src.utils.config_loader import load_embedding_config
         config = load_embedding_config()
         
         # デフォルトはgemini
@@ -283,8 +161,6 @@ def test_env_var_mixed_configuration():
         "LLM_BACKEND": "openai",
         "EMBEDDING_BACKEND": "local-cpu"
     }):
-        from src.utils.config_loader import load_llm_config, load_embedding_config
-        
         llm_config = load_llm_config()
         embedding_config = load_embedding_config()
         
@@ -354,62 +230,62 @@ def test_backend_priority():
     """
     # 環境変数が設定されている場合、それが優先される
     with patch.dict(os.environ, {"LLM_BACKEND": "openai"}):
-        from src.utils.config_loader import load_llm_config
         config = load_llm_config()
         assert config.backend == "openai"
     
     # 環境変数がない場合、デフォルト値が使用される
     with patch.dict(os.environ, {}, clear=True):
-        from src.utils.config_loader import load_llm_config
         config = load_llm_config()
         assert config.backend == "gemini"
 
 
+@pytest.fixture(scope="session")
+def backend_services():
+    """バックエンドごとの未ロードのサービスフィクスチャ
+
+    インターフェーステストはload_modelを呼ばないため、セッション全体で共有します。
+
+    Returns:
+        dict: バックエンド名をキーとする(LLMService, EmbeddingService)
+    """
+    return {
+        backend: (
+            LLMService(LLMConfig(backend=backend)),
+            EmbeddingService(EmbeddingConfig(backend=backend))
+        )
+        for backend in ["gemini", "openai", "local-cpu"]
+    }
+
+
 @pytest.mark.asyncio
-async def test_backend_load_model_interface():
+async def test_backend_load_model_interface(backend_services):
     """バックエンドのload_modelインターフェーステスト
     
     Requirements: 12.2
     """
     # すべてのバックエンドがload_modelメソッドを持つことを確認
-    backends = ["gemini", "openai", "local-cpu"]
-    
-    for backend in backends:
-        llm_config = LLMConfig(backend=backend)
-        llm_service = LLMService(llm_config)
-        
+    for llm_service, embedding_service in backend_services.values():
         # load_modelメソッドが存在することを確認
         assert hasattr(llm_service, "load_model")
         assert callable(llm_service.load_model)
         
-        embedding_config = EmbeddingConfig(backend=backend)
-        embedding_service = EmbeddingService(embedding_config)
-        
         # load_modelメソッドが存在することを確認
         assert hasattr(embedding_service, "load_model")
         assert callable(embedding_service.load_model)
 
 
-def test_backend_is_loaded_interface():
+def test_backend_is_loaded_interface(backend_services):
     """バックエンドのis_loadedインターフェーステスト
     
     Requirements: 12.2
     """
     # すべてのバックエンドがis_loadedメソッドを持つことを確認
-    backends = ["gemini", "openai", "local-cpu"]
-    
-    for backend in backends:
-        llm_config = LLMConfig(backend=backend)
-        llm_service = LLMService(llm_config)
-        
+    for llm_service, embedding_service in backend_services.values():
         # is_loadedメソッドが存在し、初期状態ではFalseを返すことを確認
         assert hasattr(llm_service, "is_loaded")
         assert callable(llm_service.is_loaded)
         assert not llm_service.is_loaded()
         
-        embedding_config = EmbeddingConfig(backend=backend)
-        embedding_service = EmbeddingService(embedding_config)
-        
         # is_loadedメソッドが存在し、初期状態ではFalseを返すことを確認
         assert hasattr(embedding_service, "is_loaded")
         assert callable(embedding_service.is_loaded)
@@ -6,12 +6,12 @@ Requirements: 2.1, 2.2, 2.3, 2.4, 2.5
 インデックス化→検索→回答生成の完全なフローをテストします。
 """
 
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
 import pytest
 import pytest_asyncio
-from pathlib import Path
-import tempfile
-import shutil
-from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.clients.arxiv_client import ArxivClient
@@ -23,10 +23,10 @@ from src.services.rag_service import RAGService, basic_rag_query
 from src.models.config import ChromaConfig, EmbeddingConfig, LLMConfig
 
 
-@pytest.fixture
-def temp_dirs():
-    """一時的なディレクトリを作成"""
-    temp_base = Path(tempfile.mkdtemp())
+@pytest.fixture(scope="module")
+def temp_dirs(tmp_path_factory):
+    """モジュール内で共有する一時ディレクトリを作成"""
+    temp_base = tmp_path_factory.mktemp("rag_pipeline")
     dirs = {
         "cache": temp_base / "cache",
         "chroma": temp_base / "chroma"
@@ -34,16 +34,16 @@ def temp_dirs():
     for d in dirs.values():
         d.mkdir(parents=True, exist_ok=True)
     
-    yield dirs
-    
-    # クリーンアップ
-    if temp_base.exists():
-        shutil.rmtree(temp_base)
+    return dirs
 
 
-@pytest.fixture
+# インデックス化済みフィクスチャで共有する実在論文ID
+SHARED_ARXIV_ID = "0704.0001"
+
+
+@pytest.fixture(scope="module")
 def arxiv_client(temp_dirs):
-    """テスト用ArxivClientを作成"""
+    """モジュール内で共有するArxivClientを作成"""
     return ArxivClient(
         cache_dir=temp_dirs["cache"] / "pdfs",
         max_retries=3,
@@ -51,18 +51,22 @@ def arxiv_client(temp_dirs):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def paper_service(arxiv_client, temp_dirs):
-    """テスト用PaperServiceを作成"""
+    """モジュール内で共有するPaperServiceを作成"""
     return PaperService(
         arxiv_client=arxiv_client,
         cache_dir=temp_dirs["cache"]
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def chroma_client(temp_dirs):
-    """テスト用ChromaClientを作成"""
+    """モジュール内で共有するChromaClientを作成
+
+    クライアントの初期化はモジュールで1回だけ行い、
+    テストごとの分離はreset_collectionでコレクションを作り直して行います。
+    """
     config = ChromaConfig(
         persist_dir=temp_dirs["chroma"],
         collection_name="test_rag_pipeline",
@@ -73,6 +77,12 @@ def chroma_client(temp_dirs):
     return client
 
 
+@pytest.fixture(autouse=True)
+def reset_collection(chroma_client):
+    """各テストの前にコレクションを空にする"""
+    chroma_client.reset()
+
+
 @pytest_asyncio.fixture
 async def embedding_service(mock_embedding_service):
     """テスト用EmbeddingServiceを作成（モック使用）"""
@@ -103,6 +113,51 @@ async def rag_service(chroma_client, embedding_service):
     )
 
 
+@pytest.fixture(scope="module")
+def shared_paper(paper_service):
+    """SHARED_ARXIV_IDのPDF取得・テキスト抽出・メタデータ取得をモジュールで1回だけ行う
+
+    Returns:
+        SimpleNamespace: arxiv_id、text、metadata
+    """
+    async def fetch():
+        pdf_path = await paper_service.download_pdf(SHARED_ARXIV_ID)
+        text = await paper_service.extract_text(pdf_path)
+        metadata = await paper_service.get_metadata(SHARED_ARXIV_ID)
+        return text, metadata
+
+    text, metadata = asyncio.run(fetch())
+    return SimpleNamespace(arxiv_id=SHARED_ARXIV_ID, text=text, metadata=metadata)
+
+
+@pytest.fixture(scope="module")
+def indexed_paper(shared_paper, chroma_client, mock_embedding_service):
+    """shared_paperをインデックス化済みのRAGServiceをモジュールで1回だけ作成
+
+    reset_collectionの対象外となる専用コレクションを使うため、
+    検索のみを行うテストは再インデックス化せずに共有できます。
+
+    Returns:
+        SimpleNamespace: arxiv_id、text、metadata、chunk_count、rag_service
+    """
+    rag_service = RAGService(
+        chroma_client=chroma_client.create_collection("test_rag_pipeline_indexed"),
+        embedding_service=mock_embedding_service
+    )
+    chunk_count = asyncio.run(rag_service.index_paper(
+        arxiv_id=shared_paper.arxiv_id,
+        text=shared_paper.text,
+        metadata=shared_paper.metadata
+    ))
+    return SimpleNamespace(
+        arxiv_id=shared_paper.arxiv_id,
+        text=shared_paper.text,
+        metadata=shared_paper.metadata,
+        chunk_count=chunk_count,
+        rag_service=rag_service
+    )
+
+
 @pytest.mark.asyncio
 async def test_rag_pipeline_search_to_index(
     paper_service,
@@ -146,32 +201,15 @@ async def test_rag_pipeline_search_to_index(
 
 
 @pytest.mark.asyncio
-async def test_rag_pipeline_index_to_query(
-    paper_service,
-    rag_service
-):
+async def test_rag_pipeline_index_to_query(indexed_paper):
     """インデックス化→検索"""
-    # 実在する論文を使用
-    arxiv_id = "0704.0001"
-    
-    # 1. PDF取得
-    pdf_path = await paper_service.download_pdf(arxiv_id)
-    
-    # 2. テキスト抽出
-    text = await paper_service.extract_text(pdf_path)
-    
-    # 3. メタデータ取得
-    metadata = await paper_service.get_metadata(arxiv_id)
+    arxiv_id = indexed_paper.arxiv_id
+    rag_service = indexed_paper.rag_service
     
-    # 4. インデックス化
-    chunk_count = await rag_service.index_paper(
-        arxiv_id=arxiv_id,
-        text=text,
-        metadata=metadata
-    )
-    assert chunk_count > 0
+    # インデックス化済みであることを確認
+    assert indexed_paper.chunk_count > 0
     
-    # 5. 検索を実行
+    # 検索を実行
     results = await rag_service.query(
         question="What is the main topic of this paper?",
         arxiv_ids=[arxiv_id],
@@ -199,9 +237,7 @@ async def test_rag_pipeline_multiple_papers(
     # 2つの論文を使用
     arxiv_ids = ["0704.0001", "0704.0002"]
     
-    # 各論文をインデックス化
-    total_chunks = 0
-    for arxiv_id in arxiv_ids:
+    async def _ingest(arxiv_id: str) -> int:
         # PDF取得
         pdf_path = await paper_service.download_pdf(arxiv_id)
         
@@ -212,12 +248,15 @@ async def test_rag_pipeline_multiple_papers(
         metadata = await paper_service.get_metadata(arxiv_id)
         
         # インデックス化
-        chunk_count = await rag_service.index_paper(
+        return await rag_service.index_paper(
             arxiv_id=arxiv_id,
             text=text,
             metadata=metadata
         )
-        total_chunks += chunk_count
+    
+    # 各論文を並行してインデックス化（ダウンロード・メタデータ取得の待ち時間を重ねる）
+    chunk_counts = await asyncio.gather(*(_ingest(arxiv_id) for arxiv_id in arxiv_ids))
+    total_chunks = sum(chunk_counts)
     
     # 全チャンクがインデックス化されたことを確認
     assert rag_service.chroma.count() == total_chunks
@@ -237,73 +276,45 @@ async def test_rag_pipeline_multiple_papers(
         top_k=5
     )
     assert len(results_filtered) > 0
-    assert all(r.metadata["arxiv_id"] == "0704.0001" for r in results_filtered)
+    assert {r.metadata["arxiv_id"] for r in results_filtered} == {"0704.0001"}
 
 
 @pytest.mark.asyncio
-async def test_rag_pipeline_imrad_sections(
-    paper_service,
-    rag_service
-):
+async def test_rag_pipeline_imrad_sections(indexed_paper):
     """IMRaD構造分割"""
-    arxiv_id = "0704.0001"
-    
-    # PDF取得とテキスト抽出
-    pdf_path = await paper_service.download_pdf(arxiv_id)
-    text = await paper_service.extract_text(pdf_path)
+    arxiv_id = indexed_paper.arxiv_id
+    rag_service = indexed_paper.rag_service
     
     # IMRaD構造で分割
-    sections = rag_service._split_by_imrad(text)
+    sections = rag_service._split_by_imrad(indexed_paper.text)
     
     # セクションが検出されることを確認
     assert len(sections) > 0
     
-    # メタデータ取得
-    metadata = await paper_service.get_metadata(arxiv_id)
-    
-    # インデックス化
-    chunk_count = await rag_service.index_paper(
-        arxiv_id=arxiv_id,
-        text=text,
-        metadata=metadata
-    )
-    
     # 検索してセクション情報が含まれることを確認
-    results = await rag_service.query(
-        question="introduction",
-        arxiv_ids=[arxiv_id],
-        top_k=3
-    )
-    
-    # 各結果にセクション情報が含まれることを確認
+    results = [
+        result async for result in rag_service.query_stream(
+            question="introduction",
+            arxiv_ids=[arxiv_id],
+            top_k=3
+        )
+    ]
+    assert len(results) > 0
     for result in results:
         assert "section" in result.metadata
         assert result.metadata["section"]
 
 
 @pytest.mark.asyncio
-async def test_rag_pipeline_context_building(
-    paper_service,
-    rag_service
-):
+async def test_rag_pipeline_context_building(indexed_paper):
     """コンテキスト構築"""
     from src.services.rag_service import build_context
     
-    arxiv_id = "0704.0001"
-    
-    # インデックス化
-    pdf_path = await paper_service.download_pdf(arxiv_id)
-    text = await paper_service.extract_text(pdf_path)
-    metadata = await paper_service.get_metadata(arxiv_id)
-    
-    await rag_service.index_paper(
-        arxiv_id=arxiv_id,
-        text=text,
-        metadata=metadata
-    )
+    arxiv_id = indexed_paper.arxiv_id
+    metadata = indexed_paper.metadata
     
     # 検索
-    results = await rag_service.query(
+    results = await indexed_paper.rag_service.query(
         question="What is the main contribution?",
         arxiv_ids=[arxiv_id],
         top_k=3
@@ -342,22 +353,17 @@ async def test_rag_pipeline_empty_results(rag_service):
 
 @pytest.mark.asyncio
 async def test_rag_pipeline_chunk_size_variation(
-    paper_service,
+    shared_paper,
     rag_service
 ):
     """異なるチャンクサイズでのインデックス化"""
-    arxiv_id = "0704.0001"
-    
-    # PDF取得とテキスト抽出
-    pdf_path = await paper_service.download_pdf(arxiv_id)
-    text = await paper_service.extract_text(pdf_path)
-    metadata = await paper_service.get_metadata(arxiv_id)
+    arxiv_id = shared_paper.arxiv_id
     
-    # 小さいチャンクサイズでインデックス化
+    # 小さいチャンクサイズでインデックス化（取得・抽出済みのテキストを使用）
     chunk_count_small = await rag_service.index_paper(
         arxiv_id=arxiv_id,
-        text=text,
-        metadata=metadata,
+        text=shared_paper.text,
+        metadata=shared_paper.metadata,
         chunk_size=256
     )
     
@@ -374,32 +380,20 @@ async def test_rag_pipeline_chunk_size_variation(
 
 
 @pytest.mark.asyncio
-async def test_rag_pipeline_metadata_preservation(
-    paper_service,
-    rag_service
-):
+async def test_rag_pipeline_metadata_preservation(indexed_paper):
     """メタデータの保持"""
-    arxiv_id = "0704.0001"
-    
-    # インデックス化
-    pdf_path = await paper_service.download_pdf(arxiv_id)
-    text = await paper_service.extract_text(pdf_path)
-    metadata = await paper_service.get_metadata(arxiv_id)
-    
-    await rag_service.index_paper(
-        arxiv_id=arxiv_id,
-        text=text,
-        metadata=metadata
-    )
-    
-    # 検索
-    results = await rag_service.query(
-        question="test query",
-        arxiv_ids=[arxiv_id],
-        top_k=3
-    )
-    
-    # 各結果が必要なメタデータを持つことを確認
+    arxiv_id = indexed_paper.arxiv_id
+    metadata = indexed_paper.metadata
+    
+    # 検索し、各結果が必要なメタデータを持つことを確認
+    results = [
+        result async for result in indexed_paper.rag_service.query_stream(
+            question="test query",
+            arxiv_ids=[arxiv_id],
+            top_k=3
+        )
+    ]
+    assert len(results) > 0
     for result in results:
         assert result.metadata["arxiv_id"] == arxiv_id
         assert result.metadata["title"] == metadata.title
@@ -413,31 +407,21 @@ async def test_rag_pipeline_metadata_preservation(
 
 @pytest.mark.asyncio
 async def test_rag_pipeline_full_flow_with_answer_generation(
-    paper_service,
-    rag_service,
+    indexed_paper,
     mock_llm_service
 ):
     """完全なRAGフロー: インデックス化→検索→回答生成
     
     Requirements: 2.1, 2.2, 2.3, 2.4, 2.5
     """
-    arxiv_id = "0704.0001"
-    
-    # 1. 論文のインデックス化
-    pdf_path = await paper_service.download_pdf(arxiv_id)
-    text = await paper_service.extract_text(pdf_path)
-    metadata = await paper_service.get_metadata(arxiv_id)
+    arxiv_id = indexed_paper.arxiv_id
     
-    chunk_count = await rag_service.index_paper(
-        arxiv_id=arxiv_id,
-        text=text,
-        metadata=metadata
-    )
-    assert chunk_count > 0
+    # 1. 論文のインデックス化（indexed_paperで実施済み）
+    assert indexed_paper.chunk_count > 0
     
     # 2. 検索実行
     question = "What is the main contribution of this paper?"
-    results = await rag_service.query(
+    results = await indexed_paper.rag_service.query(
         question=question,
         arxiv_ids=[arxiv_id],
         top_k=3
@@ -461,8 +445,7 @@ async def test_rag_pipeline_full_flow_with_answer_generation(
 
 @pytest.mark.asyncio
 async def test_rag_pipeline_basic_rag_query(
-    paper_service,
-    rag_service,
+    indexed_paper,
     embedding_service,
     mock_llm_service
 ):
@@ -470,25 +453,14 @@ async def test_rag_pipeline_basic_rag_query(
     
     Requirements: 2.4, 2.5
     """
-    arxiv_id = "0704.0001"
-    
-    # インデックス化
-    pdf_path = await paper_service.download_pdf(arxiv_id)
-    text = await paper_service.extract_text(pdf_path)
-    metadata = await paper_service.get_metadata(arxiv_id)
-    
-    await rag_service.index_paper(
-        arxiv_id=arxiv_id,
-        text=text,
-        metadata=metadata
-    )
+    arxiv_id = indexed_paper.arxiv_id
     
     # basic_rag_queryを実行
     question = "What is this paper about?"
     response = await basic_rag_query(
         question=question,
         arxiv_ids=[arxiv_id],
-        chroma_client=rag_service.chroma,
+        chroma_client=indexed_paper.rag_service.chroma,
         embedding_service=embedding_service,
         llm_service=mock_llm_service,
         top_k=3
@@ -511,14 +483,14 @@ async def test_rag_pipeline_basic_rag_query(
 @pytest.mark.asyncio
 async def test_rag_pipeline_persistence(
     temp_dirs,
-    paper_service,
+    shared_paper,
     embedding_service
 ):
     """Chromaの永続化テスト
     
     Requirements: 2.2, 2.3
     """
-    arxiv_id = "0704.0001"
+    arxiv_id = shared_paper.arxiv_id
     
     # 最初のChromaクライアントでインデックス化
     config1 = ChromaConfig(
@@ -534,15 +506,11 @@ async def test_rag_pipeline_persistence(
         embedding_service=embedding_service
     )
     
-    # インデックス化
-    pdf_path = await paper_service.download_pdf(arxiv_id)
-    text = await paper_service.extract_text(pdf_path)
-    metadata = await paper_service.get_metadata(arxiv_id)
-    
+    # インデックス化（取得・抽出済みのテキストを使用）
     chunk_count = await rag_service1.index_paper(
         arxiv_id=arxiv_id,
-        text=text,
-        metadata=metadata
+        text=shared_paper.text,
+        metadata=shared_paper.metadata
     )
     assert chunk_count > 0
     
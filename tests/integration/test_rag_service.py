@@ -2,9 +2,6 @@
 
 import pytest
 import pytest_asyncio
-from pathlib import Path
-import tempfile
-import shutil
 from datetime import datetime
 
 from src.services.rag_service import RAGService
@@ -14,19 +11,19 @@ from src.models.config import ChromaConfig, EmbeddingConfig
 from src.models.paper import PaperMetadata
 
 
-@pytest.fixture
-def temp_chroma_dir():
-    """一時的なChromaディレクトリを作成"""
-    temp_dir = Path(tempfile.mkdtemp())
-    yield temp_dir
-    # クリーンアップ
-    if temp_dir.exists():
-        shutil.rmtree(temp_dir)
+@pytest.fixture(scope="module")
+def temp_chroma_dir(tmp_path_factory):
+    """モジュール内で共有する一時Chromaディレクトリを作成"""
+    return tmp_path_factory.mktemp("rag_service_chroma")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def chroma_client(temp_chroma_dir):
-    """テスト用ChromaClientを作成"""
+    """モジュール内で共有するChromaClientを作成
+
+    クライアントの初期化はモジュールで1回だけ行い、
+    テストごとの分離はreset_collectionでコレクションを作り直して行います。
+    """
     config = ChromaConfig(
         persist_dir=temp_chroma_dir,
         collection_name="test_rag_collection",
@@ -37,6 +34,12 @@ def chroma_client(temp_chroma_dir):
     return client
 
 
+@pytest.fixture(autouse=True)
+def reset_collection(chroma_client):
+    """各テストの前にコレクションを空にする"""
+    chroma_client.reset()
+
+
 @pytest_asyncio.fixture
 async def embedding_service(mock_embedding_service):
     """テスト用EmbeddingServiceを作成（モック使用）"""
@@ -189,15 +192,17 @@ async def test_query_with_arxiv_filter(rag_service, sample_paper_metadata, sampl
         metadata=other_metadata
     )
     
-    # 特定の論文IDでフィルタリング
-    results = await rag_service.query(
-        question="What is machine learning?",
-        arxiv_ids=["2301.00001"],
-        top_k=5
-    )
-    
-    # 指定した論文のチャンクのみが返されることを確認
-    assert all(r.metadata["arxiv_id"] == "2301.00001" for r in results)
+    # 特定の論文IDでフィルタリングし、指定した論文のチャンクのみが返されることを確認
+    results = [
+        result async for result in rag_service.query_stream(
+            question="What is machine learning?",
+            arxiv_ids=["2301.00001"],
+            top_k=5
+        )
+    ]
+    assert len(results) > 0
+    for result in results:
+        assert result.metadata["arxiv_id"] == "2301.00001"
 
 
 def test_split_by_imrad(rag_service, sample_paper_text):
@@ -215,6 +220,7 @@ def test_split_by_imrad(rag_service, sample_paper_text):
 def test_chunk_text(rag_service):
     """テキストチャンク化のテスト"""
     text = "This is sentence one. This is sentence two. This is sentence three. " * 10
+    text_len = len(text)
     
     chunks = rag_service._chunk_text(text, chunk_size=100)
     
@@ -225,9 +231,10 @@ def test_chunk_text(rag_service):
     for chunk in chunks[:-1]:
         assert len(chunk) <= 100 or " " not in chunk  # 単一の長い単語の場合は例外
     
-    # すべてのチャンクを結合すると元のテキストに近いことを確認
-    combined = " ".join(chunks)
-    assert len(combined) >= len(text) * 0.9  # 多少の空白の違いは許容
+    # すべてのチャンクを" "で結合した長さが元のテキストに近いことを確認
+    # （結合文字列を作らず、チャンク長の合計と区切り文字数から計算）
+    combined_len = sum(len(chunk) for chunk in chunks) + len(chunks) - 1
+    assert combined_len >= text_len * 0.9  # 多少の空白の違いは許容
 
 
 def test_chunk_text_empty(rag_service):
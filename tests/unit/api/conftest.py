@@ -0,0 +1,72 @@
+"""APIユニットテスト共通フィクスチャ
+
+Requirements: 9.1, 9.2, 9.3, 9.5
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock, create_autospec
+
+import pytest
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+
+from src.api.main import app
+from src.services.paper_service import PaperService
+
+
+@pytest.fixture(scope="session")
+def client():
+    """TestClientフィクスチャ
+
+    FastAPIのTestClientを提供します。
+    各テストは依存するグローバルサービスをパッチするため、
+    クライアント自体はセッション全体で共有します。
+    """
+    return TestClient(app)
+
+
+@pytest.fixture
+async def async_client():
+    """AsyncClientフィクスチャ
+
+    ASGITransportでアプリを直接呼び出すAsyncClientを提供します。
+    TestClientと異なりリクエストごとのスレッド（ポータル）を経由せず、
+    テストのイベントループ上でハンドラーを実行します。
+    pytest-asyncioはテストごとにイベントループを作成するため、関数スコープのままとします。
+    """
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.fixture
+def paper_service_mock(monkeypatch):
+    """src.api.main.paper_serviceをPaperServiceのautospecモックに差し替える
+
+    非同期メソッドはAsyncMockになり、呼び出し時に引数がシグネチャと照合されます。
+    テスト側ではreturn_value / side_effectを設定するだけで使用できます。
+    呼び出し履歴がテスト間で共有されないよう、テストごとに作成します。
+
+    Returns:
+        PaperServiceのautospecモック
+    """
+    mock_service = create_autospec(PaperService, instance=True)
+    monkeypatch.setattr("src.api.main.paper_service", mock_service)
+    return mock_service
+
+
+@pytest.fixture
+def mocked_services(monkeypatch, paper_service_mock):
+    """src.api.mainのグローバルサービスをまとめてモックに差し替える
+
+    embedding_service / llm_serviceはエンドポイントから他のモック
+    （RAGService、basic_rag_query）へ渡されるだけのため、属性を持たないMockで足ります。
+    paper_serviceにはpaper_service_mockを使用します。
+
+    Returns:
+        SimpleNamespace: embed / llm / paperの各モック
+    """
+    embed = Mock()
+    llm = Mock()
+    monkeypatch.setattr("src.api.main.embedding_service", embed)
+    monkeypatch.setattr("src.api.main.llm_service", llm)
+    return SimpleNamespace(embed=embed, llm=llm, paper=paper_service_mock)
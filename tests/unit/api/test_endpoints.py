@@ -12,66 +12,54 @@ Requirements: 9.1, 9.2, 9.3, 9.5
 
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
-from fastapi.testclient import TestClient
-from httpx import AsyncClient
 
-from src.api.main import app
 from src.models.paper import PaperMetadata
 from src.models.rag import RAGResponse, SearchResult
-from src.utils.errors import APIError, LLMError
+from src.utils.errors import APIError, LLMError, PapersmithError
 
 # ===== Fixtures =====
-
-@pytest.fixture
-def client():
-    """TestClientフィクスチャ
-
-    FastAPIのTestClientを提供します。
-    """
-    return TestClient(app)
+# client / async_client は tests/unit/api/conftest.py で定義
 
 
 @pytest.fixture
-async def async_client():
-    """AsyncClientフィクスチャ
+def index_holder(request, monkeypatch):
+    """index_holderモック
 
-    非同期テスト用のAsyncClientを提供します。
+    デフォルトは準備完了状態です。未準備状態が必要なテストでは
+    @pytest.mark.parametrize("index_holder", [False], indirect=True) を指定します。
     """
-    async with AsyncClient(app=app, base_url="http://test") as ac:
-        yield ac
+    ready = getattr(request, "param", True)
 
+    mock_holder = Mock()
+    monkeypatch.setattr("src.api.main.index_holder", mock_holder)
 
-@pytest.fixture
-def mock_index_holder_ready():
-    """準備完了状態のindex_holderモック"""
-    with patch("src.api.main.index_holder") as mock_holder:
-        mock_chroma = MagicMock()
+    mock_holder.is_ready.return_value = ready
+    if ready:
+        # エンドポイントが使用するcount / resetのみを持つスタブ
+        mock_chroma = Mock(spec_set=["count", "reset"])
         mock_chroma.count.return_value = 100
 
-        mock_holder.is_ready.return_value = True
         mock_holder.size.return_value = 100
         mock_holder.get = AsyncMock(return_value=mock_chroma)
-
-        yield mock_holder
-
-
-@pytest.fixture
-def mock_index_holder_not_ready():
-    """未準備状態のindex_holderモック"""
-    with patch("src.api.main.index_holder") as mock_holder:
-        mock_holder.is_ready.return_value = False
+    else:
         mock_holder.size.return_value = 0
-        mock_holder.get = AsyncMock(side_effect=RuntimeError("Index not ready"))
+        # InMemoryIndexHolder.get()と同じメッセージ
+        mock_holder.get = AsyncMock(
+            side_effect=RuntimeError("Index not ready. Please wait for initialization to complete.")
+        )
 
-        yield mock_holder
+    return mock_holder
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_papers():
-    """サンプル論文リスト"""
+    """サンプル論文リスト
+
+    テストでは読み取りのみのため、セッション全体で共有します。
+    """
     return [
         PaperMetadata(
             arxiv_id="2301.00001",
@@ -96,9 +84,12 @@ def sample_papers():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_rag_response():
-    """サンプルRAGレスポンス"""
+    """サンプルRAGレスポンス
+
+    テストでは読み取りのみのため、セッション全体で共有します。
+    """
     return RAGResponse(
         answer="これはテスト回答です。",
         sources=[
@@ -115,7 +106,7 @@ def sample_rag_response():
 
 # ===== GET /health Tests =====
 
-def test_health_check_ready(client, mock_index_holder_ready):
+def test_health_check_ready(client, index_holder):
     """GET /health - インデックス準備完了時のテスト
 
     Requirements: 9.2
@@ -130,7 +121,8 @@ def test_health_check_ready(client, mock_index_holder_ready):
     assert data["index_size"] == 100
 
 
-def test_health_check_not_ready(client, mock_index_holder_not_ready):
+@pytest.mark.parametrize("index_holder", [False], indirect=True)
+def test_health_check_not_ready(client, index_holder):
     """GET /health - インデックス未準備時のテスト
 
     Requirements: 9.2
@@ -147,411 +139,346 @@ def test_health_check_not_ready(client, mock_index_holder_not_ready):
 
 # ===== POST /papers/search Tests =====
 
-def test_search_papers_success(client, sample_papers):
+@pytest.mark.asyncio
+async def test_search_papers_success(async_client, sample_papers, paper_service_mock):
     """POST /papers/search - 正常な検索のテスト
 
     Requirements: 9.3
     """
-    with patch("src.api.main.paper_service") as mock_service:
-        mock_service.search_papers = AsyncMock(return_value=sample_papers)
+    paper_service_mock.search_papers.return_value = sample_papers
 
-        response = client.post(
-            "/papers/search",
-            json={"query": "machine learning", "max_results": 10}
-        )
+    response = await async_client.post(
+        "/papers/search",
+        json={"query": "machine learning", "max_results": 10}
+    )
 
-        assert response.status_code == 200
-        data = response.json()
+    assert response.status_code == 200
+    data = response.json()
 
-        assert data["count"] == 2
-        assert len(data["papers"]) == 2
-        assert data["papers"][0]["arxiv_id"] == "2301.00001"
-        assert data["papers"][1]["arxiv_id"] == "2301.00002"
+    assert data["count"] == 2
+    assert len(data["papers"]) == 2
+    assert data["papers"][0]["arxiv_id"] == "2301.00001"
+    assert data["papers"][1]["arxiv_id"] == "2301.00002"
 
-        # サービスが正しく呼ばれたか確認
-        mock_service.search_papers.assert_called_once_with(
-            query="machine learning",
-            max_results=10
-        )
+    # サービスが正しく呼ばれたか確認
+    paper_service_mock.search_papers.assert_called_once_with(
+        query="machine learning",
+        max_results=10
+    )
 
 
-def test_search_papers_with_custom_max_results(client, sample_papers):
+@pytest.mark.asyncio
+async def test_search_papers_with_custom_max_results(async_client, sample_papers, paper_service_mock):
     """POST /papers/search - max_resultsカスタマイズのテスト
 
     Requirements: 9.3
     """
-    with patch("src.api.main.paper_service") as mock_service:
-        mock_service.search_papers = AsyncMock(return_value=sample_papers[:1])
-
-        response = client.post(
-            "/papers/search",
-            json={"query": "deep learning", "max_results": 1}
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-
-        assert data["count"] == 1
-        assert len(data["papers"]) == 1
-
+    paper_service_mock.search_papers.return_value = sample_papers[:1]
 
-def test_search_papers_service_not_initialized(client):
-    """POST /papers/search - サービス未初期化時のテスト
+    response = await async_client.post(
+        "/papers/search",
+        json={"query": "deep learning", "max_results": 1}
+    )
 
-    Requirements: 9.5
-    """
-    with patch("src.api.main.paper_service", None):
-        response = client.post(
-            "/papers/search",
-            json={"query": "test", "max_results": 10}
-        )
+    assert response.status_code == 200
+    data = response.json()
 
-        assert response.status_code == 503
-        assert "not initialized" in response.json()["detail"]
+    assert data["count"] == 1
+    assert len(data["papers"]) == 1
 
 
-def test_search_papers_service_error(client):
+def test_search_papers_service_error(client, paper_service_mock):
     """POST /papers/search - サービスエラー時のテスト
 
     Requirements: 9.5
     """
-    with patch("src.api.main.paper_service") as mock_service:
-        mock_service.search_papers = AsyncMock(
-            side_effect=Exception("API connection failed")
-        )
+    paper_service_mock.search_papers.side_effect = Exception("API connection failed")
 
-        response = client.post(
-            "/papers/search",
-            json={"query": "test", "max_results": 10}
-        )
+    response = client.post(
+        "/papers/search",
+        json={"query": "test", "max_results": 10}
+    )
 
-        assert response.status_code == 500
-        assert "論文検索に失敗しました" in response.json()["detail"]
+    assert response.status_code == 500
+    assert "論文検索に失敗しました" in response.json()["detail"]
 
 
-def test_search_papers_invalid_max_results(client):
+@pytest.mark.parametrize("max_results", [0, 101])
+def test_search_papers_invalid_max_results(client, max_results):
     """POST /papers/search - 無効なmax_resultsのテスト
 
+    max_results が範囲外（0以下、100超）の場合はバリデーションエラー
+
     Requirements: 9.5
     """
-    # max_results が範囲外（0以下）
-    response = client.post(
-        "/papers/search",
-        json={"query": "test", "max_results": 0}
-    )
-    assert response.status_code == 422  # Validation error
-
-    # max_results が範囲外（100超）
     response = client.post(
         "/papers/search",
-        json={"query": "test", "max_results": 101}
+        json={"query": "test", "max_results": max_results}
     )
     assert response.status_code == 422  # Validation error
 
 
 # ===== POST /papers/download Tests =====
 
-def test_download_paper_success(client, mock_index_holder_ready, sample_papers):
+@pytest.mark.asyncio
+async def test_download_paper_success(async_client, mocked_services, index_holder, sample_papers, monkeypatch):
     """POST /papers/download - 正常なダウンロードのテスト
 
     Requirements: 9.3
     """
-    with patch("src.api.main.paper_service") as mock_paper_service, \
-         patch("src.api.main.embedding_service") as mock_embed_service, \
-         patch("src.services.rag_service.RAGService") as mock_rag_service_class:
-
-        # PaperServiceのモック
-        mock_paper_service.get_metadata = AsyncMock(return_value=sample_papers[0])
-        mock_paper_service.download_pdf = AsyncMock(
-            return_value=Path("./cache/pdfs/2301.00001.pdf")
-        )
-        mock_paper_service.extract_text = AsyncMock(
-            return_value="Sample paper text"
-        )
-
-        # RAGServiceのモック
-        mock_rag_instance = MagicMock()
-        mock_rag_instance.index_paper = AsyncMock(return_value=10)
-        mock_rag_service_class.return_value = mock_rag_instance
-
-        response = client.post(
-            "/papers/download",
-            json={"arxiv_id": "2301.00001"}
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-
-        assert data["status"] == "success"
-        assert data["arxiv_id"] == "2301.00001"
-        assert data["indexed_chunks"] == 10
-        assert "正常にダウンロード" in data["message"]
-
-        # サービスが正しく呼ばれたか確認
-        mock_paper_service.get_metadata.assert_called_once_with("2301.00001")
-        mock_paper_service.download_pdf.assert_called_once()
-        mock_paper_service.extract_text.assert_called_once()
-        mock_rag_instance.index_paper.assert_called_once()
-
+    mock_rag_service_class = MagicMock()
+    monkeypatch.setattr("src.services.rag_service.RAGService", mock_rag_service_class)
+
+    # PaperServiceのモック
+    mocked_services.paper.get_metadata.return_value = sample_papers[0]
+    mocked_services.paper.download_pdf.return_value = Path("./cache/pdfs/2301.00001.pdf")
+    mocked_services.paper.extract_text.return_value = "Sample paper text"
+
+    # RAGServiceのモック
+    mock_rag_instance = Mock(spec_set=["index_paper"])
+    mock_rag_instance.index_paper = AsyncMock(return_value=10)
+    mock_rag_service_class.return_value = mock_rag_instance
+
+    response = await async_client.post(
+        "/papers/download",
+        json={"arxiv_id": "2301.00001"}
+    )
 
-def test_download_paper_services_not_initialized(client):
-    """POST /papers/download - サービス未初期化時のテスト
+    assert response.status_code == 200
+    data = response.json()
 
-    Requirements: 9.5
-    """
-    with patch("src.api.main.paper_service", None):
-        response = client.post(
-            "/papers/download",
-            json={"arxiv_id": "2301.00001"}
-        )
+    assert data["status"] == "success"
+    assert data["arxiv_id"] == "2301.00001"
+    assert data["indexed_chunks"] == 10
+    assert "正常にダウンロード" in data["message"]
 
-        assert response.status_code == 503
-        assert "not initialized" in response.json()["detail"]
+    # サービスが正しく呼ばれたか確認
+    mocked_services.paper.get_metadata.assert_called_once_with("2301.00001")
+    mocked_services.paper.download_pdf.assert_called_once()
+    mocked_services.paper.extract_text.assert_called_once()
+    mock_rag_instance.index_paper.assert_called_once()
 
 
-def test_download_paper_index_not_ready(client, mock_index_holder_not_ready):
+@pytest.mark.parametrize("index_holder", [False], indirect=True)
+def test_download_paper_index_not_ready(client, mocked_services, index_holder):
     """POST /papers/download - インデックス未準備時のテスト
 
     Requirements: 9.2, 9.5
     """
-    with patch("src.api.main.paper_service") as mock_service, \
-         patch("src.api.main.embedding_service"):
-
-        mock_service.get_metadata = AsyncMock(return_value=MagicMock())
+    mocked_services.paper.get_metadata.return_value = Mock()
 
-        response = client.post(
-            "/papers/download",
-            json={"arxiv_id": "2301.00001"}
-        )
+    response = client.post(
+        "/papers/download",
+        json={"arxiv_id": "2301.00001"}
+    )
 
-        # index_holder.get()がRuntimeErrorを投げるので503エラー
-        assert response.status_code == 503
+    # index_holder.get()がRuntimeErrorを投げるので503エラー
+    assert response.status_code == 503
 
 
-def test_download_paper_download_error(client, mock_index_holder_ready, sample_papers):
+def test_download_paper_download_error(client, mocked_services, index_holder, sample_papers):
     """POST /papers/download - ダウンロードエラー時のテスト
 
     Requirements: 9.5
     """
-    with patch("src.api.main.paper_service") as mock_service, \
-         patch("src.api.main.embedding_service"):
-
-        mock_service.get_metadata = AsyncMock(return_value=sample_papers[0])
-        mock_service.download_pdf = AsyncMock(
-            side_effect=Exception("Download failed")
-        )
+    mocked_services.paper.get_metadata.return_value = sample_papers[0]
+    mocked_services.paper.download_pdf.side_effect = Exception("Download failed")
 
-        response = client.post(
-            "/papers/download",
-            json={"arxiv_id": "2301.00001"}
-        )
+    response = client.post(
+        "/papers/download",
+        json={"arxiv_id": "2301.00001"}
+    )
 
-        assert response.status_code == 500
-        assert "ダウンロードとインデックス化に失敗" in response.json()["detail"]
+    assert response.status_code == 500
+    assert "ダウンロードとインデックス化に失敗" in response.json()["detail"]
 
 
 # ===== POST /rag/query Tests =====
 
-def test_rag_query_success(client, mock_index_holder_ready, sample_rag_response):
+@pytest.mark.asyncio
+async def test_rag_query_success(async_client, mocked_services, index_holder, sample_rag_response, monkeypatch):
     """POST /rag/query - 正常なRAGクエリのテスト
 
     Requirements: 9.3
     """
-    with patch("src.api.main.embedding_service") as mock_embed, \
-         patch("src.api.main.llm_service") as mock_llm, \
-         patch("src.api.main.basic_rag_query", new_callable=AsyncMock) as mock_rag_query:
-
-        mock_rag_query.return_value = sample_rag_response
-
-        response = client.post(
-            "/rag/query",
-            json={
-                "question": "What is machine learning?",
-                "arxiv_ids": ["2301.00001"],
-                "top_k": 5
-            }
-        )
+    mock_rag_query = AsyncMock()
+    monkeypatch.setattr("src.api.main.basic_rag_query", mock_rag_query)
+
+    mock_rag_query.return_value = sample_rag_response
+
+    response = await async_client.post(
+        "/rag/query",
+        json={
+            "question": "What is machine learning?",
+            "arxiv_ids": ["2301.00001"],
+            "top_k": 5
+        }
+    )
 
-        assert response.status_code == 200
-        data = response.json()
+    assert response.status_code == 200
+    data = response.json()
 
-        assert data["answer"] == "これはテスト回答です。"
-        assert len(data["sources"]) == 1
-        assert data["sources"][0]["chunk_id"] == "2301.00001_intro_0"
+    assert data["answer"] == "これはテスト回答です。"
+    assert len(data["sources"]) == 1
+    assert data["sources"][0]["chunk_id"] == "2301.00001_intro_0"
 
-        # basic_rag_queryが正しく呼ばれたか確認
-        mock_rag_query.assert_called_once()
-        call_kwargs = mock_rag_query.call_args[1]
-        assert call_kwargs["question"] == "What is machine learning?"
-        assert call_kwargs["arxiv_ids"] == ["2301.00001"]
-        assert call_kwargs["top_k"] == 5
+    # basic_rag_queryが正しく呼ばれたか確認
+    mock_rag_query.assert_called_once()
+    call_kwargs = mock_rag_query.call_args[1]
+    assert call_kwargs["question"] == "What is machine learning?"
+    assert call_kwargs["arxiv_ids"] == ["2301.00001"]
+    assert call_kwargs["top_k"] == 5
 
 
-def test_rag_query_without_arxiv_ids(client, mock_index_holder_ready, sample_rag_response):
+@pytest.mark.asyncio
+async def test_rag_query_without_arxiv_ids(async_client, mocked_services, index_holder, sample_rag_response, monkeypatch):
     """POST /rag/query - arxiv_idsなしのテスト
 
     Requirements: 9.3
     """
-    with patch("src.api.main.embedding_service"), \
-         patch("src.api.main.llm_service"), \
-         patch("src.api.main.basic_rag_query", new_callable=AsyncMock) as mock_rag_query:
-
-        mock_rag_query.return_value = sample_rag_response
-
-        response = client.post(
-            "/rag/query",
-            json={"question": "What is deep learning?"}
-        )
-
-        assert response.status_code == 200
+    mock_rag_query = AsyncMock()
+    monkeypatch.setattr("src.api.main.basic_rag_query", mock_rag_query)
 
-        # arxiv_idsがNoneで呼ばれることを確認
-        call_kwargs = mock_rag_query.call_args[1]
-        assert call_kwargs["arxiv_ids"] is None
+    mock_rag_query.return_value = sample_rag_response
 
+    response = await async_client.post(
+        "/rag/query",
+        json={"question": "What is deep learning?"}
+    )
 
-def test_rag_query_services_not_initialized(client):
-    """POST /rag/query - サービス未初期化時のテスト
-
-    Requirements: 9.5
-    """
-    with patch("src.api.main.embedding_service", None):
-        response = client.post(
-            "/rag/query",
-            json={"question": "test"}
-        )
+    assert response.status_code == 200
 
-        assert response.status_code == 503
-        assert "not initialized" in response.json()["detail"]
+    # arxiv_idsがNoneで呼ばれることを確認
+    call_kwargs = mock_rag_query.call_args[1]
+    assert call_kwargs["arxiv_ids"] is None
 
 
-def test_rag_query_index_not_ready(client, mock_index_holder_not_ready):
+@pytest.mark.parametrize("index_holder", [False], indirect=True)
+def test_rag_query_index_not_ready(client, mocked_services, index_holder):
     """POST /rag/query - インデックス未準備時のテスト
 
     Requirements: 9.2, 9.5
     """
-    with patch("src.api.main.embedding_service"), \
-         patch("src.api.main.llm_service"):
-
-        response = client.post(
-            "/rag/query",
-            json={"question": "test"}
-        )
+    response = client.post(
+        "/rag/query",
+        json={"question": "test"}
+    )
 
-        assert response.status_code == 503
+    assert response.status_code == 503
 
 
-def test_rag_query_execution_error(client, mock_index_holder_ready):
+def test_rag_query_execution_error(client, mocked_services, index_holder, monkeypatch):
     """POST /rag/query - クエリ実行エラー時のテスト
 
     Requirements: 9.5
     """
-    with patch("src.api.main.embedding_service"), \
-         patch("src.api.main.llm_service"), \
-         patch("src.api.main.basic_rag_query", new_callable=AsyncMock) as mock_rag_query:
+    mock_rag_query = AsyncMock()
+    monkeypatch.setattr("src.api.main.basic_rag_query", mock_rag_query)
 
-        mock_rag_query.side_effect = Exception("Query execution failed")
+    mock_rag_query.side_effect = Exception("Query execution failed")
 
-        response = client.post(
-            "/rag/query",
-            json={"question": "test"}
-        )
+    response = client.post(
+        "/rag/query",
+        json={"question": "test"}
+    )
 
-        assert response.status_code == 500
-        assert "RAGクエリの実行に失敗" in response.json()["detail"]
+    assert response.status_code == 500
+    assert "RAGクエリの実行に失敗" in response.json()["detail"]
 
 
-def test_rag_query_invalid_top_k(client):
+@pytest.mark.parametrize("top_k", [0, 21])
+def test_rag_query_invalid_top_k(client, top_k):
     """POST /rag/query - 無効なtop_kのテスト
 
+    top_k が範囲外（0以下、20超）の場合はバリデーションエラー
+
     Requirements: 9.5
     """
-    # top_k が範囲外（0以下）
     response = client.post(
         "/rag/query",
-        json={"question": "test", "top_k": 0}
-    )
-    assert response.status_code == 422  # Validation error
-
-    # top_k が範囲外（20超）
-    response = client.post(
-        "/rag/query",
-        json={"question": "test", "top_k": 21}
+        json={"question": "test", "top_k": top_k}
     )
     assert response.status_code == 422  # Validation error
 
 
 # ===== Error Handler Tests =====
 
-def test_index_not_ready_error_handler(client):
+@pytest.mark.parametrize("index_holder", [False], indirect=True)
+def test_index_not_ready_error_handler(client, mocked_services, index_holder):
     """IndexNotReadyErrorハンドラーのテスト
 
     Requirements: 9.2, 9.5
     """
-    with patch("src.api.main.index_holder") as mock_holder:
-        mock_holder.is_ready.return_value = False
-        mock_holder.get = AsyncMock(
-            side_effect=RuntimeError("Index not ready. Please wait for initialization to complete.")
-        )
-
-        with patch("src.api.main.embedding_service"), \
-             patch("src.api.main.llm_service"):
-
-            response = client.post(
-                "/rag/query",
-                json={"question": "test"}
-            )
+    response = client.post(
+        "/rag/query",
+        json={"question": "test"}
+    )
 
-            assert response.status_code == 503
-            data = response.json()
-            assert "インデックス構築中" in data["detail"]
-            assert data["status"] == "initializing"
+    assert response.status_code == 503
+    data = response.json()
+    assert "インデックス構築中" in data["detail"]
+    assert data["status"] == "initializing"
 
 
-def test_api_error_handler(client):
+def test_api_error_handler(client, paper_service_mock):
     """APIErrorハンドラーのテスト
 
     Requirements: 9.5
     """
-    with patch("src.api.main.paper_service") as mock_service:
-        mock_service.search_papers = AsyncMock(
-            side_effect=APIError(
-                message="arXiv API error",
-                api_name="arXiv",
-                status_code=500
-            )
-        )
+    paper_service_mock.search_papers.side_effect = APIError(
+        message="arXiv API error",
+        api_name="arXiv",
+        status_code=500
+    )
 
-        response = client.post(
-            "/papers/search",
-            json={"query": "test", "max_results": 10}
-        )
+    response = client.post(
+        "/papers/search",
+        json={"query": "test", "max_results": 10}
+    )
 
-        # APIErrorは内部で500エラーになる
-        assert response.status_code == 500
+    # APIErrorは内部で500エラーになる
+    assert response.status_code == 500
 
 
-def test_llm_error_handler(client, mock_index_holder_ready):
+def test_llm_error_handler(client, mocked_services, index_holder, monkeypatch):
     """LLMErrorハンドラーのテスト
 
     Requirements: 9.5
     """
-    with patch("src.api.main.embedding_service"), \
-         patch("src.api.main.llm_service"), \
-         patch("src.api.main.basic_rag_query", new_callable=AsyncMock) as mock_rag_query:
+    mock_rag_query = AsyncMock()
+    monkeypatch.setattr("src.api.main.basic_rag_query", mock_rag_query)
 
-        mock_rag_query.side_effect = LLMError(
-            message="LLM inference failed",
-            model_name="test-model"
-        )
+    mock_rag_query.side_effect = LLMError(
+        message="LLM inference failed",
+        model_name="test-model"
+    )
 
-        response = client.post(
-            "/rag/query",
-            json={"question": "test"}
-        )
+    response = client.post(
+        "/rag/query",
+        json={"question": "test"}
+    )
+
+    # LLMErrorは内部で500エラーになる
+    assert response.status_code == 500
 
-        # LLMErrorは内部で500エラーになる
-        assert response.status_code == 500
+
+@pytest.mark.parametrize("endpoint,payload,attr", [
+    ("/papers/search", {"query": "test", "max_results": 10}, "paper_service"),
+    ("/papers/download", {"arxiv_id": "2301.00001"}, "paper_service"),
+    ("/rag/query", {"question": "test"}, "embedding_service"),
+    ("/admin/init-index", {"force": False}, "paper_service"),
+])
+def test_service_unavailable_returns_503(client, monkeypatch, endpoint, payload, attr):
+    """サービス未初期化時に各エンドポイントが503を返すことのテスト
+
+    Requirements: 9.5
+    """
+    monkeypatch.setattr(f"src.api.main.{attr}", None)
+
+    response = client.post(endpoint, json=payload)
+
+    assert response.status_code == 503
+    assert "not initialized" in response.json()["detail"]
 
 
 # ===== Root Endpoint Test =====
@@ -574,226 +501,177 @@ def test_root_endpoint(client):
 
 # ===== Additional Error Handler Tests =====
 
-def test_papersmith_error_handler(client):
+def test_papersmith_error_handler(client, paper_service_mock):
     """PapersmithErrorハンドラーのテスト
 
     Requirements: 9.5
     """
-    from src.utils.errors import PapersmithError
-
-    with patch("src.api.main.paper_service") as mock_service:
-        mock_service.search_papers = AsyncMock(
-            side_effect=PapersmithError(
-                message="Generic Papersmith error",
-                details={"error_code": "TEST_ERROR"}
-            )
-        )
+    paper_service_mock.search_papers.side_effect = PapersmithError(
+        message="Generic Papersmith error",
+        details={"error_code": "TEST_ERROR"}
+    )
 
-        response = client.post(
-            "/papers/search",
-            json={"query": "test", "max_results": 10}
-        )
+    response = client.post(
+        "/papers/search",
+        json={"query": "test", "max_results": 10}
+    )
 
-        # PapersmithErrorは内部で500エラーになる
-        assert response.status_code == 500
+    # PapersmithErrorは内部で500エラーになる
+    assert response.status_code == 500
 
 
-def test_general_exception_handler(client):
+def test_general_exception_handler(client, paper_service_mock):
     """一般的な例外ハンドラーのテスト
 
     Requirements: 9.5
     """
-    with patch("src.api.main.paper_service") as mock_service:
-        # 予期しない例外をスロー
-        mock_service.search_papers = AsyncMock(
-            side_effect=ValueError("Unexpected error")
-        )
+    # 予期しない例外をスロー
+    paper_service_mock.search_papers.side_effect = ValueError("Unexpected error")
 
-        response = client.post(
-            "/papers/search",
-            json={"query": "test", "max_results": 10}
-        )
+    response = client.post(
+        "/papers/search",
+        json={"query": "test", "max_results": 10}
+    )
 
-        assert response.status_code == 500
-        # エンドポイント内でキャッチされてカスタムメッセージになる
-        assert "論文検索に失敗しました" in response.json()["detail"]
+    assert response.status_code == 500
+    # エンドポイント内でキャッチされてカスタムメッセージになる
+    assert "論文検索に失敗しました" in response.json()["detail"]
 
 
 # ===== POST /admin/init-index Tests =====
 
-def test_init_index_success(client, mock_index_holder_ready, sample_papers):
+def test_init_index_success(client, mocked_services, index_holder, sample_papers, monkeypatch, tmp_path):
     """POST /admin/init-index - 正常なインデックス初期化のテスト
 
     Requirements: 9.3
     """
-    with patch("src.api.main.paper_service") as mock_paper_service, \
-         patch("src.api.main.embedding_service"), \
-         patch("src.services.rag_service.RAGService") as mock_rag_service_class, \
-         patch("pathlib.Path.exists") as mock_exists, \
-         patch("pathlib.Path.glob") as mock_glob:
-
-        # PDFキャッシュディレクトリが存在する
-        mock_exists.return_value = True
-
-        # 2つのPDFファイルが存在する
-        mock_pdf1 = MagicMock()
-        mock_pdf1.stem = "2301_00001"
-        mock_pdf2 = MagicMock()
-        mock_pdf2.stem = "2301_00002"
-        mock_glob.return_value = [mock_pdf1, mock_pdf2]
-
-        # PaperServiceのモック
-        mock_paper_service.get_metadata = AsyncMock(return_value=sample_papers[0])
-        mock_paper_service.extract_text = AsyncMock(return_value="Sample text")
-
-        # RAGServiceのモック
-        mock_rag_instance = MagicMock()
-        mock_rag_instance.index_paper = AsyncMock(return_value=5)
-        mock_rag_service_class.return_value = mock_rag_instance
-
-        response = client.post(
-            "/admin/init-index",
-            json={"force": False}
-        )
+    mock_rag_service_class = MagicMock()
+    monkeypatch.setattr("src.services.rag_service.RAGService", mock_rag_service_class)
+    monkeypatch.setattr("src.api.main.pdf_cache_dir", tmp_path)
 
-        assert response.status_code == 200
-        data = response.json()
+    # 2つのPDFファイルが存在する
+    tmp_path.joinpath("2301_00001.pdf").touch()
+    tmp_path.joinpath("2301_00002.pdf").touch()
 
-        assert data["status"] == "success"
-        assert data["indexed_count"] == 10  # 2 PDFs × 5 chunks each
+    # PaperServiceのモック
+    mocked_services.paper.get_metadata.return_value = sample_papers[0]
+    mocked_services.paper.extract_text.return_value = "Sample text"
 
+    # RAGServiceのモック
+    mock_rag_instance = Mock(spec_set=["index_paper"])
+    mock_rag_instance.index_paper = AsyncMock(return_value=5)
+    mock_rag_service_class.return_value = mock_rag_instance
+
+    response = client.post(
+        "/admin/init-index",
+        json={"force": False}
+    )
 
-def test_init_index_no_cache_directory(client, mock_index_holder_ready):
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["status"] == "success"
+    assert data["indexed_count"] == 10  # 2 PDFs × 5 chunks each
+
+
+def test_init_index_no_cache_directory(client, mocked_services, index_holder, monkeypatch, tmp_path):
     """POST /admin/init-index - キャッシュディレクトリなしのテスト
 
     Requirements: 9.3
     """
-    with patch("src.api.main.paper_service"), \
-         patch("src.api.main.embedding_service"), \
-         patch("pathlib.Path.exists") as mock_exists:
-
-        # PDFキャッシュディレクトリが存在しない
-        mock_exists.return_value = False
+    # PDFキャッシュディレクトリが存在しない
+    monkeypatch.setattr("src.api.main.pdf_cache_dir", tmp_path / "missing")
 
-        response = client.post(
-            "/admin/init-index",
-            json={"force": False}
-        )
+    response = client.post(
+        "/admin/init-index",
+        json={"force": False}
+    )
 
-        assert response.status_code == 200
-        data = response.json()
+    assert response.status_code == 200
+    data = response.json()
 
-        assert data["status"] == "success"
-        assert data["indexed_count"] == 0
-        assert "存在しません" in data["message"]
+    assert data["status"] == "success"
+    assert data["indexed_count"] == 0
+    assert "存在しません" in data["message"]
 
 
-def test_init_index_force_reset(client, mock_index_holder_ready):
+def test_init_index_force_reset(client, mocked_services, index_holder, monkeypatch, tmp_path):
     """POST /admin/init-index - 強制リセットのテスト
 
     Requirements: 9.3
     """
-    with patch("src.api.main.paper_service"), \
-         patch("src.api.main.embedding_service"), \
-         patch("pathlib.Path.exists") as mock_exists:
+    monkeypatch.setattr("src.api.main.pdf_cache_dir", tmp_path / "missing")
 
-        mock_exists.return_value = False
+    # Chromaクライアントのresetメソッドが呼ばれることを確認
+    mock_chroma = index_holder.get.return_value
 
-        # Chromaクライアントのresetメソッドが呼ばれることを確認
-        mock_chroma = mock_index_holder_ready.get.return_value
-        mock_chroma.reset = MagicMock()
-
-        response = client.post(
-            "/admin/init-index",
-            json={"force": True}
-        )
+    response = client.post(
+        "/admin/init-index",
+        json={"force": True}
+    )
 
-        assert response.status_code == 200
-        mock_chroma.reset.assert_called_once()
+    assert response.status_code == 200
+    mock_chroma.reset.assert_called_once()
 
 
-def test_init_index_services_not_initialized(client):
-    """POST /admin/init-index - サービス未初期化時のテスト
+def test_init_index_error(client, mocked_services, index_holder, monkeypatch):
+    """POST /admin/init-index - 初期化エラー時のテスト
 
     Requirements: 9.5
     """
-    with patch("src.api.main.paper_service", None):
-        response = client.post(
-            "/admin/init-index",
-            json={"force": False}
-        )
+    # キャッシュディレクトリの参照自体が失敗する
+    broken_cache_dir = Mock(spec=Path)
+    broken_cache_dir.exists.side_effect = Exception("Filesystem error")
+    monkeypatch.setattr("src.api.main.pdf_cache_dir", broken_cache_dir)
 
-        assert response.status_code == 503
-        assert "not initialized" in response.json()["detail"]
+    response = client.post(
+        "/admin/init-index",
+        json={"force": False}
+    )
 
+    assert response.status_code == 500
+    assert "インデックスの初期化に失敗" in response.json()["detail"]
 
-def test_init_index_error(client, mock_index_holder_ready):
-    """POST /admin/init-index - 初期化エラー時のテスト
 
-    Requirements: 9.5
+def test_init_index_partial_failure(client, mocked_services, index_holder, sample_papers, monkeypatch, tmp_path):
+    """POST /admin/init-index - 一部のPDFが失敗する場合のテスト
+
+    Requirements: 9.3, 9.5
     """
-    with patch("src.api.main.paper_service"), \
-         patch("src.api.main.embedding_service"), \
-         patch("pathlib.Path.exists") as mock_exists:
+    mock_rag_service_class = MagicMock()
+    monkeypatch.setattr("src.services.rag_service.RAGService", mock_rag_service_class)
+    monkeypatch.setattr("src.api.main.pdf_cache_dir", tmp_path)
 
-        mock_exists.side_effect = Exception("Filesystem error")
+    # 2つのPDFファイルが存在する
+    tmp_path.joinpath("2301_00001.pdf").touch()
+    tmp_path.joinpath("2301_00002.pdf").touch()
 
-        response = client.post(
-            "/admin/init-index",
-            json={"force": False}
-        )
+    # 最初のPDFは成功、2番目は失敗
+    call_count = [0]
 
-        assert response.status_code == 500
-        assert "インデックスの初期化に失敗" in response.json()["detail"]
+    async def mock_get_metadata_side_effect(arxiv_id):
+        call_count[0] += 1
+        if call_count[0] == 1:
+            return sample_papers[0]
+        else:
+            raise Exception("Metadata fetch failed")
 
+    mocked_services.paper.get_metadata.side_effect = mock_get_metadata_side_effect
+    mocked_services.paper.extract_text.return_value = "Sample text"
 
-def test_init_index_partial_failure(client, mock_index_holder_ready, sample_papers):
-    """POST /admin/init-index - 一部のPDFが失敗する場合のテスト
+    # RAGServiceのモック
+    mock_rag_instance = Mock(spec_set=["index_paper"])
+    mock_rag_instance.index_paper = AsyncMock(return_value=5)
+    mock_rag_service_class.return_value = mock_rag_instance
 
-    Requirements: 9.3, 9.5
-    """
-    with patch("src.api.main.paper_service") as mock_paper_service, \
-         patch("src.api.main.embedding_service"), \
-         patch("src.services.rag_service.RAGService") as mock_rag_service_class, \
-         patch("pathlib.Path.exists") as mock_exists, \
-         patch("pathlib.Path.glob") as mock_glob:
-
-        # PDFキャッシュディレクトリが存在する
-        mock_exists.return_value = True
-
-        # 2つのPDFファイルが存在する
-        mock_pdf1 = MagicMock()
-        mock_pdf1.stem = "2301_00001"
-        mock_pdf2 = MagicMock()
-        mock_pdf2.stem = "2301_00002"
-        mock_glob.return_value = [mock_pdf1, mock_pdf2]
-
-        # 最初のPDFは成功、2番目は失敗
-        call_count = [0]
-
-        async def mock_get_metadata_side_effect(arxiv_id):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return sample_papers[0]
-            else:
-                raise Exception("Metadata fetch failed")
-
-        mock_paper_service.get_metadata = mock_get_metadata_side_effect
-        mock_paper_service.extract_text = AsyncMock(return_value="Sample text")
-
-        # RAGServiceのモック
-        mock_rag_instance = MagicMock()
-        mock_rag_instance.index_paper = AsyncMock(return_value=5)
-        mock_rag_service_class.return_value = mock_rag_instance
-
-        response = client.post(
-            "/admin/init-index",
-            json={"force": False}
-        )
+    response = client.post(
+        "/admin/init-index",
+        json={"force": False}
+    )
 
-        # 一部失敗しても成功を返す（エラーはログに記録される）
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "success"
-        # 1つのPDFのみ成功
-        assert data["indexed_count"] == 5
+    # 一部失敗しても成功を返す（エラーはログに記録される）
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "success"
+    # 1つのPDFのみ成功
+    assert data["indexed_count"] == 5
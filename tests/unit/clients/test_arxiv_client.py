@@ -3,7 +3,9 @@
 Requirements: 1.1, 1.4
 """
 
+import asyncio
 from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock, patch
 
 import arxiv
@@ -24,26 +26,60 @@ def arxiv_client(tmp_path):
     )
 
 
-@pytest.fixture
+def _make_arxiv_result(**overrides):
+    """arxiv.Result相当のスタブを生成
+
+    ArxivClientは属性を読むだけのため、Mockではなく軽量なSimpleNamespaceを使用します。
+    属性を書き換えるテストは共有フィクスチャではなく、これで個別に生成します。
+    """
+    attrs = {
+        "entry_id": "http://arxiv.org/abs/2301.00001v1",
+        "title": "Test Paper Title",
+        # 著者はモックではなく実際のarxiv.Result.Authorを使用
+        "authors": [arxiv.Result.Author("Author One"), arxiv.Result.Author("Author Two")],
+        "summary": "This is a test abstract.",
+        "published": datetime(2023, 1, 1),
+        "categories": ["cs.AI", "cs.LG"],
+        "pdf_url": "https://arxiv.org/pdf/2301.00001.pdf",
+        "doi": "10.1234/test.doi",
+    }
+    attrs.update(overrides)
+    return SimpleNamespace(**attrs)
+
+
+# 複数結果のテストで共有する読み取り専用のarxiv.Resultスタブ
+ARXIV_RESULT_PROTOTYPES = (
+    _make_arxiv_result(),
+    _make_arxiv_result(
+        entry_id="http://arxiv.org/abs/2301.00002v1",
+        title="Paper 2",
+        authors=[arxiv.Result.Author("Author Three")],
+        summary="Abstract 2",
+        published=datetime(2023, 1, 2),
+        categories=["cs.AI"],
+        pdf_url="https://arxiv.org/pdf/2301.00002.pdf",
+        doi=None,
+    ),
+    _make_arxiv_result(
+        entry_id="http://arxiv.org/abs/2301.00003v1",
+        title="Paper 3",
+        authors=[arxiv.Result.Author("Author Four")],
+        summary="Abstract 3",
+        published=datetime(2023, 1, 3),
+        categories=["cs.LG"],
+        pdf_url="https://arxiv.org/pdf/2301.00003.pdf",
+        doi=None,
+    ),
+)
+
+
+@pytest.fixture(scope="session")
 def mock_arxiv_result():
-    """モックarxiv.Result"""
-    result = Mock(spec=arxiv.Result)
-    result.entry_id = "http://arxiv.org/abs/2301.00001v1"
-    result.title = "Test Paper Title"
-
-    # 著者モック（.name属性を持つ）
-    author1 = Mock()
-    author1.name = "Author One"
-    author2 = Mock()
-    author2.name = "Author Two"
-    result.authors = [author1, author2]
-
-    result.summary = "This is a test abstract."
-    result.published = datetime(2023, 1, 1)
-    result.categories = ["cs.AI", "cs.LG"]
-    result.pdf_url = "https://arxiv.org/pdf/2301.00001.pdf"
-    result.doi = "10.1234/test.doi"
-    return result
+    """モックarxiv.Result
+
+    読み取り専用のため、セッション全体で共有します。
+    """
+    return ARXIV_RESULT_PROTOTYPES[0]
 
 
 # ========================================
@@ -99,36 +135,10 @@ async def test_search_papers_empty_results(arxiv_client):
 
 
 @pytest.mark.asyncio
-async def test_search_papers_multiple_results(arxiv_client, mock_arxiv_result):
+async def test_search_papers_multiple_results(arxiv_client):
     """複数の論文を検索"""
-    # 3つの結果を作成
-    result1 = mock_arxiv_result
-    result2 = Mock(spec=arxiv.Result)
-    result2.entry_id = "http://arxiv.org/abs/2301.00002v1"
-    result2.title = "Paper 2"
-    author3 = Mock()
-    author3.name = "Author Three"
-    result2.authors = [author3]
-    result2.summary = "Abstract 2"
-    result2.published = datetime(2023, 1, 2)
-    result2.categories = ["cs.AI"]
-    result2.pdf_url = "https://arxiv.org/pdf/2301.00002.pdf"
-    result2.doi = None
-
-    result3 = Mock(spec=arxiv.Result)
-    result3.entry_id = "http://arxiv.org/abs/2301.00003v1"
-    result3.title = "Paper 3"
-    author4 = Mock()
-    author4.name = "Author Four"
-    result3.authors = [author4]
-    result3.summary = "Abstract 3"
-    result3.published = datetime(2023, 1, 3)
-    result3.categories = ["cs.LG"]
-    result3.pdf_url = "https://arxiv.org/pdf/2301.00003.pdf"
-    result3.doi = None
-
     # モックの設定
-    with patch.object(arxiv_client.client, 'results', return_value=[result1, result2, result3]):
+    with patch.object(arxiv_client.client, 'results', return_value=list(ARXIV_RESULT_PROTOTYPES)):
         # 実行
         results = await arxiv_client.search_papers("test", max_results=3)
 
@@ -260,6 +270,57 @@ async def test_download_pdf_cached(arxiv_client, tmp_path):
     assert pdf_path.read_bytes() == b"Cached PDF content"
 
 
+@pytest.mark.asyncio
+async def test_download_pdf_reuses_http_client(arxiv_client):
+    """複数PDFのダウンロードで同じHTTPクライアント（接続プール）を再利用する"""
+    requested: list[str] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        return httpx.Response(200, content=b"PDF content")
+
+    real_async_client = httpx.AsyncClient
+    with patch(
+        'httpx.AsyncClient',
+        side_effect=lambda **kwargs: real_async_client(transport=httpx.MockTransport(handle), **kwargs)
+    ) as mock_client_class:
+        # 実行
+        await arxiv_client.download_pdf("2301.00001")
+        await arxiv_client.download_pdf("2301.00002")
+
+        # 検証（クライアントは1回だけ作成される）
+        assert mock_client_class.call_count == 1
+        assert len(requested) == 2
+
+        http_client = arxiv_client._http_client
+        await arxiv_client.aclose()
+        assert http_client.is_closed
+        assert arxiv_client._http_client is None
+
+
+def test_download_pdf_closes_stale_http_client_on_loop_change(arxiv_client):
+    """別のイベントループから呼ばれた場合は古いHTTPクライアントを閉じて作り直す"""
+    def handle(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b"PDF content")
+
+    real_async_client = httpx.AsyncClient
+    with patch(
+        'httpx.AsyncClient',
+        side_effect=lambda **kwargs: real_async_client(transport=httpx.MockTransport(handle), **kwargs)
+    ) as mock_client_class:
+        # 実行（ループを分けて2回ダウンロード）
+        asyncio.run(arxiv_client.download_pdf("2301.00001"))
+        stale_client = arxiv_client._http_client
+        asyncio.run(arxiv_client.download_pdf("2301.00002"))
+
+        # 検証（古いクライアントは閉じられ、新しいクライアントが作成される）
+        assert mock_client_class.call_count == 2
+        assert stale_client.is_closed
+        assert arxiv_client._http_client is not stale_client
+
+        asyncio.run(arxiv_client.aclose())
+
+
 @pytest.mark.asyncio
 async def test_download_pdf_http_error(arxiv_client):
     """PDFダウンロードでHTTPエラーが発生"""
@@ -314,36 +375,37 @@ def test_convert_to_metadata(arxiv_client, mock_arxiv_result):
     assert metadata.published_date == datetime(2023, 1, 1)
 
 
-def test_convert_to_metadata_without_doi(arxiv_client, mock_arxiv_result):
+def test_convert_to_metadata_without_doi(arxiv_client):
     """DOIがない場合"""
     # DOIを削除
-    delattr(mock_arxiv_result, 'doi')
+    result = _make_arxiv_result()
+    delattr(result, 'doi')
 
     # 実行
-    metadata = arxiv_client._convert_to_metadata(mock_arxiv_result)
+    metadata = arxiv_client._convert_to_metadata(result)
 
     # 検証
     assert metadata.doi is None
 
 
-def test_convert_to_metadata_normalizes_arxiv_id(arxiv_client, mock_arxiv_result):
+def test_convert_to_metadata_normalizes_arxiv_id(arxiv_client):
     """arXiv IDを正規化（バージョン番号を除去）"""
     # バージョン番号付きのID
-    mock_arxiv_result.entry_id = "http://arxiv.org/abs/2301.00001v3"
+    result = _make_arxiv_result(entry_id="http://arxiv.org/abs/2301.00001v3")
 
     # 実行
-    metadata = arxiv_client._convert_to_metadata(mock_arxiv_result)
+    metadata = arxiv_client._convert_to_metadata(result)
 
     # 検証
     assert metadata.arxiv_id == "2301.00001"
 
 
-def test_convert_to_metadata_extracts_year(arxiv_client, mock_arxiv_result):
+def test_convert_to_metadata_extracts_year(arxiv_client):
     """発行年を抽出"""
-    mock_arxiv_result.published = datetime(2024, 6, 15)
+    result = _make_arxiv_result(published=datetime(2024, 6, 15))
 
     # 実行
-    metadata = arxiv_client._convert_to_metadata(mock_arxiv_result)
+    metadata = arxiv_client._convert_to_metadata(result)
 
     # 検証
     assert metadata.year == 2024
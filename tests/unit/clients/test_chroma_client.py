@@ -94,6 +94,25 @@ def test_initialize_idempotent(chroma_client):
     assert chroma_client.count() == initial_count
 
 
+def test_initialize_ephemeral_skips_persist_dir(tmp_path, sample_embedding, sample_metadata):
+    """ephemeral=Trueの場合はディスクに永続化しない"""
+    config = ChromaConfig(
+        collection_name="test_ephemeral_collection",
+        persist_dir=tmp_path / "chroma_ephemeral",
+        ephemeral=True
+    )
+    client = ChromaClient(config=config)
+
+    # 実行
+    client.initialize()
+    client.reset()
+    client.add(embedding=sample_embedding, text="Test", metadata=sample_metadata)
+
+    # 検証
+    assert client.count() == 1
+    assert not config.persist_dir.exists()
+
+
 # ========================================
 # add() tests
 # ========================================
@@ -204,6 +223,168 @@ def test_add_processes_list_metadata(chroma_client, sample_embedding):
     assert "Author One, Author Two" in results[0].metadata["authors"]
 
 
+# ========================================
+# add_batch() tests
+# ========================================
+
+def test_add_batch_documents(chroma_client, sample_embedding, sample_metadata):
+    """複数ドキュメントを一括追加"""
+    chroma_client.initialize()
+
+    chunk_ids = [f"chunk_{i}" for i in range(5)]
+    metadatas = [{**sample_metadata, "chunk_id": cid} for cid in chunk_ids]
+
+    # 実行
+    chroma_client.add_batch(
+        embeddings=[sample_embedding] * 5,
+        texts=[f"Text {i}" for i in range(5)],
+        metadatas=metadatas,
+        chunk_ids=chunk_ids
+    )
+
+    # 検証
+    assert chroma_client.count() == 5
+
+
+def test_add_batch_splits_by_batch_size(tmp_path, sample_embedding, sample_metadata, mocker):
+    """config.batch_sizeごとにcollection.addが呼ばれる"""
+    config = ChromaConfig(
+        collection_name="test_collection",
+        persist_dir=tmp_path / "chroma_batch",
+        batch_size=2
+    )
+    client = ChromaClient(config=config)
+    client.initialize()
+    client.collection = mocker.MagicMock()
+
+    chunk_ids = [f"chunk_{i}" for i in range(5)]
+
+    # 実行
+    client.add_batch(
+        embeddings=[sample_embedding] * 5,
+        texts=["Text"] * 5,
+        metadatas=[{**sample_metadata, "chunk_id": cid} for cid in chunk_ids],
+        chunk_ids=chunk_ids
+    )
+
+    # 検証（2 + 2 + 1）
+    batch_ids = [c.kwargs["ids"] for c in client.collection.add.call_args_list]
+    assert batch_ids == [chunk_ids[0:2], chunk_ids[2:4], chunk_ids[4:5]]
+
+
+def test_add_batch_defer_commit(tmp_path, sample_embedding, sample_metadata):
+    """defer_commit=Trueの場合は読み取り時にまとめて書き込む"""
+    config = ChromaConfig(
+        collection_name="test_defer_collection",
+        persist_dir=tmp_path / "chroma_defer",
+        defer_commit=True
+    )
+    client = ChromaClient(config=config)
+    client.initialize()
+
+    # 2回に分けて追加（論文2本分を想定）
+    for paper in range(2):
+        client.add_batch(
+            embeddings=[sample_embedding] * 3,
+            texts=[f"Paper {paper} chunk {i}" for i in range(3)],
+            metadatas=[sample_metadata] * 3,
+            chunk_ids=[f"paper{paper}_chunk_{i}" for i in range(3)]
+        )
+
+    # まだ書き込まれていない
+    assert client.collection.count() == 0
+
+    # count()で保留分が書き込まれる
+    assert client.count() == 6
+    assert client.flush() == 0
+
+
+def test_add_batch_defer_commit_skips_pending_duplicates(tmp_path, sample_embedding, sample_metadata):
+    """defer_commit=Trueの場合、保留中のIDと重複するドキュメントは無視する"""
+    config = ChromaConfig(
+        collection_name="test_defer_collection",
+        persist_dir=tmp_path / "chroma_defer",
+        defer_commit=True
+    )
+    client = ChromaClient(config=config)
+    client.initialize()
+
+    for chunk_ids in (["id1", "id2"], ["id1"]):
+        client.add_batch(
+            embeddings=[sample_embedding] * len(chunk_ids),
+            texts=[f"Text {chunk_id}" for chunk_id in chunk_ids],
+            metadatas=[sample_metadata] * len(chunk_ids),
+            chunk_ids=chunk_ids
+        )
+
+    # 最初に追加したものが残る
+    assert client.count() == 2
+    assert client.collection.get(ids=["id1"])["documents"] == ["Text id1"]
+
+
+def test_flush_failure_keeps_pending(tmp_path, sample_embedding, sample_metadata, mocker):
+    """書き込みに失敗した場合は保留中のドキュメントを破棄しない"""
+    config = ChromaConfig(
+        collection_name="test_defer_collection",
+        persist_dir=tmp_path / "chroma_defer",
+        defer_commit=True
+    )
+    client = ChromaClient(config=config)
+    client.initialize()
+    client.add_batch(
+        embeddings=[sample_embedding] * 2,
+        texts=["Text 1", "Text 2"],
+        metadatas=[sample_metadata] * 2,
+        chunk_ids=["id1", "id2"]
+    )
+
+    mocker.patch.object(client, "_write_batches", side_effect=RuntimeError("write failed"))
+    with pytest.raises(RuntimeError, match="write failed"):
+        client.flush()
+
+    # 保留分は残っており、再試行で書き込まれる
+    mocker.stopall()
+    assert client.flush() == 2
+    assert client.count() == 2
+
+
+def test_add_batch_duplicate_ids_raises_error(chroma_client, sample_embedding, sample_metadata):
+    """同じバッチ内でchunk_idが重複する場合はエラー"""
+    chroma_client.initialize()
+
+    with pytest.raises(ValueError, match="unique"):
+        chroma_client.add_batch(
+            embeddings=[sample_embedding] * 2,
+            texts=["Text 1", "Text 2"],
+            metadatas=[sample_metadata] * 2,
+            chunk_ids=["chunk_0", "chunk_0"]
+        )
+
+
+def test_add_batch_length_mismatch_raises_error(chroma_client, sample_embedding, sample_metadata):
+    """リスト長が一致しない場合はエラー"""
+    chroma_client.initialize()
+
+    with pytest.raises(ValueError, match="same length"):
+        chroma_client.add_batch(
+            embeddings=[sample_embedding],
+            texts=["Text 1", "Text 2"],
+            metadatas=[sample_metadata],
+            chunk_ids=["chunk_0"]
+        )
+
+
+def test_add_batch_without_initialize_raises_error(chroma_client, sample_embedding, sample_metadata):
+    """initialize()前にadd_batch()を呼ぶとエラー"""
+    with pytest.raises(RuntimeError, match="Chroma not initialized"):
+        chroma_client.add_batch(
+            embeddings=[sample_embedding],
+            texts=["Test"],
+            metadatas=[sample_metadata],
+            chunk_ids=["chunk_0"]
+        )
+
+
 # ========================================
 # search() tests
 # ========================================
@@ -232,6 +413,24 @@ def test_search_returns_results(chroma_client, sample_embedding, sample_metadata
     assert results[0].score > 0.9  # 同じembeddingなのでスコアは高い
 
 
+def test_search_accepts_ndarray_query(chroma_client, sample_embedding, sample_metadata):
+    """ndarrayのクエリEmbeddingで検索できる"""
+    import numpy as np
+
+    chroma_client.initialize()
+    chroma_client.add(embedding=sample_embedding, text="Test document", metadata=sample_metadata)
+
+    # 実行
+    results = chroma_client.search(
+        query_embedding=np.asarray(sample_embedding, dtype=np.float32),
+        top_k=1
+    )
+
+    # 検証
+    assert len(results) == 1
+    assert results[0].text == "Test document"
+
+
 def test_search_with_arxiv_ids_filter(chroma_client, sample_embedding):
     """arxiv_idsでフィルタリング"""
     chroma_client.initialize()
@@ -291,6 +490,42 @@ def test_search_with_multiple_arxiv_ids(chroma_client, sample_embedding):
     assert "2301.00001" not in arxiv_ids
 
 
+def test_search_converts_distances_to_scores(chroma_client, sample_embedding, mocker):
+    """距離はscore = 1 - distanceに変換され、Noneの場合は0.0になる"""
+    chroma_client.initialize()
+    chroma_client.collection = mocker.MagicMock()
+    chroma_client.collection.query.return_value = {
+        "ids": [["chunk_0", "chunk_1"]],
+        "documents": [["Text 0", "Text 1"]],
+        "distances": [[0.25, None]],
+        "metadatas": [[{"arxiv_id": "2301.00001"}, {"arxiv_id": "2301.00002"}]]
+    }
+
+    # 実行
+    results = chroma_client.search(query_embedding=sample_embedding, top_k=2)
+
+    # 検証
+    assert [r.chunk_id for r in results] == ["chunk_0", "chunk_1"]
+    assert [r.score for r in results] == [0.75, 0.0]
+    assert results[1].metadata == {"arxiv_id": "2301.00002"}
+
+
+def test_iter_search_yields_results_lazily(chroma_client, sample_embedding, sample_metadata):
+    """iter_search()はSearchResultを1件ずつ返すイテレータを返す"""
+    chroma_client.initialize()
+    chroma_client.add(embedding=sample_embedding, text="Test document", metadata=sample_metadata)
+
+    # 実行
+    results = chroma_client.iter_search(query_embedding=sample_embedding, top_k=1)
+
+    # 検証
+    assert not isinstance(results, list)
+    result = next(results)
+    assert isinstance(result, SearchResult)
+    assert result.text == "Test document"
+    assert next(results, None) is None
+
+
 def test_search_empty_collection(chroma_client, sample_embedding):
     """空のコレクションで検索"""
     chroma_client.initialize()
@@ -400,6 +635,32 @@ def test_reset_without_initialize_raises_error(chroma_client):
         chroma_client.reset()
 
 
+# ========================================
+# create_collection() tests
+# ========================================
+
+def test_create_collection_shares_client(chroma_client, sample_embedding, sample_metadata):
+    """create_collection()はクライアントを共有する独立したコレクションを返す"""
+    chroma_client.initialize()
+
+    # 実行
+    handle = chroma_client.create_collection("other_collection")
+    handle.add(sample_embedding, "Test", sample_metadata)
+
+    # 検証
+    assert handle.client is chroma_client.client
+    assert handle.config.collection_name == "other_collection"
+    assert handle.count() == 1
+    assert chroma_client.count() == 0
+
+
+def test_create_collection_without_initialize_raises_error(chroma_client):
+    """initialize()前にcreate_collection()を呼ぶとエラー"""
+    # 実行と検証
+    with pytest.raises(RuntimeError, match="Chroma not initialized"):
+        chroma_client.create_collection("other_collection")
+
+
 # ========================================
 # _process_metadata() tests
 # ========================================
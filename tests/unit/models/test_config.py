@@ -23,6 +23,9 @@ def test_chroma_config_defaults():
     assert config.persist_dir == Path("./data/chroma")
     assert config.collection_name == "papersmith_papers"
     assert config.distance_metric == "cosine"
+    assert config.batch_size == 250
+    assert config.ephemeral is False
+    assert config.defer_commit is False
 
 
 def test_chroma_config_custom_values():
@@ -425,6 +425,8 @@ async def test_embed_batch_local_backend():
     assert results[0] == [0.1, 0.2]
     assert results[1] == [0.3, 0.4]
     mock_model.encode.assert_called_once()
+    assert mock_model.encode.call_args.args[0] == ["text1", "text2"]
+    assert mock_model.encode.call_args.kwargs["batch_size"] == 2
 
 
 @pytest.mark.asyncio
@@ -4,10 +4,12 @@ Requirements: 1.1, 1.4, 1.5
 """
 
 import json
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from pypdf import PdfWriter
 
 from src.clients.arxiv_client import ArxivClient, ArxivClientError
 from src.models.paper import PaperMetadata
@@ -376,6 +378,106 @@ async def test_extract_text_page_extraction_error(paper_service, tmp_path):
         assert "Page 2 text." not in text
 
 
+@pytest.mark.asyncio
+async def test_extract_text_uses_cache(paper_service, mock_arxiv_client, tmp_path):
+    """抽出済みテキストはディスクのキャッシュから返される"""
+    pdf_path = tmp_path / "test.pdf"
+    pdf_path.write_text("")
+
+    with patch('src.services.paper_service.PdfReader') as mock_pdf_reader:
+        mock_page = Mock()
+        mock_page.extract_text.return_value = "Cached text."
+        mock_pdf_reader.return_value = Mock(pages=[mock_page])
+
+        # 実行（1回目は抽出、2回目はディスクキャッシュ）
+        first = await paper_service.extract_text(pdf_path)
+        second = await paper_service.extract_text(pdf_path)
+
+        # 別インスタンスでもディスクキャッシュから読み込まれる
+        other_service = PaperService(
+            arxiv_client=mock_arxiv_client,
+            cache_dir=paper_service.cache_dir
+        )
+        third = await other_service.extract_text(pdf_path)
+
+        # 検証
+        assert first == second == third == "Cached text."
+        assert mock_pdf_reader.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_extract_text_cache_invalidated_on_pdf_change(paper_service, tmp_path):
+    """PDFが更新された場合は再抽出する"""
+    pdf_path = tmp_path / "test.pdf"
+    pdf_path.write_text("")
+
+    with patch('src.services.paper_service.PdfReader') as mock_pdf_reader:
+        mock_page = Mock()
+        mock_page.extract_text.side_effect = ["Old text.", "New text."]
+        mock_pdf_reader.return_value = Mock(pages=[mock_page])
+
+        # 実行
+        old_text = await paper_service.extract_text(pdf_path)
+        pdf_path.write_text("updated")
+        new_text = await paper_service.extract_text(pdf_path)
+
+        # 検証
+        assert old_text == "Old text."
+        assert new_text == "New text."
+        assert mock_pdf_reader.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_extract_text_ignores_invalid_cache_entry(paper_service, tmp_path):
+    """キャッシュのtextが文字列でない場合はキャッシュミスとして再抽出する"""
+    pdf_path = tmp_path / "test.pdf"
+    pdf_path.write_text("")
+
+    with patch('src.services.paper_service.PdfReader') as mock_pdf_reader:
+        mock_page = Mock()
+        mock_page.extract_text.side_effect = ["Original text.", "Re-extracted text."]
+        mock_pdf_reader.return_value = Mock(pages=[mock_page])
+
+        await paper_service.extract_text(pdf_path)
+
+        # キャッシュファイルのtextを不正な値に書き換える
+        cache_path = paper_service._text_cache_path(pdf_path)
+        data = json.loads(cache_path.read_text(encoding='utf-8'))
+        data["text"] = ["not", "a", "string"]
+        cache_path.write_text(json.dumps(data), encoding='utf-8')
+
+        # 実行
+        text = await paper_service.extract_text(pdf_path)
+
+        # 検証
+        assert text == "Re-extracted text."
+        assert mock_pdf_reader.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_extract_text_with_process_pool(mock_arxiv_client, tmp_path):
+    """pdf_executorにProcessPoolExecutorを渡すと別プロセスで抽出される"""
+    pdf_path = tmp_path / "blank.pdf"
+    writer = PdfWriter()
+    writer.add_blank_page(width=72, height=72)
+    with open(pdf_path, "wb") as f:
+        writer.write(f)
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        service = PaperService(
+            arxiv_client=mock_arxiv_client,
+            cache_dir=tmp_path / "cache",
+            pdf_executor=executor
+        )
+
+        # 実行
+        text = await service.extract_text(pdf_path)
+
+    # 検証（空白ページのためテキストは空）
+    assert text == ""
+    assert service.pdf_executor is executor
+
+
 @pytest.mark.asyncio
 async def test_extract_text_file_not_found(paper_service, tmp_path):
     """存在しないPDFファイルでエラー"""
@@ -420,3 +522,5 @@ def test_paper_service_initialization(mock_arxiv_client, tmp_path):
     assert service.metadata_cache_dir.exists()
     assert service.pdf_cache_dir == cache_dir / "pdfs"
     assert service.metadata_cache_dir == cache_dir / "metadata"
+    assert service.text_cache_dir.exists()
+    assert service.text_cache_dir == cache_dir / "text"
@@ -6,6 +6,7 @@ Requirements: 2.1, 2.2, 2.3, 2.4
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock
 
+import numpy as np
 import pytest
 
 from src.clients.chroma_client import ChromaClient
@@ -21,6 +22,7 @@ def mock_chroma_client():
     """モックChromaClient"""
     client = Mock(spec=ChromaClient)
     client.add = Mock()
+    client.add_batch = Mock()
     client.search = Mock(return_value=[])
     return client
 
@@ -146,6 +148,25 @@ def test_split_by_imrad_no_sections(rag_service):
     assert sections["full_text"] == text
 
 
+def test_imrad_section_slices_cover_text(rag_service):
+    """セクション境界は元テキストへの連続したスライスとして返される"""
+    text = """
+    Introduction
+    This is the introduction.
+
+    Methods
+    This is the methods section.
+    """
+
+    sections = rag_service._imrad_section_slices(text)
+
+    # 出現順に並び、隣接スライスが隙間なく末尾まで続くことを確認
+    assert [name for name, _ in sections] == ["introduction", "methods"]
+    assert sections[0][1].stop == sections[1][1].start
+    assert sections[1][1].stop == len(text)
+    assert text[sections[1][1]].strip().startswith("Methods")
+
+
 def test_split_by_imrad_japanese_sections(rag_service):
     """日本語のセクション見出しを検出"""
     text = """
@@ -305,7 +326,7 @@ This paper discusses testing.
     # 検証
     assert chunk_count > 0
     assert mock_embedding_service.embed_batch.called
-    assert mock_chroma_client.add.called
+    assert mock_chroma_client.add_batch.called
 
 
 @pytest.mark.asyncio
@@ -325,11 +346,11 @@ This is a test paper about machine learning.
     )
 
     # Chromaに追加された際のメタデータを確認
-    assert mock_chroma_client.add.called
+    assert mock_chroma_client.add_batch.called
 
-    # 最初の呼び出しの引数を取得
-    call_args = mock_chroma_client.add.call_args
-    metadata = call_args[1]["metadata"]
+    # 最初のチャンクのメタデータを取得
+    call_args = mock_chroma_client.add_batch.call_args
+    metadata = call_args[1]["metadatas"][0]
 
     # 必須メタデータが含まれることを確認
     assert "arxiv_id" in metadata
@@ -373,8 +394,9 @@ This is the results section. It presents the findings.
     # 複数のチャンクが作成されることを確認
     assert chunk_count > 1
 
-    # 複数回Chromaに追加されることを確認
-    assert mock_chroma_client.add.call_count > 1
+    # 全チャンクが1回の一括追加で渡されることを確認
+    assert mock_chroma_client.add_batch.call_count == 1
+    assert len(mock_chroma_client.add_batch.call_args[1]["chunk_ids"]) == chunk_count
 
 
 @pytest.mark.asyncio
@@ -392,7 +414,7 @@ async def test_index_paper_empty_text(rag_service, sample_paper_metadata, mock_c
 
     # チャンクが作成されないことを確認
     assert chunk_count == 0
-    assert not mock_chroma_client.add.called
+    assert not mock_chroma_client.add_batch.called
 
 
 @pytest.mark.asyncio
@@ -412,8 +434,8 @@ This is a test paper.
     )
 
     # chunk_idのフォーマットを確認
-    call_args = mock_chroma_client.add.call_args
-    chunk_id = call_args[1]["chunk_id"]
+    call_args = mock_chroma_client.add_batch.call_args
+    chunk_id = call_args[1]["chunk_ids"][0]
 
     # フォーマット: {arxiv_id}_{section}_{index}
     assert chunk_id.startswith("2301.00001_")
@@ -451,6 +473,49 @@ This is the methods.
     assert len(texts) > 0
 
 
+@pytest.mark.asyncio
+async def test_index_papers_single_batch(rag_service, sample_paper_metadata, mock_chroma_client, mock_embedding_service):
+    """複数論文のチャンクが1回のEmbedding生成・Chroma追加で保存されることを確認 (Requirement 2.2)"""
+    text = """
+Abstract
+This is the abstract.
+
+Introduction
+This is the introduction.
+"""
+    mock_embedding_service.embed_batch = AsyncMock(
+        side_effect=lambda texts: [[0.1] * 768 for _ in texts]
+    )
+
+    # 実行
+    counts = await rag_service.index_papers(
+        [
+            ("2301.00001", text, sample_paper_metadata),
+            ("2301.00002", text, sample_paper_metadata)
+        ],
+        chunk_size=50
+    )
+
+    # 論文ごとのチャンク数が返されることを確認
+    assert set(counts) == {"2301.00001", "2301.00002"}
+    assert counts["2301.00001"] == counts["2301.00002"] > 0
+
+    # Embedding生成とChroma追加はそれぞれ1回のみ
+    mock_embedding_service.embed_batch.assert_called_once()
+    mock_chroma_client.add_batch.assert_called_once()
+
+    # Chromaには(チャンク数, 次元)のC連続float32行列が渡される
+    embeddings = mock_chroma_client.add_batch.call_args.kwargs["embeddings"]
+    assert isinstance(embeddings, np.ndarray)
+    assert embeddings.dtype == np.float32
+    assert embeddings.flags["C_CONTIGUOUS"]
+    assert embeddings.shape == (sum(counts.values()), 768)
+
+    chunk_ids = mock_chroma_client.add_batch.call_args.kwargs["chunk_ids"]
+    assert len(chunk_ids) == sum(counts.values())
+    assert {chunk_id.split("_")[0] for chunk_id in chunk_ids} == {"2301.00001", "2301.00002"}
+
+
 # ========================================
 # 検索テスト (Requirement 2.4)
 # ========================================
@@ -481,6 +546,33 @@ async def test_query_basic(rag_service, mock_chroma_client, mock_embedding_servi
     assert mock_chroma_client.search.called
 
 
+@pytest.mark.asyncio
+async def test_query_stream_yields_results(rag_service, mock_chroma_client, mock_embedding_service):
+    """query_streamは検索結果を1件ずつ返す"""
+    mock_search_results = [
+        SearchResult(chunk_id=f"test_chunk_{i}", text=f"Result {i}", score=0.9 - i * 0.1, metadata={})
+        for i in range(2)
+    ]
+    mock_chroma_client.iter_search = Mock(return_value=iter(mock_search_results))
+
+    # 実行
+    results = [
+        result
+        async for result in rag_service.query_stream(
+            question="What is this paper about?",
+            arxiv_ids=["2301.00001"],
+            top_k=2
+        )
+    ]
+
+    # 検証
+    assert [r.chunk_id for r in results] == ["test_chunk_0", "test_chunk_1"]
+    assert mock_embedding_service.embed.called
+    call_args = mock_chroma_client.iter_search.call_args
+    assert call_args[1]["arxiv_ids"] == ["2301.00001"]
+    assert call_args[1]["top_k"] == 2
+
+
 @pytest.mark.asyncio
 async def test_query_with_arxiv_ids_filter(rag_service, mock_chroma_client, mock_embedding_service):
     """arxiv_idsフィルタリング付き検索"""